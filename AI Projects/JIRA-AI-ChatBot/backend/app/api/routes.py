@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Iterator
+from dataclasses import asdict
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy import or_
 from sqlalchemy.orm import Session, selectinload
+from starlette.concurrency import iterate_in_threadpool
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.dependencies import ServiceContainer, get_container
 from app.models.ticket import Ticket
 from app.schemas.chat import ChatRequest, ChatResponse
@@ -20,10 +26,26 @@ def health(db: Session = Depends(get_db), container: ServiceContainer = Depends(
         "status": "ok",
         "tickets": db.query(Ticket).count(),
         "indexed_chunks": len(container.vector_store.chunks),
+        "index_version": container.vector_store.index_version,
+        "index_generation": container.vector_store.generation,
+        "index_load": container.vector_store.load_stats,
+        "index_rebuild": asdict(progress) if (progress := container.vector_store.rebuild_progress) else None,
+        "chat_history": container.history.stats() if container.history is not None else None,
         "environment": container.settings.environment,
     }
 
 
+@router.get("/cache/stats")
+def cache_stats(container: ServiceContainer = Depends(get_container)) -> dict:
+    return container.cache.stats()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(container: ServiceContainer = Depends(get_container)) -> PlainTextResponse:
+    body = container.metrics.render(container.cache.stats(), indexed_chunks=len(container.vector_store.chunks))
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
 @router.post("/sync/mock")
 def sync_mock(db: Session = Depends(get_db), container: ServiceContainer = Depends(get_container)) -> dict:
     result = container.ingestion.sync_mock(db)
@@ -44,8 +66,21 @@ def sync_jira(
     db: Session = Depends(get_db),
     container: ServiceContainer = Depends(get_container),
 ) -> dict:
+    return _sync_jira(db, container, updated_since=updated_since, incremental=False)
+
+
+@router.post("/sync/jira/incremental")
+def sync_jira_incremental(
+    updated_since: str | None = Query(default=None, description='Optional Jira updated filter, e.g. "2026/06/15 00:00"'),
+    db: Session = Depends(get_db),
+    container: ServiceContainer = Depends(get_container),
+) -> dict:
+    return _sync_jira(db, container, updated_since=updated_since, incremental=True)
+
+
+def _sync_jira(db: Session, container: ServiceContainer, updated_since: str | None, incremental: bool) -> dict:
     try:
-        result = container.ingestion.sync_real_jira(db, updated_since=updated_since)
+        result = container.ingestion.sync_real_jira(db, updated_since=updated_since, incremental=incremental)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     indexed_chunks = container.vector_store.rebuild_tickets(db, result.changed_ticket_ids)
@@ -56,18 +91,10 @@ def sync_jira(
         "indexed_changed_chunks": indexed_chunks,
         "total_tickets": db.query(Ticket).count(),
         "total_indexed_chunks": len(container.vector_store.chunks),
+        "watermark": container.ingestion.watermark(db),
     }
 
 
-@router.post("/sync/jira/incremental")
-def sync_jira_incremental(
-    updated_since: str | None = Query(default=None, description='Optional Jira updated filter, e.g. "2026/06/15 00:00"'),
-    db: Session = Depends(get_db),
-    container: ServiceContainer = Depends(get_container),
-) -> dict:
-    return sync_jira(updated_since=updated_since, db=db, container=container)
-
-
 @router.post("/index/rebuild")
 def rebuild_index(db: Session = Depends(get_db), container: ServiceContainer = Depends(get_container)) -> dict:
     chunks = container.vector_store.rebuild(db)
@@ -81,6 +108,20 @@ def chat(request: ChatRequest, db: Session = Depends(get_db), container: Service
     return container.chat.chat(db, request.question, session_id=request.session_id, filters=request.filters)
 
 
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest, container: ServiceContainer = Depends(get_container)) -> StreamingResponse:
+    def events() -> Iterator[str]:
+        with SessionLocal() as db:
+            for event in container.chat.stream_chat(db, request.question, session_id=request.session_id, filters=request.filters):
+                yield f"event: {event.event}\ndata: {json.dumps(event.data, default=str)}\n\n"
+
+    return StreamingResponse(
+        iterate_in_threadpool(events()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/tickets/search", response_model=TicketListResponse)
 def search_tickets(
     q: str = Query("", description="Search text"),
@@ -121,31 +162,62 @@ def get_ticket(ticket_id: str, db: Session = Depends(get_db)) -> TicketResponse:
 
 
 @router.get("/analytics/blockers", response_model=TicketListResponse)
-def blockers(db: Session = Depends(get_db), container: ServiceContainer = Depends(get_container)) -> TicketListResponse:
-    tickets = container.analytics.blockers(db)
-    return TicketListResponse(tickets=[ticket_to_response(ticket) for ticket in tickets], total=len(tickets))
+def blockers(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    container: ServiceContainer = Depends(get_container),
+) -> TicketListResponse:
+    return _analytics_page(db, container, "blockers", limit, offset)
 
 
 @router.get("/analytics/high-priority", response_model=TicketListResponse)
-def high_priority(db: Session = Depends(get_db), container: ServiceContainer = Depends(get_container)) -> TicketListResponse:
-    tickets = container.analytics.high_priority(db)
-    return TicketListResponse(tickets=[ticket_to_response(ticket) for ticket in tickets], total=len(tickets))
+def high_priority(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    container: ServiceContainer = Depends(get_container),
+) -> TicketListResponse:
+    return _analytics_page(db, container, "high_priority", limit, offset)
 
 
 @router.get("/analytics/inactive", response_model=TicketListResponse)
 def inactive(
     days: int = Query(14, ge=1),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
     container: ServiceContainer = Depends(get_container),
 ) -> TicketListResponse:
-    tickets = container.analytics.inactive(db, days=days)
-    return TicketListResponse(tickets=[ticket_to_response(ticket) for ticket in tickets], total=len(tickets))
+    return _analytics_page(db, container, "inactive", limit, offset, days=days)
 
 
 @router.get("/analytics/missing-assignee", response_model=TicketListResponse)
-def missing_assignee(db: Session = Depends(get_db), container: ServiceContainer = Depends(get_container)) -> TicketListResponse:
-    tickets = container.analytics.missing_assignee(db)
-    return TicketListResponse(tickets=[ticket_to_response(ticket) for ticket in tickets], total=len(tickets))
+def missing_assignee(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    container: ServiceContainer = Depends(get_container),
+) -> TicketListResponse:
+    return _analytics_page(db, container, "missing_assignee", limit, offset)
+
+
+def _analytics_page(
+    db: Session,
+    container: ServiceContainer,
+    report: str,
+    limit: int,
+    offset: int,
+    days: int = 14,
+) -> TicketListResponse:
+    tickets, total = container.analytics.page(db, report, limit=limit, offset=offset, days=days)
+    next_offset = offset + len(tickets) if offset + len(tickets) < total else None
+    return TicketListResponse(
+        tickets=[ticket_to_response(ticket) for ticket in tickets],
+        total=total,
+        offset=offset,
+        next_offset=next_offset,
+    )
 
 
 def ticket_to_response(ticket: Ticket) -> TicketResponse:
@@ -30,15 +30,45 @@ class Settings:
     database_url: str = os.getenv("DATABASE_URL", f"sqlite:///{BACKEND_ROOT / 'jira_rag_local.db'}")
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     cache_enabled: bool = _bool("CACHE_ENABLED", True)
+    cache_memory_max_entries: int = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "10000"))
+    cache_memory_max_bytes: int = int(os.getenv("CACHE_MEMORY_MAX_BYTES", str(64 * 1024 * 1024)))
+    cache_namespace_limits: str = os.getenv("CACHE_NAMESPACE_LIMITS", "")
+    cache_eviction_policy: str = os.getenv("CACHE_EVICTION_POLICY", "lru").lower()
+    cache_l1_enabled: bool = _bool("CACHE_L1_ENABLED", False)
+    cache_l1_ttl_seconds: int = int(os.getenv("CACHE_L1_TTL_SECONDS", "30"))
+    cache_redis_ttl_seconds: int = int(os.getenv("CACHE_REDIS_TTL_SECONDS", "86400"))
     auto_sync_mock: bool = _bool("AUTO_SYNC_MOCK", True)
     jira_base_url: str = os.getenv("JIRA_BASE_URL", "")
     jira_email: str = os.getenv("JIRA_EMAIL", "")
     jira_api_token: str = os.getenv("JIRA_API_TOKEN", "")
     jira_project_key: str = os.getenv("JIRA_PROJECT_KEY", "AICB").upper()
+    jira_page_size: int = int(os.getenv("JIRA_PAGE_SIZE", "100"))
+    jira_fetch_concurrency: int = int(os.getenv("JIRA_FETCH_CONCURRENCY", "4"))
+    jira_watermark_overlap_minutes: int = int(os.getenv("JIRA_WATERMARK_OVERLAP_MINUTES", "1440"))
     mock_jira_data_path: Path = Path(os.getenv("MOCK_JIRA_DATA_PATH", "../sample_data/jira_tickets.json"))
     model_name: str = os.getenv("MODEL_NAME", "local-grounded")
     embedding_model: str = os.getenv("EMBEDDING_MODEL", "local-hashing")
+    vector_backend: str = os.getenv("VECTOR_BACKEND", "memory").lower()
+    vector_dimensions: int = int(os.getenv("VECTOR_DIMENSIONS", "1024"))
+    vector_candidate_pool: int = int(os.getenv("VECTOR_CANDIDATE_POOL", "200"))
+    vector_refine_factor: int = int(os.getenv("VECTOR_REFINE_FACTOR", "4"))
+    ingest_batch_size: int = int(os.getenv("INGEST_BATCH_SIZE", "500"))
+    index_batch_size: int = int(os.getenv("INDEX_BATCH_SIZE", "256"))
+    index_commit_window: int = int(os.getenv("INDEX_COMMIT_WINDOW", "500"))
+    chat_single_flight_enabled: bool = _bool("CHAT_SINGLE_FLIGHT_ENABLED", True)
+    chat_single_flight_timeout_seconds: float = float(os.getenv("CHAT_SINGLE_FLIGHT_TIMEOUT_SECONDS", "30"))
+    answer_stale_while_revalidate: bool = _bool("ANSWER_STALE_WHILE_REVALIDATE", False)
+    answer_stale_ttl_seconds: int = int(os.getenv("ANSWER_STALE_TTL_SECONDS", "86400"))
+    metrics_enabled: bool = _bool("METRICS_ENABLED", True)
+    chat_debug_timings: bool = _bool("CHAT_DEBUG_TIMINGS", False)
+    chat_history_write_behind: bool = _bool("CHAT_HISTORY_WRITE_BEHIND", True)
+    chat_history_batch_size: int = int(os.getenv("CHAT_HISTORY_BATCH_SIZE", "100"))
+    chat_history_flush_interval_ms: int = int(os.getenv("CHAT_HISTORY_FLUSH_INTERVAL_MS", "200"))
+    chat_history_max_pending: int = int(os.getenv("CHAT_HISTORY_MAX_PENDING", "10000"))
     retrieval_top_k: int = int(os.getenv("RETRIEVAL_TOP_K", "6"))
+    keyword_scorer: str = os.getenv("KEYWORD_SCORER", "bm25").lower()
+    bm25_k1: float = float(os.getenv("BM25_K1", "1.2"))
+    bm25_b: float = float(os.getenv("BM25_B", "0.75"))
     token_budget_chars: int = int(os.getenv("TOKEN_BUDGET_CHARS", "6000"))
     reranking_enabled: bool = _bool("RERANKING_ENABLED", True)
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import logging
 from functools import lru_cache
 
 from app.config import Settings, get_settings
+from app.database import SessionLocal
 from app.services.analytics_service import AnalyticsService
 from app.services.cache_service import CacheService
 from app.services.chat_service import ChatService
 from app.services.context_builder import ContextBuilder
+from app.services.dense_vector_store import DenseVectorStore
 from app.services.embedding_service import EmbeddingService
 from app.services.guardrails import Guardrails
+from app.services.history_writer import ChatHistoryWriter
 from app.services.jira_client import JiraClient
 from app.services.llm_service import LLMService
+from app.services.metrics import MetricsRegistry
 from app.services.prompt_builder import PromptBuilder
 from app.services.reranker import Reranker
 from app.services.retriever import Retriever
@@ -18,6 +23,8 @@ from app.services.ticket_ingestion import TicketIngestionService
 from app.services.ticket_preprocessor import TicketPreprocessor
 from app.services.vector_store import VectorStore
 
+logger = logging.getLogger(__name__)
+
 
 class ServiceContainer:
     def __init__(self, settings: Settings) -> None:
@@ -27,13 +34,16 @@ class ServiceContainer:
         self.jira_client = JiraClient(settings)
         self.ingestion = TicketIngestionService(self.jira_client, self.preprocessor)
         self.embedding = EmbeddingService(settings, self.cache)
-        self.vector_store = VectorStore(self.embedding, self.preprocessor)
+        self.vector_store = self._build_vector_store(settings)
         self.retriever = Retriever(settings, self.cache, self.vector_store, self.embedding)
         self.reranker = Reranker()
         self.context_builder = ContextBuilder(settings)
         self.prompt_builder = PromptBuilder()
         self.guardrails = Guardrails()
         self.llm = LLMService(self.guardrails)
+        self.analytics = AnalyticsService()
+        self.metrics = MetricsRegistry(settings.metrics_enabled)
+        self.history = self._build_history_writer(settings)
         self.chat = ChatService(
             settings,
             self.cache,
@@ -43,8 +53,33 @@ class ServiceContainer:
             self.prompt_builder,
             self.llm,
             self.guardrails,
+            self.analytics,
+            self.metrics,
+            self.history,
         )
-        self.analytics = AnalyticsService()
+
+    def _build_history_writer(self, settings: Settings) -> ChatHistoryWriter | None:
+        if not settings.chat_history_write_behind:
+            return None
+        return ChatHistoryWriter(
+            SessionLocal,
+            batch_size=settings.chat_history_batch_size,
+            flush_interval_ms=settings.chat_history_flush_interval_ms,
+            max_pending=settings.chat_history_max_pending,
+        )
+
+    def _build_vector_store(self, settings: Settings) -> VectorStore:
+        if settings.vector_backend == "numpy":
+            try:
+                return DenseVectorStore(
+                    self.embedding,
+                    self.preprocessor,
+                    dimensions=settings.vector_dimensions,
+                    refine_factor=settings.vector_refine_factor,
+                )
+            except RuntimeError as exc:
+                logger.warning("dense vector backend unavailable; falling back to in-memory index: %s", exc)
+        return VectorStore(self.embedding, self.preprocessor)
 
 
 @lru_cache(maxsize=1)
@@ -46,5 +46,13 @@ def startup() -> None:
             container.ingestion.sync_mock(db)
             container.vector_store.rebuild(db)
         else:
+            container.ingestion.backfill_derived_columns(db)
             container.vector_store.load_from_db(db)
     logger.info("startup completed")
+
+
+@app.on_event("shutdown")
+def shutdown() -> None:
+    container = get_container()
+    if container.history is not None:
+        container.history.close()
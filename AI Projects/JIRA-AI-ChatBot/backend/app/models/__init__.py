@@ -1,9 +1,11 @@
 from app.models.chat import ChatMessage, ChatSession
+from app.models.sync import SyncState
 from app.models.ticket import Ticket, TicketChunk, TicketComment, TicketEmbeddingMetadata
 
 __all__ = [
     "ChatMessage",
     "ChatSession",
+    "SyncState",
     "Ticket",
     "TicketChunk",
     "TicketComment",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, JSON, String, Text
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -8,6 +10,10 @@ from app.database import Base
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("ix_tickets_priority_key_status_key", "priority_key", "status_key"),
+        Index("ix_tickets_status_key_updated_ts", "status_key", "updated_ts"),
+    )
 
     ticket_id: Mapped[str] = mapped_column(String(64), primary_key=True, index=True)
     project_key: Mapped[str] = mapped_column(String(32), index=True)
@@ -28,6 +34,10 @@ class Ticket(Base):
     components: Mapped[list[str]] = mapped_column(JSON, default=list)
     acceptance_criteria: Mapped[list[str]] = mapped_column(JSON, default=list)
     custom_fields: Mapped[dict] = mapped_column(JSON, default=dict)
+    fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    status_key: Mapped[str | None] = mapped_column(String(64), index=True, nullable=True)
+    priority_key: Mapped[str | None] = mapped_column(String(64), index=True, nullable=True)
+    updated_ts: Mapped[datetime | None] = mapped_column(DateTime, index=True, nullable=True)
 
     comments: Mapped[list["TicketComment"]] = relationship(
         back_populates="ticket",
@@ -88,5 +98,6 @@ class TicketEmbeddingMetadata(Base):
     description_hash: Mapped[str] = mapped_column(String(64), index=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     embedding_vector: Mapped[dict] = mapped_column(JSON, default=dict)
+    term_counts: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     chunk: Mapped[TicketChunk] = relationship(back_populates="embedding_metadata")
@@ -1,4 +1,4 @@
-from app.schemas.chat import ChatRequest, ChatResponse
+from app.schemas.chat import ChatRequest, ChatResponse, ChatStreamEvent
 from app.schemas.ticket import TicketListResponse, TicketResponse
 
-__all__ = ["ChatRequest", "ChatResponse", "TicketListResponse", "TicketResponse"]
+__all__ = ["ChatRequest", "ChatResponse", "ChatStreamEvent", "TicketListResponse", "TicketResponse"]
@@ -15,4 +15,11 @@ class ChatResponse(BaseModel):
     confidence: str
     retrieval_mode: str
     from_cache: bool = False
+    stale: bool = False
     relevant_tickets: list[dict] = []
+    debug: dict | None = None
+
+
+class ChatStreamEvent(BaseModel):
+    event: str
+    data: dict
@@ -32,3 +32,5 @@ class TicketResponse(BaseModel):
 class TicketListResponse(BaseModel):
     tickets: list[TicketResponse]
     total: int
+    offset: int = 0
+    next_offset: int | None = None
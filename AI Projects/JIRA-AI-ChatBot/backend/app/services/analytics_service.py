@@ -1,47 +1,66 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, time, timedelta, timezone
 
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, and_, func, or_, select
+from sqlalchemy.orm import Session, lazyload, selectinload
 
 from app.models.ticket import Ticket
 
 
 DONE_STATUSES = {"done", "closed", "resolved", "cancelled"}
 HIGH_PRIORITIES = {"highest", "critical", "blocker", "high"}
+BLOCKED_STATUSES = {"blocked", "escalated"}
 
 
 class AnalyticsService:
-    def blockers(self, db: Session) -> list[Ticket]:
-        tickets = db.query(Ticket).all()
-        return [
-            ticket
-            for ticket in tickets
-            if ticket.status.lower() in {"blocked", "escalated"} or (ticket.custom_fields or {}).get("blocked_reason")
-        ]
-
-    def high_priority(self, db: Session) -> list[Ticket]:
-        return [
-            ticket
-            for ticket in db.query(Ticket).all()
-            if ticket.priority.lower() in HIGH_PRIORITIES and ticket.status.lower() not in DONE_STATUSES and not ticket.resolution
-        ]
-
-    def inactive(self, db: Session, days: int = 14) -> list[Ticket]:
-        today = datetime.now(timezone.utc).date()
-        inactive = []
-        for ticket in db.query(Ticket).all():
-            if ticket.status.lower() in DONE_STATUSES or ticket.resolution:
-                continue
-            if not ticket.updated_at:
-                continue
-            try:
-                updated = datetime.fromisoformat(ticket.updated_at.replace("Z", "+00:00")).date()
-            except ValueError:
-                continue
-            if (today - updated).days >= days:
-                inactive.append(ticket)
-        return inactive
-
-    def missing_assignee(self, db: Session) -> list[Ticket]:
-        return [ticket for ticket in db.query(Ticket).all() if not ticket.assignee and ticket.status.lower() not in DONE_STATUSES]
+    def blockers(self, db: Session, limit: int | None = None, offset: int = 0) -> list[Ticket]:
+        return self.tickets(db, self.criteria("blockers"), limit=limit, offset=offset)
+
+    def high_priority(self, db: Session, limit: int | None = None, offset: int = 0) -> list[Ticket]:
+        return self.tickets(db, self.criteria("high_priority"), limit=limit, offset=offset)
+
+    def inactive(self, db: Session, days: int = 14, limit: int | None = None, offset: int = 0) -> list[Ticket]:
+        return self.tickets(db, self.criteria("inactive", days=days), limit=limit, offset=offset)
+
+    def missing_assignee(self, db: Session, limit: int | None = None, offset: int = 0) -> list[Ticket]:
+        return self.tickets(db, self.criteria("missing_assignee"), limit=limit, offset=offset)
+
+    def page(self, db: Session, report: str, limit: int, offset: int = 0, days: int = 14) -> tuple[list[Ticket], int]:
+        criteria = self.criteria(report, days=days)
+        return self.tickets(db, criteria, limit=limit, offset=offset, with_comments=True), self.count(db, criteria)
+
+    def criteria(self, report: str, days: int = 14) -> ColumnElement[bool]:
+        unresolved = and_(Ticket.status_key.not_in(DONE_STATUSES), or_(Ticket.resolution.is_(None), Ticket.resolution == ""))
+        if report == "blockers":
+            blocked_reason = Ticket.custom_fields["blocked_reason"].as_string()
+            return or_(Ticket.status_key.in_(BLOCKED_STATUSES), and_(blocked_reason.is_not(None), blocked_reason != ""))
+        if report == "high_priority":
+            return and_(Ticket.priority_key.in_(HIGH_PRIORITIES), unresolved)
+        if report == "inactive":
+            # A ticket is inactive once `days` whole calendar days have passed since its last update.
+            today = datetime.now(timezone.utc).date()
+            cutoff = datetime.combine(today - timedelta(days=days - 1), time.min)
+            return and_(unresolved, Ticket.updated_ts.is_not(None), Ticket.updated_ts < cutoff)
+        if report == "missing_assignee":
+            return and_(or_(Ticket.assignee.is_(None), Ticket.assignee == ""), Ticket.status_key.not_in(DONE_STATUSES))
+        raise ValueError(f"Unknown analytics report: {report}")
+
+    def tickets(
+        self,
+        db: Session,
+        criteria: ColumnElement[bool],
+        limit: int | None = None,
+        offset: int = 0,
+        with_comments: bool = False,
+    ) -> list[Ticket]:
+        loader = selectinload(Ticket.comments) if with_comments else lazyload(Ticket.comments)
+        query = select(Ticket).where(criteria).options(loader, lazyload(Ticket.chunks)).order_by(Ticket.ticket_id)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return list(db.scalars(query))
+
+    def count(self, db: Session, criteria: ColumnElement[bool]) -> int:
+        return int(db.scalar(select(func.count()).select_from(Ticket).where(criteria)) or 0)
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
 from app.config import Settings
@@ -16,10 +19,179 @@ except Exception:  # pragma: no cover
     redis = None
 
 
+@dataclass(frozen=True)
+class NamespaceLimit:
+    max_entries: int
+    max_bytes: int
+
+
+@dataclass
+class NamespaceStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": self.entries,
+            "bytes": self.bytes,
+        }
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float | None
+    frequency: int = 1
+
+
+@dataclass
+class _Namespace:
+    limit: NamespaceLimit
+    entries: OrderedDict[str, _Entry] = field(default_factory=OrderedDict)
+    frequencies: dict[int, OrderedDict[str, None]] = field(default_factory=dict)
+    min_frequency: int = 1
+    stats: NamespaceStats = field(default_factory=NamespaceStats)
+
+
+class MemoryTier:
+    def __init__(self, default_limit: NamespaceLimit, limits: dict[str, NamespaceLimit] | None = None, policy: str = "lru") -> None:
+        if policy not in {"lru", "lfu"}:
+            raise ValueError(f"Unsupported cache eviction policy: {policy}")
+        self.default_limit = default_limit
+        self.limits = limits or {}
+        self.policy = policy
+        self._namespaces: dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            space = self._namespace(namespace)
+            entry = space.entries.get(key)
+            if entry is None:
+                space.stats.misses += 1
+                return False, None
+            if entry.expires_at is not None and time.time() >= entry.expires_at:
+                self._discard(space, key)
+                space.stats.expirations += 1
+                space.stats.misses += 1
+                return False, None
+            self._touch(space, key, entry)
+            space.stats.hits += 1
+            return True, entry.value
+
+    def set(self, namespace: str, key: str, value: Any, size: int, ttl_seconds: int | None = None) -> None:
+        with self._lock:
+            space = self._namespace(namespace)
+            if key in space.entries:
+                self._discard(space, key)
+            if size > space.limit.max_bytes or space.limit.max_entries <= 0:
+                return
+            while space.entries and (
+                len(space.entries) >= space.limit.max_entries or space.stats.bytes + size > space.limit.max_bytes
+            ):
+                self._evict(space)
+            expires_at = time.time() + ttl_seconds if ttl_seconds else None
+            space.entries[key] = _Entry(value=value, size=size, expires_at=expires_at)
+            space.frequencies.setdefault(1, OrderedDict())[key] = None
+            space.min_frequency = 1
+            space.stats.entries += 1
+            space.stats.bytes += size
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            space = self._namespaces.get(namespace)
+            if space is not None and key in space.entries:
+                self._discard(space, key)
+
+    def clear(self, namespace: str | None = None) -> None:
+        with self._lock:
+            spaces = [self._namespaces.get(namespace)] if namespace else list(self._namespaces.values())
+            for space in spaces:
+                if space is None:
+                    continue
+                space.entries.clear()
+                space.frequencies.clear()
+                space.min_frequency = 1
+                space.stats.entries = 0
+                space.stats.bytes = 0
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {name: space.stats.as_dict() for name, space in sorted(self._namespaces.items())}
+
+    def _namespace(self, namespace: str) -> _Namespace:
+        space = self._namespaces.get(namespace)
+        if space is None:
+            space = _Namespace(limit=self.limits.get(namespace, self.default_limit))
+            self._namespaces[namespace] = space
+        return space
+
+    def _touch(self, space: _Namespace, key: str, entry: _Entry) -> None:
+        if self.policy == "lru":
+            space.entries.move_to_end(key)
+            return
+        bucket = space.frequencies[entry.frequency]
+        bucket.pop(key, None)
+        if not bucket:
+            space.frequencies.pop(entry.frequency, None)
+            if space.min_frequency == entry.frequency:
+                space.min_frequency = entry.frequency + 1
+        entry.frequency += 1
+        space.frequencies.setdefault(entry.frequency, OrderedDict())[key] = None
+
+    def _evict(self, space: _Namespace) -> None:
+        if self.policy == "lru":
+            key = next(iter(space.entries))
+        else:
+            while space.min_frequency not in space.frequencies:
+                space.min_frequency += 1
+            key = next(iter(space.frequencies[space.min_frequency]))
+        self._discard(space, key)
+        space.stats.evictions += 1
+
+    def _discard(self, space: _Namespace, key: str) -> None:
+        entry = space.entries.pop(key)
+        bucket = space.frequencies.get(entry.frequency)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                space.frequencies.pop(entry.frequency, None)
+        space.stats.entries -= 1
+        space.stats.bytes -= entry.size
+
+
+def parse_namespace_limits(value: str) -> dict[str, NamespaceLimit]:
+    limits: dict[str, NamespaceLimit] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        namespace, max_entries, max_bytes = (part.strip() for part in item.split(":"))
+        limits[namespace] = NamespaceLimit(max_entries=int(max_entries), max_bytes=int(max_bytes))
+    return limits
+
+
 class CacheService:
     def __init__(self, settings: Settings) -> None:
         self.enabled = settings.cache_enabled
-        self._memory: dict[str, tuple[float | None, Any]] = {}
+        self._memory = MemoryTier(
+            NamespaceLimit(settings.cache_memory_max_entries, settings.cache_memory_max_bytes),
+            parse_namespace_limits(settings.cache_namespace_limits),
+            policy=settings.cache_eviction_policy,
+        )
+        self._l1_enabled = settings.cache_l1_enabled
+        self._l1_ttl_seconds = settings.cache_l1_ttl_seconds
+        self._redis_ttl_seconds = settings.cache_redis_ttl_seconds
+        self._redis_stats: dict[str, NamespaceStats] = {}
+        self._generations: dict[str, int] = {}
         self._redis = None
         if self.enabled and redis is not None and settings.redis_url:
             try:
@@ -30,58 +202,102 @@ class CacheService:
                 logger.warning("redis unavailable; falling back to in-memory cache: %s", exc)
                 self._redis = None
 
+    @property
+    def _use_memory(self) -> bool:
+        return self._redis is None or self._l1_enabled
+
     def make_key(self, namespace: str, payload: object) -> str:
         return f"{namespace}:{stable_hash(payload)}"
 
     def get(self, namespace: str, key: str) -> Any | None:
-        if not self.enabled:
-            return None
-        full_key = f"{namespace}:{key}"
-        if self._redis is not None:
-            raw = self._redis.get(full_key)
-            if raw is None:
-                logger.debug("cache miss namespace=%s", namespace)
-                return None
-            logger.debug("cache hit namespace=%s", namespace)
-            return json.loads(raw)
-        item = self._memory.get(full_key)
-        if item is None:
-            logger.debug("cache miss namespace=%s", namespace)
-            return None
-        expires_at, value = item
-        if expires_at is not None and time.time() >= expires_at:
-            self._memory.pop(full_key, None)
-            logger.debug("cache expired namespace=%s", namespace)
-            return None
-        logger.debug("cache hit namespace=%s", namespace)
-        return value
+        return self.get_many(namespace, [key]).get(key)
+
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, Any]:
+        if not self.enabled or not keys:
+            return {}
+        found: dict[str, Any] = {}
+        missing = list(dict.fromkeys(keys))
+        if self._use_memory:
+            remaining = []
+            for key in missing:
+                hit, value = self._memory.get(namespace, key)
+                if hit:
+                    found[key] = value
+                else:
+                    remaining.append(key)
+            missing = remaining
+        if self._redis is None or not missing:
+            logger.debug("cache lookup namespace=%s tier=memory hits=%s misses=%s", namespace, len(found), len(missing))
+            return found
+        stats = self._redis_stats.setdefault(namespace, NamespaceStats())
+        generation, *raws = self._redis.mget([self._generation_key(namespace)] + [f"{namespace}:{key}" for key in missing])
+        generation = int(generation or 0)
+        self._generations[namespace] = generation
+        for key, raw in zip(missing, raws):
+            value = self._unwrap(raw, generation)
+            if value is None:
+                stats.misses += 1
+                continue
+            stats.hits += 1
+            found[key] = value
+            if self._l1_enabled:
+                self._memory.set(namespace, key, value, len(raw), ttl_seconds=self._l1_ttl_seconds)
+        logger.debug("cache lookup namespace=%s tier=redis hits=%s misses=%s", namespace, len(found), len(keys) - len(found))
+        return found
 
     def set(self, namespace: str, key: str, value: Any, ttl_seconds: int | None = None) -> None:
-        if not self.enabled:
+        self.set_many(namespace, {key: value}, ttl_seconds=ttl_seconds)
+
+    def set_many(self, namespace: str, values: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        if not self.enabled or not values:
             return
-        full_key = f"{namespace}:{key}"
         if self._redis is not None:
-            self._redis.set(full_key, json.dumps(value, default=str), ex=ttl_seconds)
-            return
-        expires_at = time.time() + ttl_seconds if ttl_seconds else None
-        self._memory[full_key] = (expires_at, value)
+            generation = self._generations.get(namespace)
+            if generation is None:
+                generation = self._generations[namespace] = int(self._redis.get(self._generation_key(namespace)) or 0)
+            redis_ttl = ttl_seconds or self._redis_ttl_seconds or None
+            pipeline = self._redis.pipeline(transaction=False)
+            for key, value in values.items():
+                pipeline.set(f"{namespace}:{key}", json.dumps({"g": generation, "v": value}, default=str), ex=redis_ttl)
+            pipeline.execute()
+        if self._use_memory:
+            l1_ttl = self._l1_ttl_seconds if self._redis is not None else None
+            ttl = min(filter(None, [ttl_seconds, l1_ttl]), default=None)
+            for key, value in values.items():
+                self._memory.set(namespace, key, value, len(json.dumps(value, default=str)), ttl_seconds=ttl)
 
     def delete(self, namespace: str, key: str) -> None:
         full_key = f"{namespace}:{key}"
         if self._redis is not None:
             self._redis.delete(full_key)
-        self._memory.pop(full_key, None)
+        self._memory.delete(namespace, key)
 
     def clear(self, namespace: str | None = None) -> None:
         if self._redis is not None and namespace:
-            for key in self._redis.scan_iter(f"{namespace}:*"):
-                self._redis.delete(key)
+            self._generations[namespace] = int(self._redis.incr(self._generation_key(namespace)))
         elif self._redis is not None:
             self._redis.flushdb()
-        if namespace:
-            prefix = f"{namespace}:"
-            for key in list(self._memory):
-                if key.startswith(prefix):
-                    self._memory.pop(key, None)
-        else:
-            self._memory.clear()
+            self._generations.clear()
+        self._memory.clear(namespace)
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"cache-generation:{namespace}"
+
+    @staticmethod
+    def _unwrap(raw: str | None, generation: int) -> Any | None:
+        if raw is None:
+            return None
+        payload = json.loads(raw)
+        if not isinstance(payload, dict) or payload.get("g") != generation:
+            return None
+        return payload.get("v")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "redis" if self._redis is not None else "memory",
+            "l1_enabled": self._redis is not None and self._l1_enabled,
+            "eviction_policy": self._memory.policy,
+            "memory": self._memory.stats(),
+            "redis": {name: stats.as_dict() for name, stats in sorted(self._redis_stats.items())},
+        }
@@ -1,24 +1,30 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 
 from sqlalchemy.orm import Session
 
 from app.config import Settings
-from app.models.chat import ChatMessage, ChatSession
 from app.models.ticket import Ticket
-from app.schemas.chat import ChatResponse
+from app.schemas.chat import ChatResponse, ChatStreamEvent
+from app.services.analytics_service import AnalyticsService
 from app.services.cache_service import CacheService
 from app.services.context_builder import ContextBuilder
 from app.services.guardrails import Guardrails
+from app.services.history_writer import ChatHistoryWriter, HistoryRecord, write_history
 from app.services.llm_service import LLMService
+from app.services.metrics import NULL_TRACE, ChatTrace, MetricsRegistry
 from app.services.prompt_builder import PromptBuilder
 from app.services.reranker import Reranker
 from app.services.retriever import Retriever
+from app.services.single_flight import SingleFlight
 from app.services.text_utils import stable_hash
 
 logger = logging.getLogger(__name__)
 
+ANALYTICS_ANSWER_LIMIT = 50
+
 
 class ChatService:
     def __init__(
@@ -31,6 +37,9 @@ class ChatService:
         prompt_builder: PromptBuilder,
         llm_service: LLMService,
         guardrails: Guardrails,
+        analytics: AnalyticsService,
+        metrics: MetricsRegistry,
+        history: ChatHistoryWriter | None = None,
     ) -> None:
         self.settings = settings
         self.cache = cache
@@ -40,54 +49,176 @@ class ChatService:
         self.prompt_builder = prompt_builder
         self.llm_service = llm_service
         self.guardrails = guardrails
+        self.analytics = analytics
+        self.metrics = metrics
+        self.history = history
+        self._inflight: SingleFlight[ChatResponse] = SingleFlight()
 
     def chat(self, db: Session, question: str, session_id: int | None = None, filters: dict | None = None) -> ChatResponse:
+        for event in self.stream_chat(db, question, session_id=session_id, filters=filters):
+            if event.event == "done":
+                return ChatResponse(**event.data)
+        raise RuntimeError("chat stream ended without a response")
+
+    def stream_chat(
+        self,
+        db: Session,
+        question: str,
+        session_id: int | None = None,
+        filters: dict | None = None,
+    ) -> Iterator[ChatStreamEvent]:
+        debug = self.settings.chat_debug_timings
+        trace = self.metrics.trace(force=debug)
+        try:
+            for event in self._stream_chat(db, question, session_id, filters, trace):
+                if debug and event.event == "done":
+                    event = ChatStreamEvent(event="done", data=event.data | {"debug": trace.as_dict()})
+                yield event
+        finally:
+            self.metrics.record(trace)
+
+    def _stream_chat(
+        self,
+        db: Session,
+        question: str,
+        session_id: int | None,
+        filters: dict | None,
+        trace: ChatTrace,
+    ) -> Iterator[ChatStreamEvent]:
         mode = self.retriever.select_mode(question)
+        with trace.stage("index_version"):
+            index_version = self.retriever.index_version()
         answer_key = stable_hash(
             {
                 "question": question.lower().strip(),
                 "mode": mode,
                 "filters": filters or {},
-                "index_version": self.retriever.index_version(),
+                "index_version": index_version,
             }
         )
-        cached = self.cache.get("answers", answer_key)
+        with trace.stage("answer_cache"):
+            cached = self.cache.get("answers", answer_key)
         if cached:
+            trace.outcome = "cache"
             cached["from_cache"] = True
-            return ChatResponse(**cached)
+            yield from self._replay(ChatResponse(**cached))
+            return
+        stale_key = stable_hash({"question": question.lower().strip(), "mode": mode, "filters": filters or {}})
+        if self.settings.answer_stale_while_revalidate and self.retriever.reindexing():
+            # The index is half-built during a rebuild; serve the last good answer until it finishes.
+            with trace.stage("answer_cache"):
+                stale = self.cache.get("stale_answers", stale_key)
+            if stale:
+                trace.outcome = "stale"
+                stale.update(from_cache=True, stale=True)
+                yield from self._replay(ChatResponse(**stale))
+                return
+
+        flight = None
+        if self.settings.chat_single_flight_enabled:
+            while True:
+                leader, flight = self._inflight.begin(answer_key)
+                if leader:
+                    break
+                with trace.stage("single_flight_wait"):
+                    shared = flight.wait(self.settings.chat_single_flight_timeout_seconds)
+                if shared is not None:
+                    trace.outcome = "shared"
+                    yield from self._replay(shared.model_copy(update={"from_cache": True}))
+                    return
+                if not flight.done.is_set():
+                    logger.warning("single-flight wait timed out; answering independently")
+                    flight = None
+                    break
+
+        response = None
+        try:
+            for event in self._answer(db, question, session_id, filters, mode, answer_key, trace):
+                if event.event == "done":
+                    response = ChatResponse(**event.data)
+                    if self.settings.answer_stale_while_revalidate:
+                        self.cache.set("stale_answers", stale_key, event.data, ttl_seconds=self.settings.answer_stale_ttl_seconds)
+                yield event
+        finally:
+            if flight is not None:
+                self._inflight.finish(answer_key, flight, response)
 
-        analytics_response = self._try_analytics_question(db, question, session_id)
+    def _answer(
+        self,
+        db: Session,
+        question: str,
+        session_id: int | None,
+        filters: dict | None,
+        mode: str,
+        answer_key: str,
+        trace: ChatTrace,
+    ) -> Iterator[ChatStreamEvent]:
+        analytics_response = self._try_analytics_question(db, question, session_id, trace)
         if analytics_response is not None:
+            trace.outcome = "analytics"
             self.cache.set("answers", answer_key, analytics_response.model_dump())
-            return analytics_response
+            yield from self._replay(analytics_response)
+            return
 
-        mode, results = self.retriever.retrieve(db, question, filters=filters, top_k=self.settings.retrieval_top_k)
+        with trace.stage("retrieval"):
+            mode, results = self.retriever.retrieve(db, question, filters=filters, top_k=self.settings.retrieval_top_k, trace=trace)
         if self.settings.reranking_enabled:
-            results = self.reranker.rerank(question, results)
-        context, tickets = self.context_builder.build(db, results)
+            with trace.stage("rerank"):
+                results = self.reranker.rerank(question, results)
+        with trace.stage("context"):
+            context, tickets = self.context_builder.build(db, results)
+        trace.count("tickets_loaded", len(tickets))
+        relevant_tickets = [self._ticket_summary(ticket) for ticket in tickets]
+        ticket_ids = [ticket.ticket_id for ticket in tickets]
+        yield self._retrieval_event(mode, ticket_ids, relevant_tickets)
 
         requested_ids = self.retriever.extract_ticket_ids(question)
         if requested_ids and not tickets:
+            trace.outcome = "not_found"
             answer = self.guardrails.not_enough_information(f"Ticket ID(s) not found: {', '.join(requested_ids)}")
             response = ChatResponse(answer=answer, ticket_ids=[], confidence="High", retrieval_mode=mode, relevant_tickets=[])
-            return response
+            yield from self._answer_events(response)
+            return
 
-        kind = self.prompt_builder.infer_kind(question, has_ticket_id=bool(requested_ids))
-        prompt = self.prompt_builder.build(question, context, kind)
-        answer, confidence = self.llm_service.generate(question, prompt, kind, tickets, results, mode)
-        ticket_ids = [ticket.ticket_id for ticket in tickets]
+        with trace.stage("prompt"):
+            kind = self.prompt_builder.infer_kind(question, has_ticket_id=bool(requested_ids))
+            prompt = self.prompt_builder.build(question, context, kind)
+        sections: list[str] = []
+        for section in trace.timed("generate", self.llm_service.stream(question, prompt, kind, tickets, results, mode)):
+            sections.append(section)
+            yield ChatStreamEvent(event="answer", data={"text": section})
+        answer = "\n\n".join(sections)
+        with trace.stage("generate"):
+            confidence = self.llm_service.confidence(tickets, results, mode)
         response = ChatResponse(
             answer=answer,
             ticket_ids=ticket_ids,
             confidence=confidence,
             retrieval_mode=mode,
-            relevant_tickets=[self._ticket_summary(ticket) for ticket in tickets],
+            relevant_tickets=relevant_tickets,
             from_cache=False,
         )
         self.cache.set("answers", answer_key, response.model_dump())
-        self._store_message(db, question, answer, ticket_ids, confidence, session_id)
+        with trace.stage("store_message"):
+            self._store_message(db, question, answer, ticket_ids, confidence, session_id)
+        trace.outcome = "generated"
         logger.info("chat answered mode=%s tickets=%s confidence=%s", mode, ticket_ids, confidence)
-        return response
+        yield ChatStreamEvent(event="done", data=response.model_dump())
+
+    def _replay(self, response: ChatResponse) -> Iterator[ChatStreamEvent]:
+        yield self._retrieval_event(response.retrieval_mode, response.ticket_ids, response.relevant_tickets)
+        yield from self._answer_events(response)
+
+    def _answer_events(self, response: ChatResponse) -> Iterator[ChatStreamEvent]:
+        for section in response.answer.split("\n\n"):
+            yield ChatStreamEvent(event="answer", data={"text": section})
+        yield ChatStreamEvent(event="done", data=response.model_dump())
+
+    def _retrieval_event(self, mode: str, ticket_ids: list[str], relevant_tickets: list[dict]) -> ChatStreamEvent:
+        return ChatStreamEvent(
+            event="retrieval",
+            data={"retrieval_mode": mode, "ticket_ids": ticket_ids, "relevant_tickets": relevant_tickets},
+        )
 
     def _store_message(
         self,
@@ -98,14 +229,9 @@ class ChatService:
         confidence: str,
         session_id: int | None,
     ) -> None:
-        session = db.get(ChatSession, session_id) if session_id else None
-        if session is None:
-            session = ChatSession(title=question[:80])
-            db.add(session)
-            db.flush()
-        db.add(ChatMessage(session_id=session.id, role="user", content=question, ticket_ids=[]))
-        db.add(ChatMessage(session_id=session.id, role="assistant", content=answer, ticket_ids=ticket_ids, confidence=confidence))
-        db.commit()
+        record = HistoryRecord(session_id=session_id, question=question, answer=answer, ticket_ids=ticket_ids, confidence=confidence)
+        if self.history is None or not self.history.submit(record):
+            write_history(db, [record])
 
     def _ticket_summary(self, ticket: Ticket) -> dict:
         return {
@@ -116,35 +242,20 @@ class ChatService:
             "assignee": ticket.assignee,
         }
 
-    def _try_analytics_question(self, db: Session, question: str, session_id: int | None) -> ChatResponse | None:
+    def _try_analytics_question(self, db: Session, question: str, session_id: int | None, trace: ChatTrace = NULL_TRACE) -> ChatResponse | None:
         lower = question.lower()
-        tickets: list[Ticket] | None = None
+        report = None
         title = ""
         if "missing assignee" in lower or "unassigned" in lower:
-            tickets = [
-                ticket
-                for ticket in db.query(Ticket).all()
-                if not ticket.assignee and ticket.status.lower() not in {"done", "closed", "resolved", "cancelled"}
-            ]
-            title = "Tickets missing assignees"
+            report, title = "missing_assignee", "Tickets missing assignees"
         elif "blocked" in lower and ("which" in lower or "list" in lower or "why" in lower):
-            tickets = [
-                ticket
-                for ticket in db.query(Ticket).all()
-                if ticket.status.lower() in {"blocked", "escalated"} or (ticket.custom_fields or {}).get("blocked_reason")
-            ]
-            title = "Blocked or escalated tickets"
+            report, title = "blockers", "Blocked or escalated tickets"
         elif ("critical" in lower or "high priority" in lower) and "unresolved" in lower:
-            tickets = [
-                ticket
-                for ticket in db.query(Ticket).all()
-                if ticket.priority.lower() in {"highest", "critical", "blocker", "high"}
-                and ticket.status.lower() not in {"done", "closed", "resolved", "cancelled"}
-                and not ticket.resolution
-            ]
-            title = "High-priority unresolved tickets"
-        if tickets is None:
+            report, title = "high_priority", "High-priority unresolved tickets"
+        if report is None:
             return None
+        with trace.stage("analytics"):
+            tickets, total = self.analytics.page(db, report, limit=ANALYTICS_ANSWER_LIMIT)
 
         if not tickets:
             answer = (
@@ -161,6 +272,8 @@ class ChatService:
             f"- {ticket.ticket_id}: {ticket.summary}; status {ticket.status}; priority {ticket.priority}; assignee {ticket.assignee or 'Unassigned'}."
             for ticket in tickets
         ]
+        if total > len(tickets):
+            lines.append(f"- ...and {total - len(tickets)} more matching tickets.")
         ticket_ids = [ticket.ticket_id for ticket in tickets]
         answer = (
             f"Answer:\n{title}:\n"
@@ -172,7 +285,8 @@ class ChatService:
             + "Missing information:\nOnly fields present in local Jira data were used.\n\n"
             + "Confidence: High"
         )
-        self._store_message(db, question, answer, ticket_ids, "High", session_id)
+        with trace.stage("store_message"):
+            self._store_message(db, question, answer, ticket_ids, "High", session_id)
         return ChatResponse(
             answer=answer,
             ticket_ids=ticket_ids,
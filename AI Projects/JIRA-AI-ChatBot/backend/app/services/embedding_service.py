@@ -17,15 +17,30 @@ class EmbeddingService:
         self.cache = cache
 
     def embed(self, text: str) -> Vector:
-        key = stable_hash({"model": self.settings.embedding_model, "text": text})
-        cached = self.cache.get("embeddings", key)
-        if cached is not None:
-            return {str(token): float(value) for token, value in cached.items()}
-        counts = Counter(tokenize(text))
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: list[str]) -> list[Vector]:
+        keys = {text: stable_hash({"model": self.settings.embedding_model, "text": text}) for text in texts}
+        cached = self.cache.get_many("embeddings", list(keys.values()))
+        vectors: dict[str, Vector] = {}
+        fresh: dict[str, Vector] = {}
+        for text, key in keys.items():
+            if key in cached:
+                vectors[text] = {str(token): float(value) for token, value in cached[key].items()}
+                continue
+            vectors[text] = fresh[key] = self._embed_text(text)
+        self.cache.set_many("embeddings", fresh)
+        return [vectors[text] for text in texts]
+
+    @staticmethod
+    def term_counts(text: str) -> Counter[str]:
+        return Counter(tokenize(text))
+
+    @classmethod
+    def _embed_text(cls, text: str) -> Vector:
+        counts = cls.term_counts(text)
         norm = math.sqrt(sum(value * value for value in counts.values())) or 1.0
-        vector = {token: value / norm for token, value in counts.items()}
-        self.cache.set("embeddings", key, vector)
-        return vector
+        return {token: value / norm for token, value in counts.items()}
 
     @staticmethod
     def cosine(left: Vector, right: Vector) -> float:
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.chat import ChatMessage, ChatSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HistoryRecord:
+    session_id: int | None
+    question: str
+    answer: str
+    ticket_ids: list[str]
+    confidence: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def write_history(db: Session, records: list[HistoryRecord]) -> None:
+    requested = {record.session_id for record in records if record.session_id}
+    known = set(db.scalars(select(ChatSession.id).where(ChatSession.id.in_(requested)))) if requested else set()
+    created: dict[int, ChatSession] = {}
+    for position, record in enumerate(records):
+        if record.session_id not in known:
+            created[position] = ChatSession(title=record.question[:80], created_at=record.created_at)
+            db.add(created[position])
+    if created:
+        db.flush()
+    rows = []
+    for position, record in enumerate(records):
+        session_id = created[position].id if position in created else record.session_id
+        rows.append(
+            {"session_id": session_id, "role": "user", "content": record.question, "ticket_ids": [], "created_at": record.created_at}
+        )
+        rows.append(
+            {
+                "session_id": session_id,
+                "role": "assistant",
+                "content": record.answer,
+                "ticket_ids": record.ticket_ids,
+                "confidence": record.confidence,
+                "created_at": record.created_at,
+            }
+        )
+    db.execute(insert(ChatMessage), rows)
+    db.commit()
+
+
+class ChatHistoryWriter:
+    """Persist chat history on a background thread, one transaction per batch."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 100,
+        flush_interval_ms: int = 200,
+        max_pending: int = 10_000,
+        submit_timeout_seconds: float = 1.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000
+        self.submit_timeout_seconds = submit_timeout_seconds
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self._queue: queue.Queue[HistoryRecord | None] = queue.Queue(maxsize=max(1, max_pending))
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="chat-history-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: HistoryRecord) -> bool:
+        # A full queue blocks the caller (backpressure); False tells it to write synchronously instead.
+        if self._closed:
+            return False
+        try:
+            self._queue.put(record, timeout=self.submit_timeout_seconds)
+        except queue.Full:
+            logger.warning("chat history queue full; writing synchronously")
+            return False
+        return True
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        logger.info("chat history writer closed written=%s batches=%s failed=%s", self.written, self.batches, self.failed)
+
+    def stats(self) -> dict[str, int]:
+        return {"pending": self._queue.qsize(), "written": self.written, "batches": self.batches, "failed": self.failed}
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            for _ in range(len(batch) + stopping):
+                self._queue.task_done()
+        self._drain()
+
+    def _drain(self) -> None:
+        # Records that raced past the closed check land behind the sentinel; write them before exiting.
+        batch: list[HistoryRecord] = []
+        taken = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            if item is not None:
+                batch.append(item)
+        if batch:
+            self._write(batch)
+        for _ in range(taken):
+            self._queue.task_done()
+
+    def _write(self, batch: list[HistoryRecord]) -> None:
+        try:
+            with self.session_factory() as db:
+                write_history(db, batch)
+        except Exception:
+            self.failed += len(batch)
+            logger.exception("chat history batch failed records=%s", len(batch))
+            return
+        self.written += len(batch)
+        self.batches += 1
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import base64
+import http.client
 import json
 import logging
+import threading
 import urllib.parse
-import urllib.request
-from pathlib import Path
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from app.config import Settings
@@ -21,49 +24,62 @@ class JiraClient:
         path = self.settings.mock_data_absolute_path
         if not path.exists():
             raise FileNotFoundError(f"Mock Jira data not found: {path}")
-        data = json.loads(path.read_text(encoding="utf-8"))
+        if path.suffix == ".jsonl":
+            with path.open(encoding="utf-8") as handle:
+                data = [json.loads(line) for line in handle if line.strip()]
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
         if not isinstance(data, list):
             raise ValueError("Mock Jira data must be a JSON list")
         logger.info("mock jira sync fetched tickets=%s", len(data))
         return data
 
     def fetch_real_tickets(self, updated_since: str | None = None) -> list[dict[str, Any]]:
+        return [ticket for page in self.iter_real_ticket_pages(updated_since=updated_since) for ticket in page]
+
+    def iter_real_ticket_pages(self, updated_since: str | None = None) -> Iterator[list[dict[str, Any]]]:
         if not self.settings.has_real_jira_credentials:
             raise ValueError("Jira credentials are not configured")
-        logger.info("real jira sync started project=%s", self.settings.jira_project_key)
-        start_at = 0
-        page_size = 100
-        tickets: list[dict[str, Any]] = []
-        while True:
-            payload = self._search_page(start_at, page_size, updated_since=updated_since)
+        logger.info("real jira sync started project=%s updated_since=%s", self.settings.jira_project_key, updated_since)
+        session = _JiraSession(self.settings.jira_base_url, self.settings.jira_email, self.settings.jira_api_token)
+        workers = max(1, self.settings.jira_fetch_concurrency)
+        fetched = 0
+        try:
+            payload = session.search(self._search_params(0, self.settings.jira_page_size, updated_since))
             issues = payload.get("issues", [])
-            tickets.extend(self._normalize_issue(issue) for issue in issues)
-            total = int(payload.get("total", len(tickets)))
-            start_at += len(issues)
-            if not issues or start_at >= total:
-                break
-        logger.info("real jira sync completed tickets=%s", len(tickets))
-        return tickets
-
-    def _search_page(self, start_at: int, max_results: int, updated_since: str | None = None) -> dict[str, Any]:
+            total = int(payload.get("total", len(issues)))
+            fetched += len(issues)
+            yield [self._normalize_issue(issue) for issue in issues]
+            if not issues or len(issues) >= total:
+                return
+            # Jira may cap maxResults below the requested size, so the first page decides the stride.
+            page_size = len(issues)
+            offsets = deque(range(page_size, total, page_size))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-fetch") as executor:
+                pending: deque[Future] = deque()
+                while offsets or pending:
+                    while offsets and len(pending) < workers * 2:
+                        params = self._search_params(offsets.popleft(), page_size, updated_since)
+                        pending.append(executor.submit(session.search, params))
+                    issues = pending.popleft().result().get("issues", [])
+                    fetched += len(issues)
+                    yield [self._normalize_issue(issue) for issue in issues]
+        finally:
+            session.close()
+            logger.info("real jira sync completed tickets=%s", fetched)
+
+    def _search_params(self, start_at: int, max_results: int, updated_since: str | None = None) -> dict[str, Any]:
         jql_parts = [f"project={self.settings.jira_project_key}"]
         if updated_since:
             jql_parts.append(f'updated >= "{updated_since}"')
-        jql = " AND ".join(jql_parts) + " ORDER BY updated DESC"
-        query = urllib.parse.urlencode(
-            {
-                "jql": jql,
-                "startAt": start_at,
-                "maxResults": max_results,
-                "fields": "*all",
-            }
-        )
-        request = urllib.request.Request(f"{self.settings.jira_base_url.rstrip('/')}/rest/api/3/search?{query}")
-        token = base64.b64encode(f"{self.settings.jira_email}:{self.settings.jira_api_token}".encode()).decode()
-        request.add_header("Authorization", f"Basic {token}")
-        request.add_header("Accept", "application/json")
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
+        # A stable key order keeps offsets consistent while pages are fetched out of order.
+        jql = " AND ".join(jql_parts) + " ORDER BY key ASC"
+        return {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": "*all",
+        }
 
     def _normalize_issue(self, issue: dict[str, Any]) -> dict[str, Any]:
         fields = issue.get("fields", {})
@@ -97,3 +113,55 @@ class JiraClient:
             "acceptance_criteria": [],
             "custom_fields": {},
         }
+
+
+# src/jira_chatbot/jira_client.py ships its own copy; keep the two identical.
+class _JiraSession:
+    """One keep-alive connection per worker thread, closed together when the sync ends."""
+
+    def __init__(self, base_url: str, email: str, api_token: str, timeout: float = 30) -> None:
+        parsed = urllib.parse.urlsplit(base_url.rstrip("/"))
+        self._connection_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+        self._host = parsed.netloc
+        self._path = f"{parsed.path}/rest/api/3/search"
+        self._timeout = timeout
+        token = base64.b64encode(f"{email}:{api_token}".encode("utf-8")).decode("ascii")
+        self._headers = {"Authorization": f"Basic {token}", "Accept": "application/json"}
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def search(self, params: dict[str, Any]) -> dict[str, Any]:
+        url = f"{self._path}?{urllib.parse.urlencode(params)}"
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request("GET", url, headers=self._headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed an idle keep-alive connection; reconnect once.
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+                continue
+            if response.status != 200:
+                raise RuntimeError(f"Jira search failed status={response.status} start_at={params.get('startAt')}")
+            return json.loads(body.decode("utf-8"))
+        raise RuntimeError("Jira search failed")
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connection_class(self._host, timeout=self._timeout)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from app.models.ticket import Ticket
 from app.services.guardrails import Guardrails
 from app.services.prompt_builder import PromptKind
@@ -21,15 +23,34 @@ class LLMService:
         results: list[RetrievalResult],
         retrieval_mode: str,
     ) -> tuple[str, str]:
+        answer = "\n\n".join(self.stream(question, prompt, kind, tickets, results, retrieval_mode))
+        return answer, self.confidence(tickets, results, retrieval_mode)
+
+    def stream(
+        self,
+        question: str,
+        prompt: str,
+        kind: PromptKind,
+        tickets: list[Ticket],
+        results: list[RetrievalResult],
+        retrieval_mode: str,
+    ) -> Iterator[str]:
+        """Yield answer sections as they are produced; joined with blank lines they form the full answer."""
         if not tickets:
-            return self.guardrails.not_enough_information(), "Low"
+            yield from self.guardrails.not_enough_information().split("\n\n")
+            return
         if kind == PromptKind.SPECIFIC_TICKET or retrieval_mode == "ticket_lookup" or len(tickets) == 1:
             answer = self._specific_ticket(tickets[0], kind)
         else:
             answer = self._general(tickets, kind)
-        confidence = self._confidence(results, retrieval_mode)
+        confidence = self.confidence(tickets, results, retrieval_mode)
         answer = answer.replace("Confidence: Medium", f"Confidence: {confidence}")
-        return self.guardrails.ensure_citations(answer, [ticket.ticket_id for ticket in tickets]), confidence
+        yield from self.guardrails.ensure_citations(answer, [ticket.ticket_id for ticket in tickets]).split("\n\n")
+
+    def confidence(self, tickets: list[Ticket], results: list[RetrievalResult], retrieval_mode: str) -> str:
+        if not tickets:
+            return "Low"
+        return self._confidence(results, retrieval_mode)
 
     def _specific_ticket(self, ticket: Ticket, kind: PromptKind) -> str:
         facts = [
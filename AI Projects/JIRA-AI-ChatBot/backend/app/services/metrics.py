@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, TypeVar
+
+T = TypeVar("T")
+
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+PREFIX = "jira_chatbot"
+
+
+class ChatTrace:
+    def __init__(self) -> None:
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+        self.outcome = "incomplete"
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def timed(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        # Only time spent producing items counts; time the consumer holds each item does not.
+        iterator = iter(items)
+        while True:
+            with self.stage(name):
+                item = next(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "outcome": self.outcome,
+            "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()},
+            "total_ms": round(sum(self.stages.values()) * 1000, 3),
+            "counters": dict(self.counters),
+        }
+
+
+class NullTrace(ChatTrace):
+    _context = nullcontext()
+
+    def stage(self, name: str) -> ContextManager[None]:  # type: ignore[override]
+        return self._context
+
+    def timed(self, name: str, items: Iterable[T]) -> Iterable[T]:  # type: ignore[override]
+        return items
+
+    def count(self, name: str, value: int = 1) -> None:
+        pass
+
+
+_DONE = object()
+NULL_TRACE = NullTrace()
+
+
+@dataclass
+class _Histogram:
+    buckets: list[int] = field(default_factory=lambda: [0] * len(STAGE_BUCKETS))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, seconds: float) -> None:
+        index = bisect_left(STAGE_BUCKETS, seconds)
+        if index < len(self.buckets):
+            self.buckets[index] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._requests: dict[str, int] = {}
+        self._stages: dict[str, _Histogram] = {}
+        self._counters: dict[str, int] = {}
+
+    def trace(self, force: bool = False) -> ChatTrace:
+        return ChatTrace() if self.enabled or force else NULL_TRACE
+
+    def record(self, trace: ChatTrace) -> None:
+        if not self.enabled or trace is NULL_TRACE:
+            return
+        with self._lock:
+            self._requests[trace.outcome] = self._requests.get(trace.outcome, 0) + 1
+            for name, seconds in trace.stages.items():
+                self._stages.setdefault(name, _Histogram()).observe(seconds)
+            for name, value in trace.counters.items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def render(self, cache_stats: dict[str, Any] | None = None, indexed_chunks: int | None = None) -> str:
+        """Render chat, cache, and index metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            _header(lines, "chat_requests_total", "counter", "Chat requests by how they were answered.")
+            for outcome, value in sorted(self._requests.items()):
+                lines.append(f'{PREFIX}_chat_requests_total{{outcome="{outcome}"}} {value}')
+            _header(lines, "chat_stage_seconds", "histogram", "Time spent in each chat pipeline stage.")
+            for stage, histogram in sorted(self._stages.items()):
+                cumulative = 0
+                for bound, count in zip(STAGE_BUCKETS, histogram.buckets):
+                    cumulative += count
+                    lines.append(f'{PREFIX}_chat_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{PREFIX}_chat_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{PREFIX}_chat_stage_seconds_sum{{stage="{stage}"}} {histogram.total:.6f}')
+                lines.append(f'{PREFIX}_chat_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+            for name, value in sorted(self._counters.items()):
+                _header(lines, f"chat_{name}_total", "counter", f"Chat pipeline {name.replace('_', ' ')}.")
+                lines.append(f"{PREFIX}_chat_{name}_total {value}")
+        if cache_stats is not None:
+            _render_cache(lines, cache_stats)
+        if indexed_chunks is not None:
+            _header(lines, "index_chunks", "gauge", "Chunks in the in-memory vector index.")
+            lines.append(f"{PREFIX}_index_chunks {indexed_chunks}")
+        return "\n".join(lines) + "\n"
+
+
+def _render_cache(lines: list[str], stats: dict[str, Any]) -> None:
+    tiers = [(tier, stats.get(tier) or {}) for tier in ("memory", "redis")]
+    for metric, kind in [("hits", "counter"), ("misses", "counter"), ("evictions", "counter"), ("expirations", "counter"), ("entries", "gauge"), ("bytes", "gauge")]:
+        name = f"cache_{metric}_total" if kind == "counter" else f"cache_{metric}"
+        _header(lines, name, kind, f"Cache {metric} per tier and namespace.")
+        for tier, namespaces in tiers:
+            for namespace, values in sorted(namespaces.items()):
+                lines.append(f'{PREFIX}_{name}{{tier="{tier}",namespace="{namespace}"}} {values.get(metric, 0)}')
+
+
+def _header(lines: list[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+    lines.append(f"# TYPE {PREFIX}_{name} {kind}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
 from typing import Any
@@ -11,8 +12,14 @@ from app.config import Settings
 from app.models.ticket import Ticket
 from app.services.cache_service import CacheService
 from app.services.embedding_service import EmbeddingService
+from app.services.metrics import NULL_TRACE, ChatTrace
 from app.services.text_utils import stable_hash, tokenize
-from app.services.vector_store import IndexedChunk, VectorStore
+from app.services.vector_store import FILTER_FIELDS, IndexedChunk, VectorStore
+
+# Unquoted values stop at whitespace and sentence punctuation, so "status:Blocked?" filters on "Blocked".
+FILTER_RE = re.compile(rf'\b({"|".join(FILTER_FIELDS)}):("[^"]*"|[^\s,;?!]*[^\s,;?!.])', re.IGNORECASE)
+# Words left over from queries like "show all status:blocked tickets" that carry no search intent.
+FILTER_FILLER = {"show", "list", "find", "all", "me", "which", "what", "are", "is", "the", "with", "and", "in", "tickets", "ticket", "issues"}
 
 
 @dataclass(frozen=True)
@@ -58,22 +65,36 @@ class Retriever:
     def select_mode(self, query: str) -> str:
         if self.extract_ticket_ids(query):
             return "ticket_lookup"
-        if any(token in query.lower() for token in ["status:", "priority:", "assignee:", "label:", "sprint:"]):
+        if FILTER_RE.search(query):
             return "metadata_filter"
         return "hybrid"
 
-    def retrieve(self, db: Session, query: str, filters: dict | None = None, top_k: int | None = None) -> tuple[str, list[RetrievalResult]]:
+    def retrieve(
+        self,
+        db: Session,
+        query: str,
+        filters: dict | None = None,
+        top_k: int | None = None,
+        trace: ChatTrace = NULL_TRACE,
+    ) -> tuple[str, list[RetrievalResult]]:
         top_k = top_k or self.settings.retrieval_top_k
         mode = self.select_mode(query)
         index_version = self.index_version()
         cache_key = stable_hash({"query": query.lower().strip(), "filters": filters or {}, "top_k": top_k, "version": index_version})
         cached = self.cache.get("retrieval", cache_key)
         if cached:
-            return mode, [RetrievalResult(**item, reasons=tuple(item["reasons"])) for item in cached]
+            trace.count("retrieval_cache_hits")
+            return mode, [RetrievalResult(**{**item, "reasons": tuple(item["reasons"])}) for item in cached]
         if mode == "ticket_lookup":
             results = self._ticket_lookup(db, self.extract_ticket_ids(query))
+        elif mode == "metadata_filter":
+            text, merged = self.parse_filters(query, filters)
+            if set(tokenize(text)) <= FILTER_FILLER:
+                results = self._filter_only(merged, top_k, trace)
+            else:
+                results = self._hybrid_search(text, filters=merged, top_k=top_k, trace=trace)
         else:
-            results = self._hybrid_search(query, filters=filters)
+            results = self._hybrid_search(query, filters=filters, top_k=top_k, trace=trace)
         results = self._dedupe_ticket_chunks(results)[:top_k]
         self.cache.set(
             "retrieval",
@@ -93,6 +114,37 @@ class Retriever:
         )
         return mode, results
 
+    def parse_filters(self, query: str, filters: dict | None = None) -> tuple[str, dict]:
+        """Split ``field:value`` terms out of ``query``; explicit ``filters`` win over query terms."""
+        parsed = {field.lower(): value.strip('"') for field, value in FILTER_RE.findall(query)}
+        return FILTER_RE.sub(" ", query), {**parsed, **(filters or {})}
+
+    def _filter_only(self, filters: dict, top_k: int, trace: ChatTrace = NULL_TRACE) -> list[RetrievalResult]:
+        # Pure filter queries are answered from the facet sets; every match is exact, so nothing is scored.
+        best: dict[str, IndexedChunk] = {}
+        for chunk_id in self.vector_store.filter_candidates(filters) or ():
+            chunk = self.vector_store.get(chunk_id)
+            if chunk is None:
+                continue
+            current = best.get(chunk.ticket_id)
+            if current is None or (chunk.section != "overview", chunk.chunk_id) < (current.section != "overview", current.chunk_id):
+                best[chunk.ticket_id] = chunk
+        trace.count("chunks_filtered", len(best))
+        newest = sorted(best.values(), key=lambda chunk: chunk.ticket_id)
+        newest.sort(key=lambda chunk: str(chunk.metadata.get("updated_at") or ""), reverse=True)
+        return [
+            RetrievalResult(
+                ticket_id=chunk.ticket_id,
+                chunk_id=chunk.chunk_id,
+                section=chunk.section,
+                text=chunk.text,
+                metadata=chunk.metadata,
+                score=1.0,
+                reasons=("metadata_filter",),
+            )
+            for chunk in newest[:top_k]
+        ]
+
     def _ticket_lookup(self, db: Session, ticket_ids: list[str]) -> list[RetrievalResult]:
         tickets = db.query(Ticket).options(selectinload(Ticket.comments)).filter(Ticket.ticket_id.in_(ticket_ids)).all()
         results = []
@@ -111,20 +163,45 @@ class Retriever:
             )
         return results
 
-    def _hybrid_search(self, query: str, filters: dict | None = None) -> list[RetrievalResult]:
+    def _hybrid_search(
+        self,
+        query: str,
+        filters: dict | None = None,
+        top_k: int | None = None,
+        trace: ChatTrace = NULL_TRACE,
+    ) -> list[RetrievalResult]:
         query_tokens = set(tokenize(query))
         query_vector = self.embedding_service.embed(query)
-        results = []
-        for chunk in self.vector_store.chunks:
-            if filters and not self._matches_filters(chunk, filters):
+        allowed = self.vector_store.filter_candidates(filters)
+        if allowed is not None and not allowed:
+            return []
+        keyword_scores = self._keyword_scores(query_tokens)
+        candidate_ids = set(keyword_scores) | self._metadata_candidates(query_tokens)
+        if allowed is not None:
+            candidate_ids &= allowed
+        vector_scores = self.vector_store.vector_scores(
+            query_vector,
+            limit=max(self.settings.vector_candidate_pool, top_k or 0),
+            include=candidate_ids,
+            within=allowed,
+        )
+        candidate_ids |= set(vector_scores)
+        trace.count("chunks_scored", len(candidate_ids))
+
+        best: dict[str, RetrievalResult] = {}
+        for chunk_id in candidate_ids:
+            chunk = self.vector_store.get(chunk_id)
+            if chunk is None:
                 continue
-            chunk_tokens = set(tokenize(chunk.text))
-            keyword_score = len(query_tokens & chunk_tokens) / max(len(query_tokens), 1)
-            vector_score = self.embedding_service.cosine(query_vector, chunk.vector)
+            keyword_score = keyword_scores.get(chunk_id, 0.0)
+            vector_score = vector_scores.get(chunk_id, 0.0)
             metadata_score = self._metadata_score(query_tokens, chunk.metadata)
             score = (0.55 * keyword_score) + (0.35 * vector_score) + metadata_score
             if score <= 0:
                 continue
+            current = best.get(chunk.ticket_id)
+            if current is not None and (current.score > score or (current.score == score and current.chunk_id < chunk_id)):
+                continue
             reasons = []
             if keyword_score:
                 reasons.append("keyword")
@@ -132,27 +209,36 @@ class Retriever:
                 reasons.append("vector")
             if metadata_score:
                 reasons.append("metadata")
-            results.append(
-                RetrievalResult(
-                    ticket_id=chunk.ticket_id,
-                    chunk_id=chunk.chunk_id,
-                    section=chunk.section,
-                    text=chunk.text,
-                    metadata=chunk.metadata,
-                    score=score,
-                    reasons=tuple(reasons),
-                )
+            best[chunk.ticket_id] = RetrievalResult(
+                ticket_id=chunk.ticket_id,
+                chunk_id=chunk.chunk_id,
+                section=chunk.section,
+                text=chunk.text,
+                metadata=chunk.metadata,
+                score=score,
+                reasons=tuple(reasons),
             )
-        return sorted(results, key=lambda item: item.score, reverse=True)
+        ranked = sorted(best.values(), key=lambda item: item.chunk_id)
+        return heapq.nlargest(top_k or len(ranked), ranked, key=lambda item: item.score)
+
+    def _keyword_scores(self, query_tokens: set[str]) -> dict[str, float]:
+        if self.settings.keyword_scorer == "bm25":
+            return self.vector_store.bm25_scores(query_tokens, k1=self.settings.bm25_k1, b=self.settings.bm25_b)
+        overlaps = self.vector_store.keyword_overlaps(query_tokens)
+        return {chunk_id: count / max(len(query_tokens), 1) for chunk_id, count in overlaps.items()}
 
-    def _matches_filters(self, chunk: IndexedChunk, filters: dict) -> bool:
-        metadata = chunk.metadata
-        for field in ["status", "priority", "assignee", "sprint", "project_key"]:
-            if filters.get(field) and str(metadata.get(field) or "").lower() != str(filters[field]).lower():
-                return False
-        if filters.get("label") and str(filters["label"]).lower() not in set(metadata.get("labels") or []):
-            return False
-        return True
+    def _metadata_candidates(self, query_tokens: set[str]) -> set[str]:
+        candidates: set[str] = set()
+        if "blocked" in query_tokens:
+            candidates |= self.vector_store.facet("status", "blocked") | self.vector_store.facet("status", "escalated")
+        if query_tokens & {"critical", "highest", "high"}:
+            for priority in ["critical", "highest", "high"]:
+                candidates |= self.vector_store.facet("priority", priority)
+        if "unassigned" in query_tokens:
+            candidates |= self.vector_store.facet("assignee", "")
+        for token in query_tokens:
+            candidates |= self.vector_store.facet("label", token)
+        return candidates
 
     def _metadata_score(self, query_tokens: set[str], metadata: dict[str, Any]) -> float:
         score = 0.0
@@ -192,4 +278,7 @@ class Retriever:
         }
 
     def index_version(self) -> str:
-        return stable_hash({item.chunk_id: item.content_hash for item in self.vector_store.chunks})
+        return self.vector_store.index_version
+
+    def reindexing(self) -> bool:
+        return self.vector_store.rebuilding
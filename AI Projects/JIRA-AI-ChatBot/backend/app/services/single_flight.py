@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Flight(Generic[T]):
+    done: threading.Event = field(default_factory=threading.Event)
+    result: T | None = None
+
+    def wait(self, timeout: float | None) -> T | None:
+        self.done.wait(timeout)
+        return self.result
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, Flight[T]] = {}
+        self.shared = 0
+
+    def begin(self, key: str) -> tuple[bool, Flight[T]]:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.shared += 1
+                return False, flight
+            flight = self._flights[key] = Flight()
+            return True, flight
+
+    def finish(self, key: str, flight: Flight[T], result: T | None) -> None:
+        # A None result (leader failed or was cancelled) wakes followers so they compute on their own.
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.result = result
+        flight.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
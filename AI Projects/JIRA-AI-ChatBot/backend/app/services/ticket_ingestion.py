@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session, lazyload, selectinload
 
+from app.models.sync import SyncState
 from app.models.ticket import Ticket, TicketComment
 from app.services.jira_client import JiraClient
 from app.services.text_utils import stable_hash
@@ -26,6 +29,17 @@ class SyncResult:
     def changed_count(self) -> int:
         return self.created + self.updated
 
+    @classmethod
+    def merge(cls, results: list["SyncResult"]) -> "SyncResult":
+        return cls(
+            fetched=sum(result.fetched for result in results),
+            created=sum(result.created for result in results),
+            updated=sum(result.updated for result in results),
+            unchanged=sum(result.unchanged for result in results),
+            skipped=sum(result.skipped for result in results),
+            changed_ticket_ids=[ticket_id for result in results for ticket_id in result.changed_ticket_ids],
+        )
+
     def as_dict(self) -> dict:
         return {
             "fetched": self.fetched,
@@ -38,6 +52,22 @@ class SyncResult:
         }
 
 
+def _batches(items: list, size: int) -> list[list]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
 class TicketIngestionService:
     def __init__(self, jira_client: JiraClient, preprocessor: TicketPreprocessor) -> None:
         self.jira_client = jira_client
@@ -46,67 +76,91 @@ class TicketIngestionService:
     def sync_mock(self, db: Session) -> SyncResult:
         return self._sync_raw(db, self.jira_client.fetch_mock_tickets())
 
-    def sync_real_jira(self, db: Session, updated_since: str | None = None) -> SyncResult:
-        return self._sync_raw(db, self.jira_client.fetch_real_tickets(updated_since=updated_since))
+    def sync_real_jira(self, db: Session, updated_since: str | None = None, incremental: bool = False) -> SyncResult:
+        settings = self.jira_client.settings
+        state = db.get(SyncState, self._watermark_name())
+        latest = _parse_timestamp(state.value) if state is not None else None
+        if updated_since is None and incremental and latest is not None:
+            # JQL dates use minute precision in the Jira user's timezone, so step back far enough to cover both.
+            since = latest - timedelta(minutes=settings.jira_watermark_overlap_minutes)
+            updated_since = since.strftime("%Y/%m/%d %H:%M")
+        results = []
+        for page in self.jira_client.iter_real_ticket_pages(updated_since=updated_since):
+            results.append(self._sync_raw(db, page))
+            for raw in page:
+                timestamp = _parse_timestamp(raw.get("updated_at"))
+                if timestamp is not None and (latest is None or timestamp > latest):
+                    latest = timestamp
+        if latest is not None:
+            if state is None:
+                state = SyncState(name=self._watermark_name(), value="")
+                db.add(state)
+            state.value = latest.isoformat()
+            db.commit()
+        return SyncResult.merge(results)
+
+    def watermark(self, db: Session) -> str | None:
+        state = db.get(SyncState, self._watermark_name())
+        return state.value if state is not None else None
+
+    def _watermark_name(self) -> str:
+        return f"jira:{self.jira_client.settings.jira_project_key}:updated"
 
     def sync_raw(self, db: Session, raw_tickets: list[dict]) -> SyncResult:
         return self._sync_raw(db, raw_tickets)
 
     def _sync_raw(self, db: Session, raw_tickets: list[dict]) -> SyncResult:
+        batch_size = max(1, self.jira_client.settings.ingest_batch_size)
         created = 0
         updated = 0
         unchanged = 0
         skipped = 0
         changed_ticket_ids: list[str] = []
+        incoming: list[tuple[dict, str]] = []
         for raw in raw_tickets:
             data = self.preprocessor.normalize_raw_ticket(raw)
             if not data["ticket_id"]:
                 skipped += 1
                 continue
-            ticket = db.get(Ticket, data["ticket_id"])
-            if ticket is None:
-                ticket = Ticket(ticket_id=data["ticket_id"], project_key=data["project_key"])
-                db.add(ticket)
+            incoming.append((data, self._data_fingerprint(data)))
+
+        fingerprints = self._stored_fingerprints(db, [data["ticket_id"] for data, _ in incoming], batch_size)
+        existing_ids = set(fingerprints)
+        pending: dict[str, tuple[dict, str]] = {}
+        for data, fingerprint in incoming:
+            ticket_id = data["ticket_id"]
+            if ticket_id not in fingerprints:
                 created += 1
-                changed_ticket_ids.append(data["ticket_id"])
-            elif self._ticket_fingerprint(ticket) == self._data_fingerprint(data):
+            elif fingerprints[ticket_id] == fingerprint:
                 unchanged += 1
                 continue
             else:
                 updated += 1
-                changed_ticket_ids.append(data["ticket_id"])
-
-            for field in [
-                "project_key",
-                "summary",
-                "description",
-                "status",
-                "priority",
-                "assignee",
-                "reporter",
-                "labels",
-                "sprint",
-                "created_at",
-                "updated_at",
-                "resolution",
-                "issue_type",
-                "parent_ticket",
-                "linked_issues",
-                "components",
-                "acceptance_criteria",
-                "custom_fields",
-            ]:
-                setattr(ticket, field, data[field])
-            ticket.comments.clear()
-            for item in data["comments"]:
-                ticket.comments.append(
-                    TicketComment(
-                        author=item["author"],
-                        body=item["body"] or "",
-                        created_at=item["created_at"],
-                        body_hash=item["body_hash"] or stable_hash(item["body"]),
-                    )
-                )
+            changed_ticket_ids.append(ticket_id)
+            fingerprints[ticket_id] = fingerprint
+            pending[ticket_id] = (data, fingerprint)
+
+        inserts = [self._ticket_row(data, fingerprint) for ticket_id, (data, fingerprint) in pending.items() if ticket_id not in existing_ids]
+        updates = [self._ticket_row(data, fingerprint) for ticket_id, (data, fingerprint) in pending.items() if ticket_id in existing_ids]
+        comments = [
+            {
+                "ticket_id": ticket_id,
+                "author": item["author"],
+                "body": item["body"] or "",
+                "created_at": item["created_at"],
+                "body_hash": item["body_hash"] or stable_hash(item["body"]),
+            }
+            for ticket_id, (data, _) in pending.items()
+            for item in data["comments"]
+        ]
+        for batch in _batches(inserts, batch_size):
+            db.execute(insert(Ticket), batch)
+        for batch in _batches(updates, batch_size):
+            db.execute(update(Ticket), batch)
+        for batch in _batches([row["ticket_id"] for row in updates], batch_size):
+            db.execute(delete(TicketComment).where(TicketComment.ticket_id.in_(batch)))
+        for batch in _batches(comments, batch_size):
+            db.execute(insert(TicketComment), batch)
         db.commit()
         logger.info(
             "ticket ingestion completed fetched=%s created=%s updated=%s unchanged=%s skipped=%s",
@@ -125,6 +179,56 @@ class TicketIngestionService:
             changed_ticket_ids=changed_ticket_ids,
         )
 
+    def _stored_fingerprints(self, db: Session, ticket_ids: list[str], batch_size: int) -> dict[str, str | None]:
+        fingerprints: dict[str, str | None] = {}
+        for batch in _batches(sorted(set(ticket_ids)), batch_size):
+            rows = db.execute(select(Ticket.ticket_id, Ticket.fingerprint).where(Ticket.ticket_id.in_(batch)))
+            fingerprints.update({ticket_id: fingerprint for ticket_id, fingerprint in rows})
+        legacy = [ticket_id for ticket_id, fingerprint in fingerprints.items() if fingerprint is None]
+        for batch in _batches(legacy, batch_size):
+            # Rows written before the fingerprint column existed are hashed once and backfilled.
+            tickets = db.scalars(select(Ticket).where(Ticket.ticket_id.in_(batch)).options(selectinload(Ticket.comments), lazyload(Ticket.chunks)))
+            backfill = [
+                {"ticket_id": ticket.ticket_id, "fingerprint": self._ticket_fingerprint(ticket)}
+                | self._derived_columns(ticket.status, ticket.priority, ticket.updated_at)
+                for ticket in tickets
+            ]
+            db.execute(update(Ticket), backfill)
+            fingerprints.update({row["ticket_id"]: row["fingerprint"] for row in backfill})
+        return fingerprints
+
+    def backfill_derived_columns(self, db: Session) -> int:
+        batch_size = max(1, self.jira_client.settings.ingest_batch_size)
+        rows = db.execute(
+            select(Ticket.ticket_id, Ticket.status, Ticket.priority, Ticket.updated_at).where(Ticket.status_key.is_(None))
+        ).all()
+        updates = [
+            {"ticket_id": ticket_id} | self._derived_columns(status, priority, updated_at)
+            for ticket_id, status, priority, updated_at in rows
+        ]
+        for batch in _batches(updates, batch_size):
+            db.execute(update(Ticket), batch)
+        db.commit()
+        if updates:
+            logger.info("ticket derived columns backfilled rows=%s", len(updates))
+        return len(updates)
+
+    @classmethod
+    def _ticket_row(cls, data: dict, fingerprint: str) -> dict:
+        row = {key: value for key, value in data.items() if key != "comments"}
+        row["fingerprint"] = fingerprint
+        return row | cls._derived_columns(data["status"], data["priority"], data["updated_at"])
+
+    @staticmethod
+    def _derived_columns(status: str | None, priority: str | None, updated_at: str | None) -> dict:
+        # Lowercased keys and a real timestamp let analytics filter and sort in SQL.
+        updated_ts = _parse_timestamp(updated_at)
+        return {
+            "status_key": (status or "").lower(),
+            "priority_key": (priority or "").lower(),
+            "updated_ts": updated_ts.replace(tzinfo=None) if updated_ts is not None else None,
+        }
+
     def _ticket_fingerprint(self, ticket: Ticket) -> str:
         return stable_hash(
             {
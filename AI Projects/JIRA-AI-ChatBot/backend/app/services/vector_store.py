@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import heapq
 import logging
+import math
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session, lazyload, selectinload
 
 from app.models.ticket import Ticket, TicketChunk, TicketEmbeddingMetadata
 from app.services.embedding_service import EmbeddingService, Vector
@@ -13,6 +18,9 @@ from app.services.ticket_preprocessor import ChunkPayload, TicketPreprocessor
 
 logger = logging.getLogger(__name__)
 
+# Retrieval filter keys; each is also a facet field, so a filter is one set lookup.
+FILTER_FIELDS = ("status", "priority", "assignee", "sprint", "project_key", "label")
+
 
 @dataclass(frozen=True)
 class IndexedChunk:
@@ -25,54 +33,118 @@ class IndexedChunk:
     vector: Vector
 
 
+@dataclass(frozen=True)
+class IndexProgress:
+    tickets_done: int
+    tickets_total: int
+    chunks_indexed: int
+    elapsed_seconds: float
+
+
+ProgressCallback = Callable[[IndexProgress], None]
+
+
 class VectorStore:
     def __init__(self, embedding_service: EmbeddingService, preprocessor: TicketPreprocessor) -> None:
         self.embedding_service = embedding_service
         self.preprocessor = preprocessor
         self._chunks: dict[str, IndexedChunk] = {}
+        self._ticket_chunks: dict[str, set[str]] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._facets: dict[tuple[str, str], set[str]] = {}
+        # BM25 document statistics: raw token counts and token lengths per chunk.
+        self._term_counts: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._digest = 0
+        self.generation = 0
+        self.load_stats: dict[str, Any] = {}
+        self.rebuild_progress: IndexProgress | None = None
+        self._active_rebuilds = 0
 
     @property
     def chunks(self) -> list[IndexedChunk]:
         return list(self._chunks.values())
 
-    def rebuild(self, db: Session) -> int:
+    @property
+    def index_version(self) -> str:
+        return f"{self._digest:064x}"
+
+    @property
+    def rebuilding(self) -> bool:
+        return self._active_rebuilds > 0
+
+    def get(self, chunk_id: str) -> IndexedChunk | None:
+        return self._chunks.get(chunk_id)
+
+    def postings(self, token: str) -> dict[str, float]:
+        return self._postings.get(token, {})
+
+    def facet(self, field: str, value: str) -> set[str]:
+        return self._facets.get((field, value.lower()), set())
+
+    def keyword_overlaps(self, tokens: set[str]) -> dict[str, int]:
+        overlaps: dict[str, int] = {}
+        for token in tokens:
+            for chunk_id in self.postings(token):
+                overlaps[chunk_id] = overlaps.get(chunk_id, 0) + 1
+        return overlaps
+
+    def bm25_scores(self, tokens: set[str], k1: float = 1.2, b: float = 0.75) -> dict[str, float]:
+        """BM25 scores scaled by the best achievable score for ``tokens`` so they blend with cosine scores."""
+        count = len(self._chunks)
+        if not count:
+            return {}
+        average_length = self._total_length / count or 1.0
+        scores: dict[str, float] = {}
+        ceiling = 0.0
+        for token in tokens:
+            posting = self._postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            ceiling += idf * (k1 + 1)
+            for chunk_id in posting:
+                frequency = self._term_counts[chunk_id][token]
+                norm = k1 * (1 - b + b * self._lengths[chunk_id] / average_length)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+        return {chunk_id: score / ceiling for chunk_id, score in scores.items()}
+
+    def filter_candidates(self, filters: dict | None) -> set[str] | None:
+        """Chunk IDs matching every filter, or None when nothing is filtered."""
+        keys = [(field, str(filters[field]).lower()) for field in FILTER_FIELDS if filters and filters.get(field)]
+        if not keys:
+            return None
+        facets = sorted((self._facets.get(key, set()) for key in keys), key=len)
+        return facets[0].intersection(*facets[1:])
+
+    def vector_scores(
+        self, query_vector: Vector, limit: int, include: set[str] | None = None, within: set[str] | None = None
+    ) -> dict[str, float]:
+        scores: dict[str, float] = {}
+        for token, query_weight in query_vector.items():
+            for chunk_id, weight in self.postings(token).items():
+                if within is None or chunk_id in within:
+                    scores[chunk_id] = scores.get(chunk_id, 0.0) + query_weight * weight
+        if len(scores) <= limit:
+            return scores
+        keep = set(heapq.nlargest(limit, scores, key=scores.__getitem__)) | (include or set())
+        return {chunk_id: score for chunk_id, score in scores.items() if chunk_id in keep}
+
+    def rebuild(self, db: Session, progress: ProgressCallback | None = None) -> int:
         db.query(TicketEmbeddingMetadata).delete()
         db.query(TicketChunk).delete()
-        self._chunks.clear()
-        tickets = db.query(Ticket).options(selectinload(Ticket.comments)).all()
-        count = 0
-        for ticket in tickets:
-            for payload in self.preprocessor.chunk_ticket(ticket):
-                indexed = self._index_payload(payload, ticket)
-                db.add(
-                    TicketChunk(
-                        chunk_id=payload.chunk_id,
-                        ticket_id=payload.ticket_id,
-                        section=payload.section,
-                        text=payload.text,
-                        chunk_metadata=payload.metadata,
-                        content_hash=payload.content_hash,
-                    )
-                )
-                db.add(
-                    TicketEmbeddingMetadata(
-                        chunk_id=payload.chunk_id,
-                        ticket_id=payload.ticket_id,
-                        embedding_model=self.embedding_service.settings.embedding_model,
-                        embedding_hash=stable_hash(indexed.vector),
-                        ticket_updated_at=ticket.updated_at,
-                        comment_count=len(ticket.comments),
-                        status=ticket.status,
-                        description_hash=stable_hash(ticket.description),
-                        embedding_vector=indexed.vector,
-                    )
-                )
-                count += 1
-        db.commit()
+        self._active_rebuilds += 1
+        try:
+            self._clear_index()
+            ticket_ids = list(db.scalars(select(Ticket.ticket_id).order_by(Ticket.ticket_id)))
+            _, count = self._index_tickets(db, ticket_ids, progress)
+        finally:
+            self._active_rebuilds -= 1
         logger.info("vector index rebuilt chunks=%s", count)
         return count
 
-    def rebuild_tickets(self, db: Session, ticket_ids: list[str]) -> int:
+    def rebuild_tickets(self, db: Session, ticket_ids: list[str], progress: ProgressCallback | None = None) -> int:
         normalized_ids = sorted({ticket_id.upper() for ticket_id in ticket_ids if ticket_id})
         if not normalized_ids:
             return 0
@@ -80,66 +152,172 @@ class VectorStore:
             synchronize_session=False
         )
         db.query(TicketChunk).filter(TicketChunk.ticket_id.in_(normalized_ids)).delete(synchronize_session=False)
-        for chunk_id, chunk in list(self._chunks.items()):
-            if chunk.ticket_id in normalized_ids:
-                self._chunks.pop(chunk_id, None)
-
-        tickets = (
-            db.query(Ticket)
-            .options(selectinload(Ticket.comments))
-            .filter(Ticket.ticket_id.in_(normalized_ids))
-            .all()
-        )
-        count = 0
-        for ticket in tickets:
-            for payload in self.preprocessor.chunk_ticket(ticket):
-                indexed = self._index_payload(payload, ticket)
-                db.add(
-                    TicketChunk(
-                        chunk_id=payload.chunk_id,
-                        ticket_id=payload.ticket_id,
-                        section=payload.section,
-                        text=payload.text,
-                        chunk_metadata=payload.metadata,
-                        content_hash=payload.content_hash,
+        self._active_rebuilds += 1
+        try:
+            for ticket_id in normalized_ids:
+                for chunk_id in list(self._ticket_chunks.get(ticket_id, ())):
+                    self._remove_chunk(chunk_id)
+            ticket_count, count = self._index_tickets(db, normalized_ids, progress)
+        finally:
+            self._active_rebuilds -= 1
+        logger.info("vector index incrementally rebuilt ticket_count=%s chunks=%s", ticket_count, count)
+        return count
+
+    def _index_tickets(self, db: Session, ticket_ids: list[str], progress: ProgressCallback | None) -> tuple[int, int]:
+        settings = self.embedding_service.settings
+        batch_size = max(1, settings.index_batch_size)
+        window = max(1, settings.index_commit_window)
+        embedding_model = settings.embedding_model
+        started = time.perf_counter()
+        tickets_done = 0
+        chunks_done = 0
+        for start in range(0, len(ticket_ids), window):
+            tickets = (
+                db.query(Ticket)
+                .options(selectinload(Ticket.comments), lazyload(Ticket.chunks))
+                .filter(Ticket.ticket_id.in_(ticket_ids[start : start + window]))
+                .all()
+            )
+            pending = [(payload, ticket) for ticket in tickets for payload in self.preprocessor.chunk_ticket(ticket)]
+            for offset in range(0, len(pending), batch_size):
+                batch = pending[offset : offset + batch_size]
+                vectors = self.embedding_service.embed_many([payload.text for payload, _ in batch])
+                chunk_rows: list[dict[str, Any]] = []
+                metadata_rows: list[dict[str, Any]] = []
+                for (payload, ticket), vector in zip(batch, vectors):
+                    term_counts = dict(self.embedding_service.term_counts(payload.text))
+                    self._index_payload(payload, vector, term_counts)
+                    chunk_rows.append(
+                        {
+                            "chunk_id": payload.chunk_id,
+                            "ticket_id": payload.ticket_id,
+                            "section": payload.section,
+                            "text": payload.text,
+                            "chunk_metadata": payload.metadata,
+                            "content_hash": payload.content_hash,
+                        }
                     )
-                )
-                db.add(
-                    TicketEmbeddingMetadata(
-                        chunk_id=payload.chunk_id,
-                        ticket_id=payload.ticket_id,
-                        embedding_model=self.embedding_service.settings.embedding_model,
-                        embedding_hash=stable_hash(indexed.vector),
-                        ticket_updated_at=ticket.updated_at,
-                        comment_count=len(ticket.comments),
-                        status=ticket.status,
-                        description_hash=stable_hash(ticket.description),
-                        embedding_vector=indexed.vector,
+                    metadata_rows.append(
+                        {
+                            "chunk_id": payload.chunk_id,
+                            "ticket_id": payload.ticket_id,
+                            "embedding_model": embedding_model,
+                            "embedding_hash": stable_hash(vector),
+                            "ticket_updated_at": ticket.updated_at,
+                            "comment_count": len(ticket.comments),
+                            "status": ticket.status,
+                            "description_hash": stable_hash(ticket.description),
+                            "is_active": True,
+                            "embedding_vector": vector,
+                            "term_counts": term_counts,
+                        }
                     )
-                )
-                count += 1
+                db.execute(insert(TicketChunk), chunk_rows)
+                db.execute(insert(TicketEmbeddingMetadata), metadata_rows)
+            db.commit()
+            tickets_done += len(tickets)
+            chunks_done += len(pending)
+            self.rebuild_progress = IndexProgress(
+                tickets_done=tickets_done,
+                tickets_total=len(ticket_ids),
+                chunks_indexed=chunks_done,
+                elapsed_seconds=round(time.perf_counter() - started, 4),
+            )
+            logger.info(
+                "vector index progress tickets=%s/%s chunks=%s",
+                tickets_done,
+                len(ticket_ids),
+                chunks_done,
+            )
+            if progress is not None:
+                progress(self.rebuild_progress)
         db.commit()
-        logger.info("vector index incrementally rebuilt ticket_count=%s chunks=%s", len(tickets), count)
-        return count
+        return tickets_done, chunks_done
 
     def load_from_db(self, db: Session) -> int:
-        self._chunks.clear()
-        chunks = db.query(TicketChunk).all()
-        for chunk in chunks:
-            vector = self.embedding_service.embed(chunk.text)
-            self._chunks[chunk.chunk_id] = IndexedChunk(
-                chunk_id=chunk.chunk_id,
-                ticket_id=chunk.ticket_id,
-                section=chunk.section,
-                text=chunk.text,
-                metadata=chunk.chunk_metadata or {},
-                content_hash=chunk.content_hash,
-                vector=vector,
+        started = time.perf_counter()
+        self._clear_index()
+        embedding_model = self.embedding_service.settings.embedding_model
+        rows = db.execute(
+            select(
+                TicketChunk.chunk_id,
+                TicketChunk.ticket_id,
+                TicketChunk.section,
+                TicketChunk.text,
+                TicketChunk.chunk_metadata,
+                TicketChunk.content_hash,
+                TicketEmbeddingMetadata.id,
+                TicketEmbeddingMetadata.embedding_model,
+                TicketEmbeddingMetadata.embedding_hash,
+                TicketEmbeddingMetadata.embedding_vector,
+                TicketEmbeddingMetadata.term_counts,
+            ).outerjoin(TicketEmbeddingMetadata, TicketEmbeddingMetadata.chunk_id == TicketChunk.chunk_id)
+        )
+        reused = 0
+        repairs: list[dict[str, Any]] = []
+        reembedded = 0
+        for row in rows:
+            if row.chunk_id in self._chunks:
+                continue
+            vector = row.embedding_vector
+            term_counts = row.term_counts
+            if (
+                row.embedding_model != embedding_model
+                or not vector
+                or stable_hash(vector) != row.embedding_hash
+            ):
+                vector = self.embedding_service.embed(row.text)
+                term_counts = dict(self.embedding_service.term_counts(row.text))
+                reembedded += 1
+                if row.id is not None:
+                    repairs.append(
+                        {
+                            "id": row.id,
+                            "embedding_model": embedding_model,
+                            "embedding_hash": stable_hash(vector),
+                            "embedding_vector": vector,
+                            "term_counts": term_counts,
+                        }
+                    )
+            else:
+                reused += 1
+                if term_counts is None:
+                    # Rows written before term counts were stored; fill them in once.
+                    term_counts = dict(self.embedding_service.term_counts(row.text))
+                    if row.id is not None:
+                        repairs.append({"id": row.id, "term_counts": term_counts})
+            self._add_chunk(
+                IndexedChunk(
+                    chunk_id=row.chunk_id,
+                    ticket_id=row.ticket_id,
+                    section=row.section,
+                    text=row.text,
+                    metadata=row.chunk_metadata or {},
+                    content_hash=row.content_hash,
+                    vector=vector,
+                ),
+                term_counts,
             )
+        if repairs:
+            db.execute(update(TicketEmbeddingMetadata), repairs)
+            db.commit()
+        self.load_stats = {
+            "loaded_chunks": len(self._chunks),
+            "reused_vectors": reused,
+            "reembedded_chunks": reembedded,
+            "repaired_metadata_rows": len(repairs),
+            "load_seconds": round(time.perf_counter() - started, 4),
+        }
+        logger.info(
+            "vector index loaded chunks=%s reused=%s reembedded=%s seconds=%s",
+            len(self._chunks),
+            reused,
+            reembedded,
+            self.load_stats["load_seconds"],
+        )
         return len(self._chunks)
 
-    def _index_payload(self, payload: ChunkPayload, ticket: Ticket) -> IndexedChunk:
-        vector = self.embedding_service.embed(payload.text)
+    def _index_payload(self, payload: ChunkPayload, vector: Vector, term_counts: dict[str, int]) -> IndexedChunk:
         indexed = IndexedChunk(
             chunk_id=payload.chunk_id,
             ticket_id=payload.ticket_id,
@@ -149,5 +327,79 @@ class VectorStore:
             content_hash=payload.content_hash,
             vector=vector,
         )
-        self._chunks[payload.chunk_id] = indexed
+        self._add_chunk(indexed, term_counts)
         return indexed
+
+    def _add_chunk(self, chunk: IndexedChunk, term_counts: dict[str, int] | None = None) -> None:
+        """Index ``chunk``; ``term_counts`` are its stored BM25 token counts, tokenized from the text when missing."""
+        if chunk.chunk_id in self._chunks:
+            self._remove_chunk(chunk.chunk_id)
+        self._chunks[chunk.chunk_id] = chunk
+        self._digest ^= self._chunk_digest(chunk)
+        self.generation += 1
+        self._ticket_chunks.setdefault(chunk.ticket_id, set()).add(chunk.chunk_id)
+        for token, weight in chunk.vector.items():
+            self._postings.setdefault(token, {})[chunk.chunk_id] = weight
+        if term_counts is None:
+            term_counts = dict(self.embedding_service.term_counts(chunk.text))
+        length = sum(term_counts.values())
+        self._term_counts[chunk.chunk_id] = term_counts
+        self._lengths[chunk.chunk_id] = length
+        self._total_length += length
+        for key in self._facet_keys(chunk.metadata):
+            self._facets.setdefault(key, set()).add(chunk.chunk_id)
+
+    def _remove_chunk(self, chunk_id: str) -> None:
+        chunk = self._chunks.pop(chunk_id, None)
+        if chunk is None:
+            return
+        self._digest ^= self._chunk_digest(chunk)
+        self.generation += 1
+        siblings = self._ticket_chunks.get(chunk.ticket_id)
+        if siblings is not None:
+            siblings.discard(chunk_id)
+            if not siblings:
+                self._ticket_chunks.pop(chunk.ticket_id, None)
+        for token in chunk.vector:
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(chunk_id, None)
+            if not posting:
+                self._postings.pop(token, None)
+        self._term_counts.pop(chunk_id, None)
+        self._total_length -= self._lengths.pop(chunk_id, 0)
+        for key in self._facet_keys(chunk.metadata):
+            members = self._facets.get(key)
+            if members is None:
+                continue
+            members.discard(chunk_id)
+            if not members:
+                self._facets.pop(key, None)
+
+    def _clear_index(self) -> None:
+        self._chunks.clear()
+        self._digest = 0
+        self.generation += 1
+        self._ticket_chunks.clear()
+        self._postings.clear()
+        self._term_counts.clear()
+        self._lengths.clear()
+        self._total_length = 0
+        self._facets.clear()
+
+    @staticmethod
+    def _chunk_digest(chunk: IndexedChunk) -> int:
+        return int(stable_hash([chunk.chunk_id, chunk.content_hash]), 16)
+
+    @staticmethod
+    def _facet_keys(metadata: dict[str, Any]) -> list[tuple[str, str]]:
+        keys = [
+            ("status", str(metadata.get("status") or "").lower()),
+            ("priority", str(metadata.get("priority") or "").lower()),
+            ("assignee", str(metadata.get("assignee") or "").lower()),
+            ("sprint", str(metadata.get("sprint") or "").lower()),
+            ("project_key", str(metadata.get("project_key") or "").lower()),
+        ]
+        keys.extend(("label", str(label).lower()) for label in metadata.get("labels") or [])
+        return keys
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from app.config import Settings
 from app.database import Base
 from app.dependencies import ServiceContainer
-from app.models import ChatMessage, ChatSession, Ticket, TicketChunk, TicketComment, TicketEmbeddingMetadata  # noqa: F401
+from app.models import ChatMessage, ChatSession, SyncState, Ticket, TicketChunk, TicketComment, TicketEmbeddingMetadata  # noqa: F401
 
 
 ROOT = Path(__file__).resolve().parents[3]
@@ -22,6 +22,7 @@ def test_settings() -> Settings:
         auto_sync_mock=False,
         mock_jira_data_path=ROOT / "sample_data" / "jira_tickets.json",
         token_budget_chars=2500,
+        chat_history_write_behind=False,
     )
 
 
@@ -1,12 +1,41 @@
 from __future__ import annotations
 
 import unittest
+from dataclasses import replace
 
-from app.services.cache_service import CacheService
+from app.services.cache_service import CacheService, MemoryTier, NamespaceLimit
 from app.services.guardrails import Guardrails
 from app.tests.helpers import test_settings
 
 
+class RecordingRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.round_trips = 0
+
+    def get(self, key: str) -> str | None:
+        self.round_trips += 1
+        return self.data.get(key)
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value
+
+    def incr(self, key: str) -> int:
+        self.round_trips += 1
+        self.data[key] = str(int(self.data.get(key) or 0) + 1)
+        return int(self.data[key])
+
+    def pipeline(self, transaction: bool = True) -> "RecordingRedis":
+        return self
+
+    def execute(self) -> None:
+        self.round_trips += 1
+
+
 class CacheAndGuardrailTests(unittest.TestCase):
     def test_cache_key_generation_is_stable(self) -> None:
         cache = CacheService(test_settings())
@@ -14,6 +43,52 @@ class CacheAndGuardrailTests(unittest.TestCase):
         right = cache.make_key("retrieval", {"top_k": 5, "q": "blocked"})
         self.assertEqual(left, right)
 
+    def test_memory_tier_evicts_least_recently_used_entry(self) -> None:
+        cache = CacheService(replace(test_settings(), cache_namespace_limits="embeddings:2:1000000"))
+        cache.set("embeddings", "a", {"x": 1.0})
+        cache.set("embeddings", "b", {"y": 1.0})
+        self.assertIsNotNone(cache.get("embeddings", "a"))
+        cache.set("embeddings", "c", {"z": 1.0})
+
+        self.assertIsNone(cache.get("embeddings", "b"))
+        self.assertEqual(cache.get("embeddings", "a"), {"x": 1.0})
+        stats = cache.stats()["memory"]["embeddings"]
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_memory_tier_lfu_keeps_frequent_entries_within_byte_budget(self) -> None:
+        tier = MemoryTier(NamespaceLimit(max_entries=10, max_bytes=30), policy="lfu")
+        tier.set("answers", "hot", "h", size=10)
+        tier.set("answers", "warm", "w", size=10)
+        tier.get("answers", "hot")
+        tier.get("answers", "hot")
+        tier.get("answers", "warm")
+        tier.set("answers", "cold", "c", size=10)
+        tier.set("answers", "new", "n", size=10)
+
+        self.assertEqual(tier.get("answers", "cold"), (False, None))
+        self.assertEqual(tier.get("answers", "hot"), (True, "h"))
+        self.assertEqual(tier.stats()["answers"]["bytes"], 30)
+
+    def test_redis_batch_lookup_and_namespace_generation_invalidation(self) -> None:
+        cache = CacheService(test_settings())
+        fake = RecordingRedis()
+        cache._redis = fake
+        cache.set_many("embeddings", {"a": {"x": 1.0}, "b": {"y": 1.0}})
+        cache.set("answers", "q", {"answer": "kept"})
+        fake.round_trips = 0
+
+        self.assertEqual(cache.get_many("embeddings", ["a", "b", "c"]), {"a": {"x": 1.0}, "b": {"y": 1.0}})
+        self.assertEqual(fake.round_trips, 1)
+
+        cache.clear("embeddings")
+        self.assertEqual(cache.get_many("embeddings", ["a", "b"]), {})
+        self.assertEqual(cache.get("answers", "q"), {"answer": "kept"})
+        cache.set("embeddings", "a", {"x": 2.0})
+        self.assertEqual(cache.get("embeddings", "a"), {"x": 2.0})
+
     def test_guardrail_not_enough_information_format(self) -> None:
         answer = Guardrails().not_enough_information()
         self.assertIn("The available Jira ticket data does not contain enough information", answer)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import unittest
+import urllib.parse
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.dependencies import ServiceContainer
+from app.models.ticket import Ticket
+from app.tests.helpers import close_db, make_db, test_settings
+
+
+class StubJira:
+    def __init__(self, count: int, max_results: int) -> None:
+        self.max_results = max_results
+        self.issues = [self.issue(number, "2026-06-01T10:00:00.000+0000") for number in range(1, count + 1)]
+        self.requests: list[dict[str, str]] = []
+        self.connections: set[tuple[str, int]] = set()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def issue(number: int, updated: str) -> dict:
+        return {
+            "key": f"STUB-{number}",
+            "fields": {
+                "summary": f"Stub issue {number}",
+                "description": "Payment retry timeout",
+                "status": {"name": "Open"},
+                "priority": {"name": "High"},
+                "updated": updated,
+                "created": "2026-05-01T10:00:00.000+0000",
+            },
+        }
+
+    def search(self, params: dict[str, str], client: tuple[str, int]) -> dict:
+        with self.lock:
+            self.requests.append(params)
+            self.connections.add(client)
+        issues = self.issues
+        match = re.search(r'updated >= "([^"]+)"', params["jql"])
+        if match:
+            since = match.group(1).replace("/", "-")
+            issues = [issue for issue in issues if issue["fields"]["updated"][:16].replace("T", " ") >= since]
+        start_at = int(params["startAt"])
+        size = min(int(params["maxResults"]), self.max_results)
+        return {"startAt": start_at, "maxResults": size, "total": len(issues), "issues": issues[start_at : start_at + size]}
+
+    def serve(self) -> ThreadingHTTPServer:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                parsed = urllib.parse.urlsplit(self.path)
+                params = dict(urllib.parse.parse_qsl(parsed.query))
+                body = json.dumps(stub.search(params, self.client_address)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class JiraFetchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stub = StubJira(count=45, max_results=10)
+        self.server = self.stub.serve()
+        self.settings = replace(
+            test_settings(),
+            jira_base_url=f"http://127.0.0.1:{self.server.server_address[1]}",
+            jira_email="bot@example.com",
+            jira_api_token="token",
+            jira_project_key="STUB",
+            jira_page_size=100,
+            jira_fetch_concurrency=3,
+            jira_watermark_overlap_minutes=0,
+        )
+        self.container = ServiceContainer(self.settings)
+        self.db = make_db()
+
+    def tearDown(self) -> None:
+        close_db(self.db)
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_pages_are_fetched_concurrently_over_reused_connections(self) -> None:
+        pages = list(self.container.jira_client.iter_real_ticket_pages())
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 10, 10, 5])
+        self.assertEqual([ticket["ticket_id"] for page in pages for ticket in page], [f"STUB-{n}" for n in range(1, 46)])
+        self.assertEqual(len(self.stub.requests), 5)
+        self.assertTrue(all(request["maxResults"] == "10" for request in self.stub.requests[1:]))
+        self.assertLessEqual(len(self.stub.connections), 1 + self.settings.jira_fetch_concurrency)
+
+    def test_incremental_sync_uses_persisted_watermark(self) -> None:
+        first = self.container.ingestion.sync_real_jira(self.db)
+        self.assertEqual(first.created, 45)
+        self.assertEqual(self.container.ingestion.watermark(self.db), "2026-06-01T10:00:00+00:00")
+
+        self.stub.issues[6] = StubJira.issue(7, "2026-06-03T08:30:00.000+0000")
+        self.stub.issues[6]["fields"]["status"] = {"name": "Done"}
+        self.stub.requests.clear()
+        second = self.container.ingestion.sync_real_jira(self.db, incremental=True)
+
+        self.assertIn('updated >= "2026/06/01 10:00"', self.stub.requests[0]["jql"])
+        self.assertEqual(second.changed_ticket_ids, ["STUB-7"])
+        self.assertEqual(second.unchanged, 44)
+        self.assertEqual(self.db.get(Ticket, "STUB-7").status, "Done")
+        self.assertEqual(self.container.ingestion.watermark(self.db), "2026-06-03T08:30:00+00:00")
+
+        self.stub.requests.clear()
+        third = self.container.ingestion.sync_real_jira(self.db, incremental=True)
+        self.assertIn('updated >= "2026/06/03 08:30"', self.stub.requests[0]["jql"])
+        self.assertEqual(third.fetched, 1)
+        self.assertEqual(third.changed_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
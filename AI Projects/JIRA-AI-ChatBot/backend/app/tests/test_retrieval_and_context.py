@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import unittest
+from dataclasses import replace
 
+from app.dependencies import ServiceContainer
+from app.models.ticket import Ticket, TicketEmbeddingMetadata
+from app.services import dense_vector_store
+from app.services.dense_vector_store import DenseVectorStore
+from app.services.metrics import ChatTrace
 from app.services.prompt_builder import GROUNDING_RULES, PromptKind
-from app.tests.helpers import close_db, synced_container_and_db
+from app.services.vector_store import IndexedChunk
+from app.tests.helpers import close_db, synced_container_and_db, test_settings
 
 
 class RetrievalAndContextTests(unittest.TestCase):
@@ -24,6 +31,138 @@ class RetrievalAndContextTests(unittest.TestCase):
         self.assertEqual(mode, "ticket_lookup")
         self.assertEqual(results[0].ticket_id, "AICB-104")
 
+    def test_hybrid_search_returns_best_chunk_per_ticket(self) -> None:
+        _, results = self.container.retriever.retrieve(self.db, "blocked launch tickets", top_k=3)
+        self.assertLessEqual(len(results), 3)
+        self.assertEqual(len({item.ticket_id for item in results}), len(results))
+        self.assertEqual([item.score for item in results], sorted((item.score for item in results), reverse=True))
+
+    def test_pure_filter_query_is_answered_from_facets(self) -> None:
+        trace = ChatTrace()
+        mode, results = self.container.retriever.retrieve(self.db, "show priority:critical tickets", trace=trace)
+        self.assertEqual(mode, "metadata_filter")
+        self.assertTrue(results)
+        self.assertTrue(all(item.metadata["priority"].lower() == "critical" for item in results))
+        self.assertEqual({item.reasons for item in results}, {("metadata_filter",)})
+        self.assertNotIn("chunks_scored", trace.counters)
+
+    def test_filter_values_stop_at_sentence_punctuation(self) -> None:
+        retriever = self.container.retriever
+        self.assertEqual(retriever.parse_filters('assignee:"Noah Singh", priority:Critical?')[1], {"assignee": "Noah Singh", "priority": "Critical"})
+        mode, results = retriever.retrieve(self.db, "which tickets are status:Blocked?")
+        self.assertEqual(mode, "metadata_filter")
+        self.assertTrue(results)
+        self.assertTrue(all(item.metadata["status"] == "Blocked" for item in results))
+        self.assertEqual({item.reasons for item in results}, {("metadata_filter",)})
+
+    def test_filtered_search_only_scores_matching_chunks(self) -> None:
+        trace = ChatTrace()
+        filters = {"sprint": "Sprint 24"}
+        allowed = self.container.vector_store.filter_candidates({**filters, "status": "blocked"})
+        _, results = self.container.retriever.retrieve(self.db, "status:blocked redis access", filters=filters, trace=trace)
+        self.assertTrue(results)
+        self.assertTrue(all(item.chunk_id in allowed for item in results))
+        self.assertLessEqual(trace.counters["chunks_scored"], len(allowed))
+
+    def test_inverted_index_drops_postings_for_reindexed_tickets(self) -> None:
+        store = self.container.vector_store
+        self.assertTrue(any(chunk_id.startswith("AICB-104:") for chunk_id in store.postings("aicb-104")))
+        self.db.query(Ticket).filter(Ticket.ticket_id == "AICB-104").delete()
+        self.db.commit()
+        store.rebuild_tickets(self.db, ["AICB-104"])
+        self.assertFalse([chunk_id for chunk_id in store.postings("aicb-104") if chunk_id.startswith("AICB-104:")])
+        self.assertIsNone(store.get("AICB-104:overview"))
+
+    def test_index_version_tracks_content_incrementally(self) -> None:
+        store = self.container.vector_store
+        version = store.index_version
+        generation = store.generation
+        ticket = self.db.get(Ticket, "AICB-104")
+        ticket.summary = "Rewritten summary for version tracking"
+        self.db.commit()
+        store.rebuild_tickets(self.db, ["AICB-104"])
+        self.assertNotEqual(store.index_version, version)
+        self.assertGreater(store.generation, generation)
+
+        store.load_from_db(self.db)
+        reloaded = store.index_version
+        store.rebuild(self.db)
+        self.assertEqual(store.index_version, reloaded)
+        self.assertEqual(self.container.retriever.index_version(), reloaded)
+
+    def test_bm25_statistics_follow_incremental_rebuild(self) -> None:
+        store = self.container.vector_store
+        ticket = self.db.get(Ticket, "AICB-104")
+        ticket.summary = "Zanzibar quota rollout blocked by zanzibar approvals"
+        self.db.commit()
+        store.rebuild_tickets(self.db, ["AICB-104"])
+        incremental = store.bm25_scores({"zanzibar", "blocked"})
+        total_length = store._total_length
+
+        store.rebuild(self.db)
+        self.assertAlmostEqual(store._total_length, total_length)
+        self.assertEqual(incremental.keys(), store.bm25_scores({"zanzibar", "blocked"}).keys())
+        best = max(incremental, key=incremental.get)
+        self.assertTrue(best.startswith("AICB-104:"))
+        self.assertTrue(all(0 < score <= 1 for score in incremental.values()))
+
+    def test_bm25_uses_raw_counts_when_every_token_repeats(self) -> None:
+        store = self.container.vector_store
+        text = "zanzibar zanzibar quokka quokka"
+        store._add_chunk(
+            IndexedChunk(
+                chunk_id="AICB-999:overview",
+                ticket_id="AICB-999",
+                section="overview",
+                text=text,
+                metadata={},
+                content_hash="repeated",
+                vector=store.embedding_service.embed(text),
+            )
+        )
+        self.assertEqual(store._lengths["AICB-999:overview"], 4)
+        self.assertEqual(store._term_counts["AICB-999:overview"], {"zanzibar": 2, "quokka": 2})
+
+    def test_load_from_db_reuses_persisted_vectors(self) -> None:
+        store = self.container.vector_store
+        expected = {chunk.chunk_id: chunk.vector for chunk in store.chunks}
+        stale = self.db.query(TicketEmbeddingMetadata).filter(TicketEmbeddingMetadata.chunk_id == "AICB-104:overview").one()
+        stale.embedding_model = "retired-model"
+        self.db.commit()
+
+        loaded = store.load_from_db(self.db)
+
+        self.assertEqual(loaded, len(expected))
+        self.assertEqual(store.load_stats["reembedded_chunks"], 1)
+        self.assertEqual(store.load_stats["reused_vectors"], len(expected) - 1)
+        self.assertEqual({chunk.chunk_id: chunk.vector for chunk in store.chunks}, expected)
+        self.db.refresh(stale)
+        self.assertEqual(stale.embedding_model, self.container.settings.embedding_model)
+        store.load_from_db(self.db)
+        self.assertEqual(store.load_stats["reembedded_chunks"], 0)
+
+    def test_load_from_db_reuses_persisted_term_counts(self) -> None:
+        store = self.container.vector_store
+        expected = dict(store._term_counts)
+        legacy = self.db.query(TicketEmbeddingMetadata).filter(TicketEmbeddingMetadata.chunk_id == "AICB-104:overview").one()
+        legacy.term_counts = None
+        self.db.commit()
+        tokenized: list[str] = []
+        original = store.embedding_service.term_counts
+        store.embedding_service.term_counts = lambda text: tokenized.append(text) or original(text)
+        try:
+            store.load_from_db(self.db)
+            self.assertEqual(tokenized, [store.get("AICB-104:overview").text])
+            self.assertEqual(store._term_counts, expected)
+            self.db.refresh(legacy)
+            self.assertEqual(legacy.term_counts, expected["AICB-104:overview"])
+
+            store.load_from_db(self.db)
+            self.assertEqual(len(tokenized), 1)
+        finally:
+            store.embedding_service.term_counts = original
+        self.assertEqual(store._total_length, sum(store._lengths.values()))
+
     def test_context_builder_limits_context(self) -> None:
         _, results = self.container.retriever.retrieve(self.db, "blocked launch tickets", top_k=5)
         context, tickets = self.container.context_builder.build(self.db, results)
@@ -36,5 +175,67 @@ class RetrievalAndContextTests(unittest.TestCase):
         self.assertIn("Ticket: AICB-104", prompt)
 
 
+@unittest.skipIf(dense_vector_store.np is None, "numpy is not installed")
+class DenseVectorStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.container, self.db = synced_container_and_db()
+        self.dense = ServiceContainer(replace(test_settings(), vector_backend="numpy"))
+        self.dense.vector_store.rebuild(self.db)
+
+    def tearDown(self) -> None:
+        close_db(self.db)
+
+    def test_numpy_backend_is_selected_from_settings(self) -> None:
+        self.assertIsInstance(self.dense.vector_store, DenseVectorStore)
+        self.assertEqual(len(self.dense.vector_store.chunks), len(self.container.vector_store.chunks))
+
+    def test_dense_scores_match_sparse_nearest_chunks(self) -> None:
+        query_vector = self.container.embedding.embed("blocked release oauth token")
+        sparse = self.container.vector_store.vector_scores(query_vector, limit=3)
+        dense = self.dense.vector_store.vector_scores(query_vector, limit=3)
+        self.assertEqual(set(dense), set(sparse))
+        for chunk_id, score in sparse.items():
+            self.assertAlmostEqual(dense[chunk_id], score, places=5)
+
+    def test_dense_top_chunks_agree_with_sparse_at_default_dimensions(self) -> None:
+        queries = [
+            "blocked release oauth token",
+            "redis cache access",
+            "checkout webhook retries",
+            "citations compliance",
+            "login page error",
+            "database migration failure",
+            "performance regression api latency",
+            "security review pending",
+        ]
+        hits = total = 0
+        for query in queries:
+            query_vector = self.container.embedding.embed(query)
+            sparse = self.container.vector_store.vector_scores(query_vector, limit=10)
+            dense = self.dense.vector_store.vector_scores(query_vector, limit=10)
+            hits += len(set(dense) & set(sparse))
+            total += len(sparse)
+        self.assertEqual(self.dense.vector_store.dimensions, 1024)
+        self.assertGreaterEqual(hits / total, 0.95)
+
+    def test_dense_rows_follow_incremental_rebuild(self) -> None:
+        store = self.dense.vector_store
+        before = len(store.chunks)
+        self.db.query(Ticket).filter(Ticket.ticket_id == "AICB-101").delete()
+        self.db.commit()
+        store.rebuild_tickets(self.db, ["AICB-101"])
+        query_vector = self.dense.embedding.embed("citations compliance")
+        self.assertLess(len(store.chunks), before)
+        self.assertFalse([chunk_id for chunk_id in store.vector_scores(query_vector, limit=50) if chunk_id.startswith("AICB-101:")])
+
+    def test_dense_scores_respect_filter_candidates(self) -> None:
+        query_vector = self.container.embedding.embed("blocked release oauth token")
+        within = self.container.vector_store.filter_candidates({"priority": "high"})
+        sparse = self.container.vector_store.vector_scores(query_vector, limit=3, within=within)
+        dense = self.dense.vector_store.vector_scores(query_vector, limit=3, within=within)
+        self.assertEqual(set(dense), set(sparse))
+        self.assertLessEqual(set(dense), within)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import json
+import tempfile
+import threading
+import time
 import unittest
+from dataclasses import replace
 
-from app.models.ticket import Ticket
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.dependencies import ServiceContainer
+from app.models.chat import ChatMessage, ChatSession
+from app.models.ticket import Ticket, TicketChunk, TicketComment, TicketEmbeddingMetadata
+from app.services.history_writer import ChatHistoryWriter, HistoryRecord
 from app.tests.helpers import close_db, synced_container_and_db
 
 
@@ -17,6 +29,33 @@ class SyncAnalyticsChatTests(unittest.TestCase):
         self.assertEqual(self.db.query(Ticket).count(), 20)
         self.assertGreaterEqual(len(self.container.vector_store.chunks), 20)
 
+    def test_bulk_sync_diffs_by_stored_fingerprint_and_backfills_legacy_rows(self) -> None:
+        raw = json.loads(self.container.settings.mock_data_absolute_path.read_text(encoding="utf-8"))
+        self.db.execute(update(Ticket).where(Ticket.ticket_id.in_(["AICB-101", "AICB-102"])).values(fingerprint=None))
+        self.db.commit()
+        raw[1]["comments"] = [{"author": "Maya Chen", "body": "Replaced comment thread.", "created_at": "2026-06-16T10:00:00Z"}]
+
+        result = self.container.ingestion.sync_raw(self.db, raw)
+
+        self.assertEqual(result.changed_ticket_ids, ["AICB-102"])
+        self.assertEqual(result.unchanged, 19)
+        self.assertIsNone(self.db.scalar(select(Ticket.ticket_id).where(Ticket.fingerprint.is_(None))))
+        bodies = self.db.scalars(select(TicketComment.body).where(TicketComment.ticket_id == "AICB-102")).all()
+        self.assertEqual(bodies, ["Replaced comment thread."])
+
+    def test_streaming_rebuild_commits_in_windows_and_reports_progress(self) -> None:
+        settings = replace(self.container.settings, index_batch_size=4, index_commit_window=6)
+        container = ServiceContainer(settings)
+        updates = []
+
+        count = container.vector_store.rebuild(self.db, progress=updates.append)
+
+        self.assertEqual([item.tickets_done for item in updates], [6, 12, 18, 20])
+        self.assertEqual(updates[-1].chunks_indexed, count)
+        self.assertEqual(self.db.query(TicketChunk).count(), count)
+        self.assertEqual(self.db.query(TicketEmbeddingMetadata).count(), count)
+        self.assertEqual(len(container.vector_store.chunks), count)
+
     def test_analytics_detects_missing_assignee(self) -> None:
         tickets = self.container.analytics.missing_assignee(self.db)
         ids = {ticket.ticket_id for ticket in tickets}
@@ -26,6 +65,18 @@ class SyncAnalyticsChatTests(unittest.TestCase):
         ids = {ticket.ticket_id for ticket in self.container.analytics.blockers(self.db)}
         self.assertTrue({"AICB-104", "AICB-113", "AICB-120"}.issubset(ids))
 
+    def test_analytics_pages_are_filtered_and_counted_in_sql(self) -> None:
+        all_ids = [ticket.ticket_id for ticket in self.container.analytics.high_priority(self.db)]
+
+        tickets, total = self.container.analytics.page(self.db, "high_priority", limit=3, offset=2)
+
+        self.assertEqual(total, len(all_ids))
+        self.assertEqual([ticket.ticket_id for ticket in tickets], all_ids[2:5])
+        self.assertEqual(self.db.get(Ticket, "AICB-101").status_key, self.db.get(Ticket, "AICB-101").status.lower())
+        stale = self.container.analytics.inactive(self.db, days=1)
+        self.assertTrue(stale)
+        self.assertTrue(all(ticket.updated_ts is not None for ticket in stale))
+
     def test_chat_returns_grounded_ticket_solution(self) -> None:
         response = self.container.chat.chat(self.db, "Suggest a solution for AICB-110")
         self.assertIn("AICB-110", response.answer)
@@ -33,6 +84,113 @@ class SyncAnalyticsChatTests(unittest.TestCase):
         self.assertEqual(response.retrieval_mode, "ticket_lookup")
         self.assertEqual(response.confidence, "High")
 
+    def test_stream_chat_yields_retrieval_before_answer_sections(self) -> None:
+        events = list(self.container.chat.stream_chat(self.db, "Suggest a solution for AICB-110"))
+        self.assertEqual(events[0].event, "retrieval")
+        self.assertEqual(events[0].data["ticket_ids"], ["AICB-110"])
+        self.assertEqual(events[-1].event, "done")
+        sections = [event.data["text"] for event in events if event.event == "answer"]
+        self.assertGreater(len(sections), 1)
+        self.assertEqual("\n\n".join(sections), events[-1].data["answer"])
+
+        replayed = list(self.container.chat.stream_chat(self.db, "Suggest a solution for AICB-110"))
+        self.assertTrue(replayed[-1].data["from_cache"])
+        self.assertEqual(replayed[-1].data["answer"], events[-1].data["answer"])
+
+    def test_identical_concurrent_chats_share_one_computation(self) -> None:
+        chat = self.container.chat
+        retrieve = self.container.retriever.retrieve
+        question = "Suggest a solution for AICB-110"
+        calls = []
+        threads = []
+        followers = []
+
+        def slow_retrieve(*args, **kwargs):
+            # The follower never touches the database, so it can run on its own thread.
+            calls.append(args[1])
+            threads.append(threading.Thread(target=lambda: followers.append(chat.chat(self.db, question))))
+            threads[0].start()
+            deadline = time.monotonic() + 5
+            while chat._inflight.shared < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return retrieve(*args, **kwargs)
+
+        self.container.retriever.retrieve = slow_retrieve
+        leader = chat.chat(self.db, question)
+        threads[0].join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(followers), 1)
+        self.assertEqual(followers[0].answer, leader.answer)
+        self.assertFalse(leader.from_cache)
+        self.assertTrue(followers[0].from_cache)
+        self.assertEqual(chat._inflight.in_flight(), 0)
+
+    def test_stale_answer_is_served_while_index_rebuilds(self) -> None:
+        settings = replace(self.container.settings, answer_stale_while_revalidate=True)
+        container = ServiceContainer(settings)
+        container.vector_store.load_from_db(self.db)
+        fresh = container.chat.chat(self.db, "Suggest a solution for AICB-110")
+        container.cache.clear("answers")
+
+        container.vector_store._active_rebuilds = 1
+        stale = container.chat.chat(self.db, "Suggest a solution for AICB-110")
+        container.vector_store._active_rebuilds = 0
+        recomputed = container.chat.chat(self.db, "Suggest a solution for AICB-110")
+
+        self.assertTrue(stale.stale)
+        self.assertTrue(stale.from_cache)
+        self.assertEqual(stale.answer, fresh.answer)
+        self.assertFalse(recomputed.stale)
+        self.assertFalse(recomputed.from_cache)
+
+    def test_debug_timings_trace_stages_and_feed_prometheus_metrics(self) -> None:
+        settings = replace(self.container.settings, chat_debug_timings=True)
+        container = ServiceContainer(settings)
+        container.vector_store.load_from_db(self.db)
+
+        generated = container.chat.chat(self.db, "which tickets mention stale cache answers")
+        cached = container.chat.chat(self.db, "which tickets mention stale cache answers")
+
+        self.assertEqual(generated.debug["outcome"], "generated")
+        self.assertTrue({"index_version", "answer_cache", "retrieval", "context", "prompt", "generate", "store_message"} <= set(generated.debug["stages_ms"]))
+        self.assertGreater(generated.debug["counters"]["chunks_scored"], 0)
+        self.assertEqual(generated.debug["counters"]["tickets_loaded"], len(generated.ticket_ids))
+        self.assertEqual(cached.debug["outcome"], "cache")
+        self.assertNotIn("retrieval", cached.debug["stages_ms"])
+        metrics = container.metrics.render(container.cache.stats(), indexed_chunks=len(container.vector_store.chunks))
+        self.assertIn('jira_chatbot_chat_requests_total{outcome="cache"} 1', metrics)
+        self.assertIn('jira_chatbot_chat_stage_seconds_count{stage="retrieval"} 1', metrics)
+        self.assertIn('jira_chatbot_cache_hits_total{tier="memory",namespace="answers"} 1', metrics)
+        self.assertIsNone(self.container.chat.chat(self.db, "Suggest a solution for AICB-110").debug)
+
+    def test_chat_history_is_written_behind_in_batches_and_flushed_on_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{tmp}/history.db", future=True)
+            Base.metadata.create_all(engine)
+            session_factory = sessionmaker(bind=engine, future=True)
+            with session_factory() as db:
+                db.add(ChatSession(id=7, title="existing"))
+                db.commit()
+            writer = ChatHistoryWriter(session_factory, batch_size=50, flush_interval_ms=50)
+            self.container.chat.history = writer
+
+            for index in range(5):
+                self.container.chat._store_message(self.db, f"question {index}", "answer", ["AICB-101"], "High", 7 if index % 2 else None)
+            writer.flush()
+            self.container.chat._store_message(self.db, "last question", "answer", [], "Low", None)
+            writer.close()
+
+            with session_factory() as db:
+                self.assertEqual(db.query(ChatMessage).count(), 12)
+                self.assertEqual(db.query(ChatMessage).filter(ChatMessage.session_id == 7).count(), 4)
+                self.assertEqual(db.query(ChatSession).count(), 5)
+            self.assertEqual(writer.stats()["written"], 6)
+            self.assertLess(writer.stats()["batches"], 6)
+            self.assertFalse(writer.submit(HistoryRecord(None, "after close", "answer", [], "Low")))
+            engine.dispose()
+        self.assertEqual(self.db.query(ChatMessage).count(), 0)
+
     def test_not_enough_information_for_unknown_ticket(self) -> None:
         response = self.container.chat.chat(self.db, "What is the status of AICB-999?")
         self.assertIn("does not contain enough information", response.answer)
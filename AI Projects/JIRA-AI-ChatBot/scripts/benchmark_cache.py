@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Compare FileCache and SqliteCache on an embedding-shaped write/read/clear workload."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from jira_chatbot.cache import CacheBackend, FileCache, SqliteCache  # noqa: E402
+
+
+def payload(index: int) -> dict[str, float]:
+    return {f"token{(index * 7 + offset) % 997}": 1.0 / (offset + 1) for offset in range(40)}
+
+
+def timed(action: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def run(name: str, cache: CacheBackend, count: int, flush: Callable[[], None]) -> dict[str, float | str]:
+    keys = [f"key-{index}" for index in range(count)]
+
+    def write() -> None:
+        for index, key in enumerate(keys):
+            cache.set("embedding", key, payload(index))
+        flush()
+
+    def read() -> None:
+        for key in keys:
+            cache.get("embedding", key)
+
+    write_seconds = timed(write)
+    read_seconds = timed(read)
+    clear_seconds = timed(lambda: cache.clear("embedding"))
+    return {
+        "backend": name,
+        "entries": count,
+        "write_ops_per_second": round(count / write_seconds),
+        "read_ops_per_second": round(count / read_seconds),
+        "clear_ms": round(clear_seconds * 1000, 2),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark jira_chatbot cache backends.")
+    parser.add_argument("--count", type=int, default=5000, help="Entries written and read per backend.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        file_cache = FileCache(Path(tmp) / "files")
+        results.append(run("file", file_cache, args.count, lambda: None))
+        sqlite_cache = SqliteCache(Path(tmp) / "cache.sqlite3", sweep_interval_seconds=0)
+        results.append(run("sqlite", sqlite_cache, args.count, sqlite_cache.flush))
+        sqlite_cache.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
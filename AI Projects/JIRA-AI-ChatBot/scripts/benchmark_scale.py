@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Benchmark sync, rebuild, search, context building, and chat on synthetic corpora of growing size.
+
+Every scale and target runs in a fresh interpreter so peak RSS is attributable to that run.
+Caches are disabled so repeated questions measure retrieval and generation instead of cache hits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from generate_dummy_jira_tickets import PROJECT_KEY, synthetic_tickets, write_jsonl  # noqa: E402
+
+try:  # resource is Unix-only; peak RSS is omitted elsewhere.
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+TARGETS = ("src", "backend")
+QUESTIONS = (
+    "which tickets are blocked for launch",
+    "why does retrieval return stale ticket status",
+    "how should we fix missing citations in answers",
+    "Redis write access pending from platform team",
+    "status:Blocked priority:Critical",
+)
+
+
+def benchmark_questions(count: int, seed: int, samples: int) -> list[str]:
+    rng = random.Random(seed)
+    questions = []
+    for index in range(samples):
+        if index % 3 == 2:
+            questions.append(f"Suggest a solution for {PROJECT_KEY}-{rng.randrange(count) + 1}")
+        else:
+            questions.append(QUESTIONS[index % len(QUESTIONS)])
+    return questions
+
+
+def peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def one_shot(action: Callable[[], Any], items: int) -> dict[str, Any]:
+    start = time.perf_counter()
+    action()
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": round(seconds, 4),
+        "items_per_second": round(items / seconds, 1) if seconds else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def latencies(action: Callable[[str], Any], questions: list[str]) -> dict[str, Any]:
+    action(questions[0])
+    samples = []
+    for question in questions:
+        start = time.perf_counter()
+        action(question)
+        samples.append(time.perf_counter() - start)
+    total = sum(samples)
+    return {
+        "samples": len(samples),
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+        "mean_ms": round(total / len(samples) * 1000, 3),
+        "ops_per_second": round(len(samples) / total, 1) if total else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def bench_src(corpus: Path, count: int, questions: list[str]) -> dict[str, Any]:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+    from jira_chatbot.cache import InMemoryCache
+    from jira_chatbot.config import Settings
+    from jira_chatbot.retrieval import TicketIndex
+    from jira_chatbot.service import JiraChatbotService
+
+    settings = Settings(jira_data_path=corpus, cache_enabled=False, answer_cache_enabled=False, index_snapshot_enabled=False)
+    holder: dict[str, JiraChatbotService] = {}
+    stages = {"sync": one_shot(lambda: holder.update(service=JiraChatbotService(settings, cache=InMemoryCache(enabled=False))), count)}
+    service = holder["service"]
+
+    def rebuild() -> None:
+        service.index = TicketIndex(
+            service.tickets,
+            project_key=settings.jira_project_key,
+            reranking_enabled=settings.retrieval_reranking_enabled,
+            workers=settings.sync_workers,
+            batch_size=settings.sync_batch_size,
+        )
+
+    stages["rebuild"] = one_shot(rebuild, count)
+    stages["search"] = latencies(lambda question: service.retrieve(question), questions)
+    stages["chat"] = latencies(service.ask, questions)
+    return stages
+
+
+def bench_backend(corpus: Path, count: int, questions: list[str]) -> dict[str, Any]:
+    database_url = f"sqlite:///{corpus.parent / f'backend-{count}.db'}"
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, str(PROJECT_ROOT / "backend"))
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app import models  # noqa: F401
+    from app.config import Settings
+    from app.database import Base
+    from app.dependencies import ServiceContainer
+
+    settings = Settings(database_url=database_url, redis_url="", cache_enabled=False, auto_sync_mock=False, mock_jira_data_path=corpus)
+    engine = create_engine(database_url, future=True)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+    container = ServiceContainer(settings)
+    try:
+        stages = {"sync": one_shot(lambda: container.ingestion.sync_mock(db), count)}
+        stages["rebuild"] = one_shot(lambda: container.vector_store.rebuild(db), count)
+        stages["search"] = latencies(lambda question: container.retriever.retrieve(db, question), questions)
+        retrieved = {question: container.retriever.retrieve(db, question)[1] for question in set(questions)}
+        stages["context"] = latencies(lambda question: container.context_builder.build(db, retrieved[question]), questions)
+        stages["chat"] = latencies(lambda question: container.chat.chat(db, question), questions)
+    finally:
+        db.close()
+        engine.dispose()
+    return stages
+
+
+def run_target(target: str, corpus: Path, count: int, seed: int, samples: int) -> dict[str, Any]:
+    command = [
+        sys.executable,
+        __file__,
+        "--worker",
+        target,
+        "--corpus",
+        str(corpus),
+        "--scales",
+        str(count),
+        "--seed",
+        str(seed),
+        "--samples",
+        str(samples),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True, check=False)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{target} benchmark failed at {count} tickets:\n{completed.stderr}")
+    return json.loads(completed.stdout)
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Return one line per stage whose p95 latency or one-shot duration grew more than ``tolerance``."""
+    previous = {(run["tickets"], target): stages for run in baseline["scales"] for target, stages in run["targets"].items()}
+    regressions = []
+    for run in results["scales"]:
+        for target, stages in run["targets"].items():
+            for stage, current in stages.items():
+                before = previous.get((run["tickets"], target), {}).get(stage)
+                metric = "p95_ms" if "p95_ms" in current else "seconds"
+                if not before or not before.get(metric):
+                    continue
+                ratio = current[metric] / before[metric]
+                if ratio > 1 + tolerance:
+                    regressions.append(
+                        f"{target} {stage} @ {run['tickets']} tickets: {metric} {before[metric]} -> {current[metric]} ({ratio:.2f}x)"
+                    )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark both Jira chatbots on synthetic corpora.")
+    parser.add_argument("--scales", default="1000,10000", help="Comma-separated ticket counts, e.g. 10000,100000,1000000.")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the corpus and the benchmark questions.")
+    parser.add_argument("--samples", type=int, default=60, help="Timed questions per search/context/chat stage.")
+    parser.add_argument("--targets", default=",".join(TARGETS), help="Comma-separated subset of: src, backend.")
+    parser.add_argument("--output", type=Path, default=PROJECT_ROOT / "benchmarks" / "scale_results.json", help="Results JSON path.")
+    parser.add_argument("--baseline", type=Path, help="Earlier results JSON to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown versus --baseline before failing.")
+    parser.add_argument("--worker", choices=TARGETS, help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", type=Path, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    scales = [int(value) for value in args.scales.split(",")]
+    if args.worker:
+        questions = benchmark_questions(scales[0], args.seed, args.samples)
+        bench = bench_src if args.worker == "src" else bench_backend
+        print(json.dumps(bench(args.corpus, scales[0], questions)))
+        return
+
+    targets = [target.strip() for target in args.targets.split(",") if target.strip()]
+    results: dict[str, Any] = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "seed": args.seed,
+        "samples": args.samples,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scales": [],
+    }
+    for count in scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = Path(tmp) / f"tickets-{count}.jsonl"
+            write_jsonl(synthetic_tickets(count, args.seed), corpus)
+            run = {"tickets": count, "corpus_bytes": corpus.stat().st_size, "targets": {}}
+            for target in targets:
+                run["targets"][target] = run_target(target, corpus, count, args.seed, args.samples)
+                for stage, metrics in run["targets"][target].items():
+                    summary = f"p95 {metrics['p95_ms']} ms" if "p95_ms" in metrics else f"{metrics['seconds']} s"
+                    print(f"{count:>9} {target:<8} {stage:<8} {summary}  peak {metrics['peak_rss_mb']} MB", file=sys.stderr)
+            results["scales"].append(run)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"Results: {args.output}", file=sys.stderr)
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
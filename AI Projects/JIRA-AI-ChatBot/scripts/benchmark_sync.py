@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Measure how chunking and embedding scale with SYNC_WORKERS; ticket processing always runs in-process."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from jira_chatbot.config import Settings  # noqa: E402
+from jira_chatbot.preprocessing import process_tickets  # noqa: E402
+from jira_chatbot.retrieval import TicketIndex  # noqa: E402
+
+
+def scaled_tickets(base: list[dict], count: int) -> list[dict]:
+    tickets = []
+    for index in range(count):
+        raw = dict(base[index % len(base)])
+        raw["key"] = f"AICB-{10_000 + index}"
+        raw["summary"] = f"{raw.get('summary', '')} variant {index}"
+        tickets.append(raw)
+    return tickets
+
+
+def run(raw: list[dict], workers: int, batch_size: int) -> tuple[dict[str, float | int], TicketIndex]:
+    start = time.perf_counter()
+    tickets = process_tickets(raw)
+    processed = time.perf_counter()
+    index = TicketIndex(tickets, workers=workers, batch_size=batch_size)
+    indexed = time.perf_counter()
+    return {
+        "workers": workers,
+        "tickets": len(tickets),
+        "chunks": len(index.chunks),
+        "process_seconds": round(processed - start, 3),
+        "index_seconds": round(indexed - processed, 3),
+        "total_seconds": round(indexed - start, 3),
+    }, index
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark parallel jira_chatbot sync.")
+    parser.add_argument("--count", type=int, default=20_000, help="Tickets synthesized from the dummy dataset.")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts to compare.")
+    parser.add_argument("--batch-size", type=int, default=Settings.sync_batch_size, help="Tickets per work unit.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    base = json.loads(Settings.jira_data_path.read_text(encoding="utf-8"))
+    raw = scaled_tickets(base, args.count)
+    results = []
+    baseline: TicketIndex | None = None
+    for workers in (int(value) for value in args.workers.split(",")):
+        result, index = run(raw, workers, args.batch_size)
+        if baseline is None:
+            baseline = index
+        result["matches_first_run"] = index.version == baseline.version and index._postings.unpack() == baseline._postings.unpack()
+        result["speedup"] = round(results[0]["total_seconds"] / result["total_seconds"], 2) if results else 1.0
+        results.append(result)
+    print(json.dumps({"cpu_count": os.cpu_count(), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,16 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 
 PROJECT_KEY = "AICB"
+SYNTHETIC_START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+BLOCKED_STATUSES = {"Blocked", "Escalated"}
 
 
 def comment(author: str, body: str, created_at: str) -> dict[str, str]:
@@ -758,6 +763,70 @@ def make_tickets() -> list[dict[str, Any]]:
     ]
 
 
+def synthetic_tickets(count: int, seed: int) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` deterministic tickets recombined from the hand-written fixtures.
+
+    Tickets are produced one at a time so arbitrarily large corpora stream in constant memory.
+    Each summary also names a numbered area, which gives the corpus a long-tail vocabulary that grows with ``count``.
+    """
+    templates = make_tickets()
+    people = sorted({item["reporter"] for item in templates} | {item["assignee"] for item in templates if item["assignee"]})
+    assignees: list[str | None] = [*people, None]
+    statuses = sorted({item["status"] for item in templates})
+    priorities = sorted({item["priority"] for item in templates})
+    issue_types = sorted({item["issue_type"] for item in templates})
+    sprints = sorted({item["sprint"] for item in templates if item["sprint"]})
+    environments = sorted({item["environment"] for item in templates})
+    labels = sorted({label for item in templates for label in item["labels"]})
+    components = sorted({component for item in templates for component in item["components"]})
+    criteria = sorted({criterion for item in templates for criterion in item["acceptance_criteria"]})
+    comment_bodies = sorted({entry["body"] for item in templates for entry in item["comments"]})
+    blocked_reasons = sorted({item["custom_fields"]["blocked_reason"] for item in templates if "blocked_reason" in item["custom_fields"]})
+    areas = max(count // 20, 1)
+    rng = random.Random(seed)
+    for index in range(count):
+        base = rng.choice(templates)
+        status = rng.choice(statuses)
+        environment = rng.choice(environments)
+        area = f"{rng.choice(components)}-{rng.randrange(areas)}"
+        created = SYNTHETIC_START + timedelta(minutes=rng.randrange(180 * 24 * 60))
+        updated = created + timedelta(minutes=rng.randrange(1, 30 * 24 * 60))
+        comment_times = sorted(created + (updated - created) * rng.random() for _ in range(rng.randrange(5)))
+        custom_fields = {name: value for name, value in base["custom_fields"].items() if name != "blocked_reason"}
+        if status in BLOCKED_STATUSES:
+            custom_fields["blocked_reason"] = rng.choice(blocked_reasons)
+        linked_issues = []
+        if index and rng.random() < 0.2:
+            linked_issues.append({"key": f"{PROJECT_KEY}-{rng.randrange(index) + 1}", "type": rng.choice(["blocks", "relates to"])})
+        yield ticket(
+            key=f"{PROJECT_KEY}-{index + 1}",
+            issue_type=rng.choice(issue_types),
+            summary=f"{base['summary']} in {area}",
+            description=f"{base['description']} Reported for {area} in {environment}.",
+            status=status,
+            priority=rng.choice(priorities),
+            assignee=rng.choice(assignees),
+            reporter=rng.choice(people),
+            labels=rng.sample(labels, rng.randint(1, 3)),
+            components=rng.sample(components, rng.randint(1, 2)),
+            sprint=rng.choice([*sprints, None]),
+            created_at=_timestamp(created),
+            updated_at=_timestamp(updated),
+            due_date=(created + timedelta(days=14)).date().isoformat() if rng.random() < 0.9 else None,
+            resolution="Done" if status == "Done" else None,
+            story_points=rng.choice([None, 1, 2, 3, 5, 8, 13]),
+            environment=environment,
+            acceptance_criteria=rng.sample(criteria, rng.randrange(4)),
+            comments=[comment(rng.choice(people), rng.choice(comment_bodies), _timestamp(moment)) for moment in comment_times],
+            linked_issues=linked_issues,
+            custom_fields=custom_fields,
+        )
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def flatten_for_csv(ticket_data: dict[str, Any]) -> dict[str, Any]:
     custom_fields = ticket_data["custom_fields"]
     return {
@@ -791,6 +860,20 @@ def write_json(tickets: list[dict[str, Any]], path: Path) -> None:
     path.write_text(json.dumps(tickets, indent=2) + "\n", encoding="utf-8")
 
 
+def write_jsonl(tickets: Iterable[dict[str, Any]], path: Path | None) -> int:
+    """Write one ticket per line; ``None`` writes to stdout."""
+    handle = path.open("w", encoding="utf-8") if path is not None else sys.stdout
+    written = 0
+    try:
+        for ticket_data in tickets:
+            handle.write(json.dumps(ticket_data, separators=(",", ":")) + "\n")
+            written += 1
+    finally:
+        if path is not None:
+            handle.close()
+    return written
+
+
 def write_csv(tickets: list[dict[str, Any]], path: Path) -> None:
     rows = [flatten_for_csv(ticket_data) for ticket_data in tickets]
     with path.open("w", encoding="utf-8", newline="") as csv_file:
@@ -805,11 +888,24 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--out-dir", type=Path, default=default_out_dir, help="Directory for generated files.")
     parser.add_argument("--json-name", default="dummy_jira_tickets.json", help="Generated JSON filename.")
     parser.add_argument("--csv-name", default="dummy_jira_tickets.csv", help="Generated CSV filename.")
+    parser.add_argument("--count", type=int, help="Stream this many synthetic tickets to JSON Lines instead of the fixtures.")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for --count corpora.")
+    parser.add_argument("--jsonl-name", default="dummy_jira_tickets.jsonl", help="Generated JSON Lines filename, or - for stdout.")
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
+    if args.count is not None:
+        jsonl_path = None if args.jsonl_name == "-" else args.out_dir / args.jsonl_name
+        if jsonl_path is not None:
+            args.out_dir.mkdir(parents=True, exist_ok=True)
+        written = write_jsonl(synthetic_tickets(args.count, args.seed), jsonl_path)
+        if jsonl_path is not None:
+            print(f"Generated {written} synthetic tickets (seed {args.seed})")
+            print(f"JSONL: {jsonl_path}")
+        return
+
     tickets = make_tickets()
     args.out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import sqlite3
+import threading
 import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol
@@ -124,3 +130,205 @@ class FileCache:
                 continue
             for path in sorted(target.rglob("*.json")):
                 path.unlink(missing_ok=True)
+
+
+class SqliteCache:
+    """Single-file cache with buffered transactional writes, background TTL sweeping and size caps."""
+
+    def __init__(
+        self,
+        path: Path,
+        enabled: bool = True,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        write_batch_size: int = 256,
+        sweep_interval_seconds: float = 60.0,
+    ) -> None:
+        self.path = path
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.write_batch_size = max(1, write_batch_size)
+        # Pending writes keyed by (namespace, key); a None payload marks a delete.
+        self._pending: dict[tuple[str, str], tuple[str | None, float | None]] = {}
+        self._lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+        if not enabled:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            );
+            CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at);
+            CREATE INDEX IF NOT EXISTS ix_cache_entries_stored_at ON cache_entries (stored_at);
+            """
+        )
+        stop = threading.Event()
+        weakref.finalize(self, stop.set)
+        atexit.register(_close_cache, weakref.ref(self))
+        if sweep_interval_seconds > 0:
+            threading.Thread(
+                target=_sweep_loop,
+                args=(weakref.ref(self), stop, sweep_interval_seconds),
+                name="sqlite-cache-sweeper",
+                daemon=True,
+            ).start()
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        if not self.enabled or self._connection is None:
+            return None
+        with self._lock:
+            pending = self._pending.get((namespace, key))
+            if pending is not None:
+                payload, expires_at = pending
+            else:
+                row = self._connection.execute(
+                    "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+                payload, expires_at = row if row is not None else (None, None)
+        if payload is None:
+            logger.debug("cache miss namespace=%s", namespace)
+            return None
+        if expires_at is not None and time.time() >= expires_at:
+            logger.debug("cache expired namespace=%s", namespace)
+            return None
+        logger.debug("cache hit namespace=%s", namespace)
+        return json.loads(payload)
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        if not self.enabled or self._connection is None:
+            return
+        expires_at = time.time() + ttl_seconds if ttl_seconds else None
+        payload = json.dumps(value, sort_keys=True, default=str)
+        with self._lock:
+            self._pending[(namespace, key)] = (payload, expires_at)
+            if len(self._pending) >= self.write_batch_size:
+                self.flush()
+
+    def delete(self, namespace: str, key: str) -> None:
+        if self._connection is None:
+            return
+        with self._lock:
+            self._pending[(namespace, key)] = (None, None)
+
+    def clear(self, namespace: str | None = None) -> None:
+        if self._connection is None:
+            return
+        with self._lock:
+            if namespace is None:
+                self._pending.clear()
+                self._connection.execute("DELETE FROM cache_entries")
+                return
+            for pending_key in [item for item in self._pending if item[0] == namespace]:
+                self._pending.pop(pending_key)
+            self._connection.execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+
+    def flush(self) -> None:
+        if self._connection is None:
+            return
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            now = time.time()
+            writes = [
+                (namespace, key, payload, expires_at, len(payload), now)
+                for (namespace, key), (payload, expires_at) in pending.items()
+                if payload is not None
+            ]
+            deletes = [item for item, (payload, _) in pending.items() if payload is None]
+            with self._transaction():
+                self._connection.executemany("INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?, ?)", writes)
+                self._connection.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", deletes)
+        logger.debug("cache flushed writes=%s deletes=%s", len(writes), len(deletes))
+
+    def sweep(self) -> int:
+        if self._connection is None:
+            return 0
+        with self._lock:
+            self.flush()
+            with self._transaction():
+                removed = self._connection.execute(
+                    "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (time.time(),),
+                ).rowcount
+                removed += self._enforce_caps()
+        if removed:
+            logger.debug("cache sweep removed=%s", removed)
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        if self._connection is None:
+            return {"entries": 0, "bytes": 0, "pending": 0}
+        with self._lock:
+            entries, size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+            return {"entries": entries, "bytes": size, "pending": len(self._pending)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            self.flush()
+            self._connection.close()
+            self._connection = None
+
+    def _enforce_caps(self) -> int:
+        assert self._connection is not None
+        entries, size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+        excess_entries = entries - self.max_entries if self.max_entries else 0
+        excess_bytes = size - self.max_bytes if self.max_bytes else 0
+        if excess_entries <= 0 and excess_bytes <= 0:
+            return 0
+        # Oldest writes are evicted first until both caps hold.
+        victims = []
+        for namespace, key, entry_size in self._connection.execute(
+            "SELECT namespace, key, size FROM cache_entries ORDER BY stored_at, rowid"
+        ):
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            victims.append((namespace, key))
+            excess_entries -= 1
+            excess_bytes -= entry_size
+        self._connection.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", victims)
+        return len(victims)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        assert self._connection is not None
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+
+def _sweep_loop(ref: "weakref.ref[SqliteCache]", stop: threading.Event, interval: float) -> None:
+    while not stop.wait(interval):
+        cache = ref()
+        if cache is None:
+            return
+        try:
+            cache.sweep()
+        except sqlite3.Error as exc:
+            logger.warning("cache sweep failed path=%s error=%s", cache.path, exc)
+        del cache
+
+
+def _close_cache(ref: "weakref.ref[SqliteCache]") -> None:
+    cache = ref()
+    if cache is not None:
+        cache.close()
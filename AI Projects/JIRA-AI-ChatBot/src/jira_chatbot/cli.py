@@ -3,6 +3,8 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from dataclasses import replace
+from pathlib import Path
 
 from jira_chatbot.config import Settings
 from jira_chatbot.logging_config import configure_logging
@@ -30,22 +32,7 @@ def build_parser() -> argparse.ArgumentParser:
 def load_service(args: argparse.Namespace) -> JiraChatbotService:
     settings = Settings.from_env()
     if args.data:
-        settings = Settings(
-            jira_data_path=__import__("pathlib").Path(args.data),
-            jira_base_url=settings.jira_base_url,
-            jira_project_key=settings.jira_project_key,
-            jira_email=settings.jira_email,
-            jira_api_token=settings.jira_api_token,
-            model_name=settings.model_name,
-            embedding_model=settings.embedding_model,
-            cache_dir=settings.cache_dir,
-            cache_enabled=settings.cache_enabled,
-            answer_cache_enabled=settings.answer_cache_enabled,
-            retrieval_top_k=settings.retrieval_top_k,
-            retrieval_max_context_chars=settings.retrieval_max_context_chars,
-            retrieval_reranking_enabled=settings.retrieval_reranking_enabled,
-            log_level=settings.log_level,
-        )
+        settings = replace(settings, jira_data_path=Path(args.data))
     return JiraChatbotService(settings=settings)
 
 
@@ -22,14 +22,25 @@ class Settings:
     jira_project_key: str = "AICB"
     jira_email: str = ""
     jira_api_token: str = ""
+    jira_page_size: int = 100
+    jira_fetch_concurrency: int = 4
+    jira_watermark_overlap_minutes: int = 1440
     model_name: str = "local-grounded"
     embedding_model: str = "local-hashing"
     cache_dir: Path = PROJECT_ROOT / "cache"
     cache_enabled: bool = True
+    cache_backend: str = "sqlite"
+    cache_max_entries: int = 200_000
+    cache_max_bytes: int = 512 * 1024 * 1024
+    cache_sweep_interval_seconds: float = 60.0
     answer_cache_enabled: bool = True
+    index_snapshot_enabled: bool = True
+    sync_workers: int = 1
+    sync_batch_size: int = 250
     retrieval_top_k: int = 6
     retrieval_max_context_chars: int = 6000
     retrieval_reranking_enabled: bool = True
+    retrieval_keyword_scorer: str = "bm25"
     log_level: str = "INFO"
 
     @classmethod
@@ -40,13 +51,24 @@ class Settings:
             jira_project_key=os.getenv("JIRA_PROJECT_KEY", "AICB").upper(),
             jira_email=os.getenv("JIRA_EMAIL", ""),
             jira_api_token=os.getenv("JIRA_API_TOKEN", ""),
+            jira_page_size=int(os.getenv("JIRA_PAGE_SIZE", "100")),
+            jira_fetch_concurrency=int(os.getenv("JIRA_FETCH_CONCURRENCY", "4")),
+            jira_watermark_overlap_minutes=int(os.getenv("JIRA_WATERMARK_OVERLAP_MINUTES", "1440")),
             model_name=os.getenv("MODEL_NAME", "local-grounded"),
             embedding_model=os.getenv("EMBEDDING_MODEL", "local-hashing"),
             cache_dir=Path(os.getenv("CACHE_DIR", str(cls.cache_dir))).expanduser(),
             cache_enabled=env_bool("CACHE_ENABLED", True),
+            cache_backend=os.getenv("CACHE_BACKEND", "sqlite").lower(),
+            cache_max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "200000")),
+            cache_max_bytes=int(os.getenv("CACHE_MAX_BYTES", str(512 * 1024 * 1024))),
+            cache_sweep_interval_seconds=float(os.getenv("CACHE_SWEEP_INTERVAL_SECONDS", "60")),
             answer_cache_enabled=env_bool("ANSWER_CACHE_ENABLED", True),
+            index_snapshot_enabled=env_bool("INDEX_SNAPSHOT_ENABLED", True),
+            sync_workers=int(os.getenv("SYNC_WORKERS", "1")),
+            sync_batch_size=int(os.getenv("SYNC_BATCH_SIZE", "250")),
             retrieval_top_k=int(os.getenv("RETRIEVAL_TOP_K", "6")),
             retrieval_max_context_chars=int(os.getenv("RETRIEVAL_MAX_CONTEXT_CHARS", "6000")),
             retrieval_reranking_enabled=env_bool("RETRIEVAL_RERANKING_ENABLED", True),
+            retrieval_keyword_scorer=os.getenv("RETRIEVAL_KEYWORD_SCORER", "bm25").lower(),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
         )
@@ -8,6 +8,7 @@ from jira_chatbot.utils import stable_hash, tokenize
 
 
 Vector = dict[str, float]
+EMBEDDING_MODEL_NAME = "local-hashing"
 
 
 class LocalEmbeddingModel:
@@ -17,11 +18,11 @@ class LocalEmbeddingModel:
         self.cache = cache
 
     def embed(self, text: str) -> Vector:
-        cache_key = stable_hash({"model": "local-hashing", "text": text})
+        cache_key = stable_hash({"model": EMBEDDING_MODEL_NAME, "text": text})
         cached = self.cache.get("embedding", cache_key) if self.cache else None
         if cached is not None:
             return {str(key): float(value) for key, value in cached.items()}
-        counts = Counter(tokenize(text))
+        counts = term_counts(text)
         norm = math.sqrt(sum(value * value for value in counts.values())) or 1.0
         vector = {token: value / norm for token, value in counts.items()}
         if self.cache:
@@ -29,6 +30,10 @@ class LocalEmbeddingModel:
         return vector
 
 
+def term_counts(text: str) -> Counter[str]:
+    return Counter(tokenize(text))
+
+
 def cosine_similarity(left: Vector, right: Vector) -> float:
     if not left or not right:
         return 0.0
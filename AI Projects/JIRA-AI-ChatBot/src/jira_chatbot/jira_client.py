@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import base64
+import http.client
 import json
 import logging
+import threading
 import urllib.parse
-import urllib.request
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -22,7 +26,11 @@ class FileJiraClient:
     def fetch_tickets(self) -> list[dict[str, Any]]:
         if not self.data_path.exists():
             raise FileNotFoundError(f"Jira data file not found: {self.data_path}")
-        data = json.loads(self.data_path.read_text(encoding="utf-8"))
+        if self.data_path.suffix == ".jsonl":
+            with self.data_path.open(encoding="utf-8") as handle:
+                data = [json.loads(line) for line in handle if line.strip()]
+        else:
+            data = json.loads(self.data_path.read_text(encoding="utf-8"))
         if not isinstance(data, list):
             raise ValueError("Jira data file must contain a list of tickets")
         logger.info("jira file sync completed tickets=%s", len(data))
@@ -30,9 +38,17 @@ class FileJiraClient:
 
 
 class HttpJiraClient:
-    """Minimal Jira REST client with pagination. Use FileJiraClient for local tests."""
+    """Minimal Jira REST client with concurrent pagination. Use FileJiraClient for local tests."""
 
-    def __init__(self, base_url: str, email: str, api_token: str, project_key: str, page_size: int = 100) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        email: str,
+        api_token: str,
+        project_key: str,
+        page_size: int = 100,
+        max_workers: int = 4,
+    ) -> None:
         if not base_url or not email or not api_token:
             raise ValueError("Jira base URL, email, and API token are required")
         self.base_url = base_url.rstrip("/")
@@ -40,38 +56,54 @@ class HttpJiraClient:
         self.api_token = api_token
         self.project_key = project_key
         self.page_size = page_size
+        self.max_workers = max(1, max_workers)
 
-    def fetch_tickets(self) -> list[dict[str, Any]]:
-        logger.info("jira api sync started project=%s", self.project_key)
-        start_at = 0
-        tickets: list[dict[str, Any]] = []
-        while True:
-            payload = self._search_page(start_at=start_at)
+    def fetch_tickets(self, updated_since: str | None = None) -> list[dict[str, Any]]:
+        return [ticket for page in self.iter_pages(updated_since) for ticket in page]
+
+    def iter_pages(self, updated_since: str | None = None) -> Iterator[list[dict[str, Any]]]:
+        logger.info("jira api sync started project=%s updated_since=%s", self.project_key, updated_since)
+        session = _JiraSession(self.base_url, self.email, self.api_token)
+        fetched = 0
+        try:
+            payload = session.search(self._search_params(0, self.page_size, updated_since))
             issues = payload.get("issues", [])
-            tickets.extend(self._normalize_issue(issue) for issue in issues)
-            total = int(payload.get("total", len(tickets)))
-            logger.info("jira api page fetched start_at=%s page_count=%s total=%s", start_at, len(issues), total)
-            start_at += len(issues)
-            if start_at >= total or not issues:
-                break
-        logger.info("jira api sync completed tickets=%s", len(tickets))
-        return tickets
-
-    def _search_page(self, start_at: int) -> dict[str, Any]:
-        query = urllib.parse.urlencode(
-            {
-                "jql": f"project={self.project_key} ORDER BY updated DESC",
-                "startAt": start_at,
-                "maxResults": self.page_size,
-                "fields": "*all",
-            }
-        )
-        request = urllib.request.Request(f"{self.base_url}/rest/api/3/search?{query}")
-        token = base64.b64encode(f"{self.email}:{self.api_token}".encode("utf-8")).decode("ascii")
-        request.add_header("Authorization", f"Basic {token}")
-        request.add_header("Accept", "application/json")
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
+            total = int(payload.get("total", len(issues)))
+            logger.info("jira api page fetched start_at=0 page_count=%s total=%s", len(issues), total)
+            fetched += len(issues)
+            yield [self._normalize_issue(issue) for issue in issues]
+            if not issues or len(issues) >= total:
+                return
+            # Jira may cap maxResults below page_size, so the first page decides the stride.
+            stride = len(issues)
+            offsets = deque(range(stride, total, stride))
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="jira-fetch") as executor:
+                pending: deque[tuple[int, Future]] = deque()
+                while offsets or pending:
+                    while offsets and len(pending) < self.max_workers * 2:
+                        start_at = offsets.popleft()
+                        params = self._search_params(start_at, stride, updated_since)
+                        pending.append((start_at, executor.submit(session.search, params)))
+                    start_at, future = pending.popleft()
+                    issues = future.result().get("issues", [])
+                    logger.info("jira api page fetched start_at=%s page_count=%s total=%s", start_at, len(issues), total)
+                    fetched += len(issues)
+                    yield [self._normalize_issue(issue) for issue in issues]
+        finally:
+            session.close()
+            logger.info("jira api sync completed tickets=%s", fetched)
+
+    def _search_params(self, start_at: int, max_results: int, updated_since: str | None = None) -> dict[str, Any]:
+        jql = f"project={self.project_key}"
+        if updated_since:
+            jql += f' AND updated >= "{updated_since}"'
+        # Key order stays stable while pages are requested out of order.
+        return {
+            "jql": f"{jql} ORDER BY key ASC",
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": "*all",
+        }
 
     def _normalize_issue(self, issue: dict[str, Any]) -> dict[str, Any]:
         fields = issue.get("fields", {})
@@ -107,3 +139,55 @@ class HttpJiraClient:
             "linked_issues": [],
             "custom_fields": {},
         }
+
+
+# backend/app/services/jira_client.py ships its own copy; keep the two identical.
+class _JiraSession:
+    """One keep-alive connection per worker thread, closed together when the sync ends."""
+
+    def __init__(self, base_url: str, email: str, api_token: str, timeout: float = 30) -> None:
+        parsed = urllib.parse.urlsplit(base_url.rstrip("/"))
+        self._connection_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+        self._host = parsed.netloc
+        self._path = f"{parsed.path}/rest/api/3/search"
+        self._timeout = timeout
+        token = base64.b64encode(f"{email}:{api_token}".encode("utf-8")).decode("ascii")
+        self._headers = {"Authorization": f"Basic {token}", "Accept": "application/json"}
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def search(self, params: dict[str, Any]) -> dict[str, Any]:
+        url = f"{self._path}?{urllib.parse.urlencode(params)}"
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request("GET", url, headers=self._headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed an idle keep-alive connection; reconnect once.
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+                continue
+            if response.status != 200:
+                raise RuntimeError(f"Jira search failed status={response.status} start_at={params.get('startAt')}")
+            return json.loads(body.decode("utf-8"))
+        raise RuntimeError("Jira search failed")
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connection_class(self._host, timeout=self._timeout)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_workers(workers: int) -> int:
+    """Map a worker setting to a process count; zero or less means one per CPU."""
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+def map_batches(fn: Callable[[Sequence[T]], R], items: Sequence[T], workers: int, batch_size: int) -> Iterator[R]:
+    """Apply ``fn`` to ``batch_size`` slices of ``items`` across processes, yielding one result per slice in input order.
+
+    Runs inline when one worker is enough, so callers get the same results either way.
+    """
+    batches = [items[start : start + batch_size] for start in range(0, len(items), max(batch_size, 1))]
+    workers = min(resolve_workers(workers), len(batches))
+    if workers <= 1:
+        for batch in batches:
+            yield fn(batch)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(fn, batches)
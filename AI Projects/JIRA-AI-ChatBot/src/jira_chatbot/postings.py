@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from jira_chatbot.embeddings import Vector
+
+
+@dataclass(frozen=True)
+class Postings:
+    """Token-major chunk statistics: for every token, the chunk rows that contain it with their weights and raw counts.
+
+    Token ``t`` spans ``offsets[t]:offsets[t + 1]`` of ``rows``, ``weights`` and ``counts``; ``lengths`` holds the
+    token count of every chunk row. The sequences are arrays for a freshly built index and memoryviews over the
+    snapshot file for a loaded one, so loading never materializes per-chunk dicts.
+    """
+
+    vocabulary: dict[str, int]
+    offsets: Sequence[int]
+    rows: Sequence[int]
+    weights: Sequence[float]
+    counts: Sequence[int]
+    lengths: Sequence[int]
+
+    @classmethod
+    def build(cls, vectors: Sequence[Vector], term_counts: Sequence[dict[str, int]]) -> "Postings":
+        rows_by_token: dict[str, list[int]] = {}
+        for row, vector in enumerate(vectors):
+            for token in vector:
+                rows_by_token.setdefault(token, []).append(row)
+        vocabulary: dict[str, int] = {}
+        offsets = array("I", [0])
+        rows = array("I")
+        weights = array("d")
+        counts = array("I")
+        for token, token_rows in rows_by_token.items():
+            vocabulary[token] = len(vocabulary)
+            rows.extend(token_rows)
+            weights.extend(vectors[row][token] for row in token_rows)
+            counts.extend(term_counts[row][token] for row in token_rows)
+            offsets.append(len(rows))
+        lengths = array("I", (sum(chunk_counts.values()) for chunk_counts in term_counts))
+        return cls(vocabulary, offsets, rows, weights, counts, lengths)
+
+    def span(self, token: str) -> tuple[int, int] | None:
+        token_id = self.vocabulary.get(token)
+        if token_id is None:
+            return None
+        return self.offsets[token_id], self.offsets[token_id + 1]
+
+    def document_frequency(self, token: str) -> int:
+        span = self.span(token)
+        return span[1] - span[0] if span else 0
+
+    def unpack(self) -> tuple[list[Vector], list[dict[str, int]]]:
+        """Per-row vectors and term counts, for patching an index without re-embedding unchanged chunks."""
+        vectors: list[Vector] = [{} for _ in range(len(self.lengths))]
+        counts: list[dict[str, int]] = [{} for _ in range(len(self.lengths))]
+        offsets = self.offsets.tolist()
+        rows = self.rows.tolist()
+        weights = self.weights.tolist()
+        frequencies = self.counts.tolist()
+        for token, token_id in self.vocabulary.items():
+            for position in range(offsets[token_id], offsets[token_id + 1]):
+                row = rows[position]
+                vectors[row][token] = weights[position]
+                counts[row][token] = frequencies[position]
+        return vectors, counts
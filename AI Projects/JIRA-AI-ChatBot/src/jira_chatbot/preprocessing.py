@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from jira_chatbot.cache import CacheBackend
 from jira_chatbot.models import Ticket, TicketChunk
@@ -11,11 +11,11 @@ logger = logging.getLogger(__name__)
 
 
 def process_tickets(raw_tickets: Iterable[dict], cache: CacheBackend | None = None) -> list[Ticket]:
+    # Runs in-process even when SYNC_WORKERS > 1: parsing a ticket costs less than pickling it to a worker
+    # and back. The worker pool is spent on chunking and embedding in TicketIndex instead.
     processed: list[Ticket] = []
     for raw in raw_tickets:
-        raw_key = str(raw.get("key") or "").upper()
-        updated_at = str(raw.get("updated_at") or raw.get("updated") or "")
-        cache_key = stable_hash({"ticket": raw_key, "updated_at": updated_at, "raw": raw})
+        cache_key = _processed_ticket_key(raw)
         cached = cache.get("processed_ticket", cache_key) if cache else None
         if cached:
             processed.append(Ticket.from_dict(cached))
@@ -28,6 +28,12 @@ def process_tickets(raw_tickets: Iterable[dict], cache: CacheBackend | None = No
     return processed
 
 
+def _processed_ticket_key(raw: dict) -> str:
+    raw_key = str(raw.get("key") or "").upper()
+    updated_at = str(raw.get("updated_at") or raw.get("updated") or "")
+    return stable_hash({"ticket": raw_key, "updated_at": updated_at, "raw": raw})
+
+
 def chunk_ticket(ticket: Ticket) -> list[TicketChunk]:
     base_metadata = {
         "ticket_key": ticket.key,
@@ -104,3 +110,8 @@ def chunk_tickets(tickets: Iterable[Ticket]) -> list[TicketChunk]:
 
 def dataset_version(tickets: Iterable[Ticket]) -> str:
     return stable_hash({ticket.key: ticket.content_hash for ticket in tickets})
+
+
+def source_version(raw_tickets: Sequence[dict]) -> str:
+    """Version of the raw input, known before any ticket is processed."""
+    return stable_hash(raw_tickets)
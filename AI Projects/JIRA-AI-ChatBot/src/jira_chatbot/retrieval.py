@@ -1,17 +1,32 @@
 from __future__ import annotations
 
 import logging
+import math
 import re
+from array import array
 from collections import defaultdict
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterator, Sequence
 
 from jira_chatbot.cache import CacheBackend
-from jira_chatbot.embeddings import LocalEmbeddingModel, cosine_similarity
+from jira_chatbot.embeddings import EMBEDDING_MODEL_NAME, LocalEmbeddingModel, Vector, term_counts
 from jira_chatbot.models import RetrievalResult, Ticket, TicketChunk
-from jira_chatbot.preprocessing import chunk_tickets, dataset_version
+from jira_chatbot.parallel import map_batches, resolve_workers
+from jira_chatbot.preprocessing import chunk_ticket, dataset_version
+from jira_chatbot.postings import Postings
+from jira_chatbot.snapshot import IndexSnapshot, read_snapshot, write_snapshot
 from jira_chatbot.utils import stable_hash, tokenize
 
 logger = logging.getLogger(__name__)
 
+# Per-ticket chunks, shared vocabulary, token ids, weights, term counts, and the end offset of every vector.
+_PackedBatch = tuple[list[tuple[TicketChunk, ...]], list[str], array, array, array, array]
+_EmbeddedTicket = tuple[tuple[TicketChunk, ...], tuple[Vector, ...], tuple[dict[str, int], ...]]
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
 
 class TicketIndex:
     def __init__(
@@ -20,18 +35,127 @@ class TicketIndex:
         project_key: str = "AICB",
         cache: CacheBackend | None = None,
         reranking_enabled: bool = True,
+        snapshot_path: Path | None = None,
+        workers: int = 1,
+        batch_size: int = 250,
+        keyword_scorer: str = "bm25",
+        source_version: str | None = None,
+    ) -> None:
+        self._configure(project_key, cache, reranking_enabled, snapshot_path, workers, batch_size, keyword_scorer, source_version)
+        self.version = dataset_version(tickets)
+        chunks, postings = self._index_tickets(tickets)
+        self._attach(tickets, chunks, postings)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot_path: Path,
+        source_version: str,
+        project_key: str = "AICB",
+        cache: CacheBackend | None = None,
+        reranking_enabled: bool = True,
+        workers: int = 1,
+        batch_size: int = 250,
+        keyword_scorer: str = "bm25",
+    ) -> "TicketIndex | None":
+        """The index saved for ``source_version``, served from the mapped snapshot, or None when it was built from other input."""
+        snapshot = read_snapshot(snapshot_path)
+        if snapshot is None or snapshot.embedding_model != EMBEDDING_MODEL_NAME or snapshot.source_version != source_version:
+            return None
+        index = cls.__new__(cls)
+        index._configure(project_key, cache, reranking_enabled, snapshot_path, workers, batch_size, keyword_scorer, source_version)
+        index.version = snapshot.dataset_version
+        index.snapshot_stats["reused_tickets"] = len(snapshot.tickets)
+        index._attach(snapshot.tickets, snapshot.chunks, snapshot.postings)
+        logger.info("ticket index loaded from snapshot chunks=%s", len(index.chunks))
+        return index
+
+    def _configure(
+        self,
+        project_key: str,
+        cache: CacheBackend | None,
+        reranking_enabled: bool,
+        snapshot_path: Path | None,
+        workers: int,
+        batch_size: int,
+        keyword_scorer: str,
+        source_version: str | None,
     ) -> None:
-        self.tickets = {ticket.key: ticket for ticket in tickets}
         self.project_key = project_key.upper()
         self.cache = cache
         self.reranking_enabled = reranking_enabled
-        self.version = dataset_version(tickets)
-        self.chunks = chunk_tickets(tickets)
         self.embedding_model = LocalEmbeddingModel(cache=cache)
-        self._chunk_vectors = {chunk.chunk_id: self.embedding_model.embed(chunk.text) for chunk in self.chunks}
-        self._chunk_tokens = {chunk.chunk_id: set(tokenize(chunk.text)) for chunk in self.chunks}
+        self.snapshot_path = snapshot_path
+        self.workers = workers
+        self.batch_size = batch_size
+        self.keyword_scorer = keyword_scorer
+        self.source_version = source_version
+        self.snapshot_stats = {"reused_tickets": 0, "indexed_tickets": 0}
         self._ticket_key_re = re.compile(rf"\b{re.escape(self.project_key)}-\d+\b", re.IGNORECASE)
 
+    def _attach(self, tickets: Sequence[Ticket], chunks: Sequence[tuple[TicketChunk, ...]], postings: Postings) -> None:
+        self.tickets = {ticket.key: ticket for ticket in tickets}
+        self.chunks = [chunk for ticket_chunks in chunks for chunk in ticket_chunks]
+        # Chunk row r is self.chunks[r]; vectors and BM25 statistics live only in the postings.
+        self._postings = postings
+        self._average_length = sum(postings.lengths) / max(len(self.chunks), 1) or 1.0
+
+    def _index_tickets(self, tickets: list[Ticket]) -> tuple[tuple[tuple[TicketChunk, ...], ...], Postings]:
+        previous = read_snapshot(self.snapshot_path) if self.snapshot_path else None
+        if previous is not None and previous.embedding_model != EMBEDDING_MODEL_NAME:
+            previous = None
+        positions = {ticket.key: position for position, ticket in enumerate(previous.tickets)} if previous else {}
+        reused: dict[int, int] = {}
+        pending: list[int] = []
+        for index, ticket in enumerate(tickets):
+            position = positions.get(ticket.key)
+            if previous is not None and position is not None and previous.tickets[position] == ticket:
+                reused[index] = position
+            else:
+                pending.append(index)
+        self.snapshot_stats["indexed_tickets"] = len(pending)
+        self.snapshot_stats["reused_tickets"] = len(reused)
+        if previous is not None and len(reused) == len(previous.tickets) == len(tickets) and all(
+            index == position for index, position in reused.items()
+        ):
+            # Same tickets in the same order: serve the mapped postings as they are.
+            chunks, postings = previous.chunks, previous.postings
+        else:
+            entries: list[_EmbeddedTicket | None] = [None] * len(tickets)
+            if previous is not None and reused:
+                vectors, counts = previous.postings.unpack()
+                starts = list(accumulate((len(ticket_chunks) for ticket_chunks in previous.chunks), initial=0))
+                for index, position in reused.items():
+                    rows = slice(starts[position], starts[position + 1])
+                    entries[index] = (previous.chunks[position], tuple(vectors[rows]), tuple(counts[rows]))
+            for index, embedded in zip(pending, self._embed_tickets([tickets[index] for index in pending])):
+                entries[index] = embedded
+            chunks = tuple(entry[0] for entry in entries)
+            postings = Postings.build(
+                [vector for entry in entries for vector in entry[1]], [counted for entry in entries for counted in entry[2]]
+            )
+        logger.info(
+            "ticket index built chunks=%s reused_tickets=%s indexed_tickets=%s",
+            len(postings.lengths),
+            self.snapshot_stats["reused_tickets"],
+            self.snapshot_stats["indexed_tickets"],
+        )
+        stale = (
+            previous is None
+            or previous.dataset_version != self.version
+            or previous.source_version != self.source_version
+            or len(previous.tickets) != len(tickets)
+        )
+        if self.snapshot_path and (stale or pending):
+            snapshot = IndexSnapshot(self.version, EMBEDDING_MODEL_NAME, self.source_version, tuple(tickets), chunks, postings)
+            write_snapshot(self.snapshot_path, snapshot)
+        return chunks, postings
+
+    def _embed_tickets(self, tickets: list[Ticket]) -> Iterator[_EmbeddedTicket]:
+        if resolve_workers(self.workers) > 1 and len(tickets) > self.batch_size:
+            return (item for batch in map_batches(_embed_batch, tickets, self.workers, self.batch_size) for item in _unpack_batch(batch))
+        return (_embed_ticket(ticket, self.embedding_model) for ticket in tickets)
+
     def extract_ticket_keys(self, query: str) -> list[str]:
         seen: set[str] = set()
         keys: list[str] = []
@@ -47,7 +171,9 @@ class TicketIndex:
 
     def search(self, query: str, top_k: int = 6) -> list[RetrievalResult]:
         normalized_query = " ".join(tokenize(query))
-        cache_key = stable_hash({"query": normalized_query, "top_k": top_k, "version": self.version})
+        cache_key = stable_hash(
+            {"query": normalized_query, "top_k": top_k, "version": self.version, "keyword_scorer": self.keyword_scorer}
+        )
         cached = self.cache.get("retrieval", cache_key) if self.cache else None
         if cached is not None:
             return [self._result_from_dict(item) for item in cached]
@@ -77,11 +203,11 @@ class TicketIndex:
 
     def _hybrid_results(self, query: str, top_k: int) -> list[RetrievalResult]:
         query_tokens = set(tokenize(query))
-        query_vector = self.embedding_model.embed(query)
+        keyword_scores, vector_scores = self._posting_scores(query_tokens, self.embedding_model.embed(query))
         scored: list[RetrievalResult] = []
-        for chunk in self.chunks:
-            keyword = self._keyword_score(query_tokens, chunk)
-            vector = cosine_similarity(query_vector, self._chunk_vectors[chunk.chunk_id])
+        for row, chunk in enumerate(self.chunks):
+            keyword = keyword_scores.get(row, 0.0)
+            vector = vector_scores.get(row, 0.0)
             metadata_boost = self._metadata_boost(query_tokens, chunk)
             score = (0.58 * keyword) + (0.37 * vector) + metadata_boost
             if score <= 0:
@@ -96,12 +222,35 @@ class TicketIndex:
             scored.append(RetrievalResult(chunk=chunk, score=score, reasons=tuple(reasons)))
         return sorted(scored, key=lambda item: item.score, reverse=True)[:top_k]
 
-    def _keyword_score(self, query_tokens: set[str], chunk: TicketChunk) -> float:
-        if not query_tokens:
-            return 0.0
-        chunk_tokens = self._chunk_tokens[chunk.chunk_id]
-        overlap = len(query_tokens & chunk_tokens)
-        return overlap / max(len(query_tokens), 1)
+    def _posting_scores(self, query_tokens: set[str], query_vector: Vector) -> tuple[dict[int, float], dict[int, float]]:
+        """Keyword and cosine scores by chunk row, accumulated from the postings of the query tokens only."""
+        postings = self._postings
+        bm25 = self.keyword_scorer == "bm25"
+        keyword: dict[int, float] = {}
+        vector: dict[int, float] = {}
+        ceiling = 0.0
+        for token in query_tokens:
+            span = postings.span(token)
+            if span is None:
+                continue
+            start, end = span
+            rows = postings.rows[start:end].tolist()
+            query_weight = query_vector.get(token, 0.0)
+            if query_weight:
+                for row, weight in zip(rows, postings.weights[start:end].tolist()):
+                    vector[row] = vector.get(row, 0.0) + query_weight * weight
+            if not bm25:
+                for row in rows:
+                    keyword[row] = keyword.get(row, 0.0) + 1.0
+                continue
+            idf = math.log(1 + (len(self.chunks) - len(rows) + 0.5) / (len(rows) + 0.5))
+            ceiling += idf * (BM25_K1 + 1)
+            for row, frequency in zip(rows, postings.counts[start:end].tolist()):
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * postings.lengths[row] / self._average_length)
+                keyword[row] = keyword.get(row, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        # BM25 is scaled by the best achievable score so it stays in [0, 1] next to cosine similarity.
+        scale = ceiling if bm25 else len(query_tokens)
+        return {row: score / scale for row, score in keyword.items()}, vector
 
     def _metadata_boost(self, query_tokens: set[str], chunk: TicketChunk) -> float:
         metadata = chunk.metadata
@@ -184,3 +333,53 @@ def group_results_by_ticket(results: list[RetrievalResult]) -> dict[str, list[Re
     for result in results:
         grouped[result.chunk.ticket_key].append(result)
     return dict(grouped)
+
+
+def _embed_ticket(ticket: Ticket, model: LocalEmbeddingModel) -> _EmbeddedTicket:
+    chunks = tuple(chunk_ticket(ticket))
+    return (
+        chunks,
+        tuple(model.embed(chunk.text) for chunk in chunks),
+        tuple(dict(term_counts(chunk.text)) for chunk in chunks),
+    )
+
+
+def _embed_batch(tickets: Sequence[Ticket]) -> _PackedBatch:
+    # Workers embed without the parent's cache; vectors are deterministic, so results match the serial path.
+    # Vectors travel as one vocabulary plus flat arrays, which pickles far faster than thousands of small dicts.
+    model = LocalEmbeddingModel()
+    vocabulary: dict[str, int] = {}
+    token_ids = array("I")
+    weights = array("d")
+    counts = array("I")
+    ends = array("I")
+    chunks = []
+    for ticket in tickets:
+        ticket_chunks, vectors, chunk_counts = _embed_ticket(ticket, model)
+        chunks.append(ticket_chunks)
+        for vector, counted in zip(vectors, chunk_counts):
+            for token, weight in vector.items():
+                token_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+                weights.append(weight)
+                counts.append(counted[token])
+            ends.append(len(weights))
+    return chunks, list(vocabulary), token_ids, weights, counts, ends
+
+
+def _unpack_batch(batch: _PackedBatch) -> Iterator[_EmbeddedTicket]:
+    chunks, vocabulary, token_ids, weights, counts, ends = batch
+    ids = token_ids.tolist()
+    values = weights.tolist()
+    frequencies = counts.tolist()
+    position = 0
+    start = 0
+    for ticket_chunks in chunks:
+        vectors = []
+        chunk_counts = []
+        for end in ends[position : position + len(ticket_chunks)]:
+            tokens = [vocabulary[index] for index in ids[start:end]]
+            vectors.append(dict(zip(tokens, values[start:end])))
+            chunk_counts.append(dict(zip(tokens, frequencies[start:end])))
+            start = end
+        position += len(ticket_chunks)
+        yield ticket_chunks, tuple(vectors), tuple(chunk_counts)
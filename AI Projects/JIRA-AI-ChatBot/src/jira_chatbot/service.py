@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
+from pathlib import Path
 
 from jira_chatbot.analysis import JiraAnalyzer
 from jira_chatbot.answering import GroundedAnswerGenerator
-from jira_chatbot.cache import CacheBackend, FileCache, InMemoryCache
+from jira_chatbot.cache import CacheBackend, FileCache, InMemoryCache, SqliteCache
 from jira_chatbot.config import Settings
 from jira_chatbot.jira_client import FileJiraClient, HttpJiraClient, JiraClient
 from jira_chatbot.models import GroundedAnswer, Ticket
-from jira_chatbot.preprocessing import process_tickets
+from jira_chatbot.preprocessing import process_tickets, source_version
 from jira_chatbot.prompts import PromptBuilder, infer_prompt_kind
 from jira_chatbot.retrieval import TicketIndex
+from jira_chatbot.sync_state import SyncState, latest_updated, parse_timestamp, read_sync_state, write_sync_state
 from jira_chatbot.utils import stable_hash
 
 logger = logging.getLogger(__name__)
@@ -24,7 +27,7 @@ class JiraChatbotService:
         cache: CacheBackend | None = None,
     ) -> None:
         self.settings = settings or Settings.from_env()
-        self.cache = cache or FileCache(self.settings.cache_dir, enabled=self.settings.cache_enabled)
+        self.cache = cache or self._default_cache()
         self.jira_client = jira_client or self._default_client()
         self.prompt_builder = PromptBuilder(max_context_chars=self.settings.retrieval_max_context_chars)
         self.answer_generator = GroundedAnswerGenerator()
@@ -38,14 +41,25 @@ class JiraChatbotService:
 
     def sync(self) -> None:
         logger.info("jira sync started")
-        raw = self.jira_client.fetch_tickets()
-        self.tickets = process_tickets(raw, cache=self.cache)
-        self.index = TicketIndex(
-            self.tickets,
-            project_key=self.settings.jira_project_key,
-            cache=self.cache,
-            reranking_enabled=self.settings.retrieval_reranking_enabled,
-        )
+        raw = self._fetch_raw_tickets()
+        snapshot_path = self._snapshot_path()
+        raw_version = source_version(raw)
+        options = {
+            "project_key": self.settings.jira_project_key,
+            "cache": self.cache,
+            "reranking_enabled": self.settings.retrieval_reranking_enabled,
+            "workers": self.settings.sync_workers,
+            "batch_size": self.settings.sync_batch_size,
+            "keyword_scorer": self.settings.retrieval_keyword_scorer,
+        }
+        # Unchanged input is served from the snapshot as-is, skipping ticket processing and re-indexing.
+        index = TicketIndex.from_snapshot(snapshot_path, raw_version, **options) if snapshot_path else None
+        if index is not None:
+            self.tickets = list(index.tickets.values())
+        else:
+            self.tickets = process_tickets(raw, cache=self.cache)
+            index = TicketIndex(self.tickets, snapshot_path=snapshot_path, source_version=raw_version, **options)
+        self.index = index
         logger.info("jira sync completed tickets=%s", len(self.tickets))
 
     def ask(self, query: str) -> GroundedAnswer:
@@ -127,6 +141,22 @@ class JiraChatbotService:
         kind = infer_prompt_kind(query, has_ticket_key=bool(self.index.extract_ticket_keys(query)))
         return self.prompt_builder.build(query, tickets, results, kind)
 
+    def _default_cache(self) -> CacheBackend:
+        settings = self.settings
+        if settings.cache_backend == "file":
+            return FileCache(settings.cache_dir, enabled=settings.cache_enabled)
+        if settings.cache_backend == "memory":
+            return InMemoryCache(enabled=settings.cache_enabled)
+        if settings.cache_backend == "sqlite":
+            return SqliteCache(
+                settings.cache_dir / "cache.sqlite3",
+                enabled=settings.cache_enabled,
+                max_entries=settings.cache_max_entries,
+                max_bytes=settings.cache_max_bytes,
+                sweep_interval_seconds=settings.cache_sweep_interval_seconds,
+            )
+        raise ValueError(f"Unsupported cache backend: {settings.cache_backend}")
+
     def _default_client(self) -> JiraClient:
         if self.settings.jira_base_url and self.settings.jira_email and self.settings.jira_api_token:
             return HttpJiraClient(
@@ -134,9 +164,46 @@ class JiraChatbotService:
                 self.settings.jira_email,
                 self.settings.jira_api_token,
                 self.settings.jira_project_key,
+                page_size=self.settings.jira_page_size,
+                max_workers=self.settings.jira_fetch_concurrency,
             )
         return FileJiraClient(self.settings.jira_data_path)
 
+    def _fetch_raw_tickets(self) -> list[dict]:
+        state_path = self._sync_state_path()
+        if state_path is None or not isinstance(self.jira_client, HttpJiraClient):
+            return self.jira_client.fetch_tickets()
+        project_key = self.settings.jira_project_key
+        state = read_sync_state(state_path)
+        if state is None or state.project_key != project_key:
+            state = SyncState(project_key, None, {})
+        updated_since = None
+        latest = parse_timestamp(state.watermark)
+        if latest is not None:
+            # JQL dates use minute precision in the Jira user's timezone, so step back far enough to cover both.
+            since = latest - timedelta(minutes=self.settings.jira_watermark_overlap_minutes)
+            updated_since = since.strftime("%Y/%m/%d %H:%M")
+        fetched = self.jira_client.fetch_tickets(updated_since=updated_since)
+        # Deleted issues are not reported by an updated-since search and stay until the sync state is removed.
+        tickets = dict(state.tickets)
+        for raw in fetched:
+            key = str(raw.get("key") or "").upper()
+            if key:
+                tickets[key] = raw
+        write_sync_state(state_path, SyncState(project_key, latest_updated(tickets.values()) or state.watermark, tickets))
+        logger.info("jira incremental fetch updated_since=%s fetched=%s total=%s", updated_since, len(fetched), len(tickets))
+        return list(tickets.values())
+
+    def _sync_state_path(self) -> Path | None:
+        if not self.settings.cache_enabled:
+            return None
+        return self.settings.cache_dir / "sync" / f"{self.settings.jira_project_key.lower()}.json"
+
+    def _snapshot_path(self) -> Path | None:
+        if not (self.settings.cache_enabled and self.settings.index_snapshot_enabled):
+            return None
+        return self.settings.cache_dir / "index" / f"{self.settings.jira_project_key.lower()}.jcix"
+
     def _tickets_from_results(self, results: list) -> list[Ticket]:
         if self.index is None:
             return []
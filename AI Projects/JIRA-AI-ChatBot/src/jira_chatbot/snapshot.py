@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from jira_chatbot.models import Comment, LinkedIssue, Ticket, TicketChunk
+from jira_chatbot.postings import Postings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"JCIX"
+SNAPSHOT_FORMAT = 3
+# magic, format, header length, posting count
+_PREAMBLE = struct.Struct("<4sIQQ")
+
+
+@dataclass(frozen=True)
+class IndexSnapshot:
+    dataset_version: str
+    embedding_model: str
+    # Hash of the raw tickets the index was built from; a match lets a sync skip ticket processing entirely.
+    source_version: str | None
+    tickets: tuple[Ticket, ...]
+    # Chunks per ticket, in row order.
+    chunks: tuple[tuple[TicketChunk, ...], ...]
+    postings: Postings
+
+
+def write_snapshot(path: Path, snapshot: IndexSnapshot) -> None:
+    """Write tickets and chunks as a JSON header followed by the postings arrays.
+
+    Arrays are float64 weights, then uint32 token offsets, chunk rows, term counts, and chunk lengths.
+    """
+    postings = snapshot.postings
+    header = json.dumps(
+        {
+            "dataset_version": snapshot.dataset_version,
+            "embedding_model": snapshot.embedding_model,
+            "source_version": snapshot.source_version,
+            "byteorder": sys.byteorder,
+            "vocabulary": list(postings.vocabulary),
+            "tickets": [
+                [_ticket_row(ticket), [[chunk.chunk_id, chunk.section, chunk.text, chunk.metadata] for chunk in chunks]]
+                for ticket, chunks in zip(snapshot.tickets, snapshot.chunks)
+            ],
+        },
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+    padding = b"\0" * (-(_PREAMBLE.size + len(header)) % 8)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with temp_path.open("wb") as handle:
+            handle.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, len(header), len(postings.rows)))
+            handle.write(header)
+            handle.write(padding)
+            for values in (postings.weights, postings.offsets, postings.rows, postings.counts, postings.lengths):
+                handle.write(values.tobytes())
+        os.replace(temp_path, path)
+    except OSError as exc:
+        # A loaded index keeps the previous file mapped, which some platforms refuse to replace.
+        logger.warning("index snapshot write failed path=%s error=%s", path, exc)
+        return
+    logger.info("index snapshot written path=%s tickets=%s postings=%s", path, len(snapshot.tickets), len(postings.rows))
+
+
+def read_snapshot(path: Path) -> IndexSnapshot | None:
+    """Map ``path`` and decode its header; the postings stay memoryviews over the mapping."""
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return _decode(mapped)
+    except (OSError, ValueError, KeyError, TypeError, struct.error) as exc:
+        logger.warning("index snapshot read failed path=%s error=%s", path, exc)
+        return None
+
+
+def _decode(mapped: mmap.mmap) -> IndexSnapshot | None:
+    magic, version, header_length, posting_count = _PREAMBLE.unpack_from(mapped, 0)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT:
+        return None
+    header_end = _PREAMBLE.size + header_length
+    header = json.loads(mapped[_PREAMBLE.size : header_end])
+    if header["byteorder"] != sys.byteorder:
+        return None
+    vocabulary = {token: token_id for token_id, token in enumerate(header["vocabulary"])}
+    tickets = []
+    chunks = []
+    for row, ticket_chunks in header["tickets"]:
+        ticket = _ticket_from_row(row)
+        tickets.append(ticket)
+        chunks.append(
+            tuple(
+                TicketChunk(chunk_id=chunk_id, ticket_key=ticket.key, section=section, text=text, metadata=metadata)
+                for chunk_id, section, text, metadata in ticket_chunks
+            )
+        )
+    chunk_count = sum(len(ticket_chunks) for ticket_chunks in chunks)
+    view = memoryview(mapped)
+    start = header_end + (-header_end % 8)
+    arrays = []
+    for code, length in (("d", posting_count), ("I", len(vocabulary) + 1), ("I", posting_count), ("I", posting_count), ("I", chunk_count)):
+        end = start + length * struct.calcsize(code)
+        if end > len(mapped):
+            raise ValueError("snapshot arrays are truncated")
+        arrays.append(view[start:end].cast(code))
+        start = end
+    weights, offsets, rows, counts, lengths = arrays
+    return IndexSnapshot(
+        dataset_version=header["dataset_version"],
+        embedding_model=header["embedding_model"],
+        source_version=header["source_version"],
+        tickets=tuple(tickets),
+        chunks=tuple(chunks),
+        postings=Postings(vocabulary, offsets, rows, weights, counts, lengths),
+    )
+
+
+def _ticket_row(ticket: Ticket) -> dict[str, Any]:
+    row = dict(ticket.__dict__)
+    row["comments"] = [[comment.author, comment.body, comment.created_at] for comment in ticket.comments]
+    row["linked_issues"] = [[issue.key, issue.type] for issue in ticket.linked_issues]
+    return row
+
+
+def _ticket_from_row(row: dict[str, Any]) -> Ticket:
+    # Rows hold already-normalized fields, so rebuild directly instead of going through Ticket.from_dict.
+    return Ticket(
+        **{
+            **row,
+            "labels": tuple(row["labels"]),
+            "components": tuple(row["components"]),
+            "acceptance_criteria": tuple(row["acceptance_criteria"]),
+            "comments": tuple(Comment(*comment) for comment in row["comments"]),
+            "linked_issues": tuple(LinkedIssue(*issue) for issue in row["linked_issues"]),
+        }
+    )
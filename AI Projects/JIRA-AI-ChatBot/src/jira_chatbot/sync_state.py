@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+SYNC_STATE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class SyncState:
+    """Raw tickets from the last Jira sync and the newest ``updated`` timestamp among them."""
+
+    project_key: str
+    watermark: str | None
+    tickets: dict[str, dict]
+
+
+def read_sync_state(path: Path) -> SyncState | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("sync state unreadable path=%s; running a full sync", path)
+        return None
+    if data.get("format") != SYNC_STATE_FORMAT:
+        return None
+    return SyncState(data["project_key"], data.get("watermark"), data["tickets"])
+
+
+def write_sync_state(path: Path, state: SyncState) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    payload = {"format": SYNC_STATE_FORMAT, "project_key": state.project_key, "watermark": state.watermark, "tickets": state.tickets}
+    tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def latest_updated(raw_tickets: Iterable[dict]) -> str | None:
+    timestamps = [parse_timestamp(raw.get("updated_at")) for raw in raw_tickets]
+    latest = max((timestamp for timestamp in timestamps if timestamp is not None), default=None)
+    return latest.isoformat() if latest is not None else None
@@ -5,7 +5,7 @@ import time
 import unittest
 from pathlib import Path
 
-from jira_chatbot.cache import FileCache, InMemoryCache
+from jira_chatbot.cache import FileCache, InMemoryCache, SqliteCache
 
 
 class CacheTests(unittest.TestCase):
@@ -22,6 +22,39 @@ class CacheTests(unittest.TestCase):
             cache.set("embedding", "abc", {"a": 1})
             self.assertEqual(cache.get("embedding", "abc"), {"a": 1})
 
+    def test_sqlite_cache_buffers_writes_and_persists_on_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.sqlite3"
+            cache = SqliteCache(path, write_batch_size=100, sweep_interval_seconds=0)
+            cache.set("embedding", "abc", {"a": 1})
+            cache.set("answer", "q1", {"answer": "ok"})
+            self.assertEqual(cache.get("embedding", "abc"), {"a": 1})
+            self.assertEqual(cache.stats(), {"entries": 0, "bytes": 0, "pending": 2})
+            cache.clear("answer")
+            cache.close()
+
+            reopened = SqliteCache(path, sweep_interval_seconds=0)
+            self.assertEqual(reopened.get("embedding", "abc"), {"a": 1})
+            self.assertIsNone(reopened.get("answer", "q1"))
+            reopened.delete("embedding", "abc")
+            self.assertIsNone(reopened.get("embedding", "abc"))
+            reopened.close()
+
+    def test_sqlite_cache_sweeps_expired_entries_and_enforces_caps(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SqliteCache(Path(tmp) / "cache.sqlite3", max_entries=3, sweep_interval_seconds=0)
+            cache.set("answer", "short", "x", ttl_seconds=1)
+            for index in range(4):
+                cache.set("embedding", str(index), {"v": index})
+            time.sleep(1.01)
+            self.assertIsNone(cache.get("answer", "short"))
+
+            self.assertEqual(cache.sweep(), 2)
+            self.assertEqual(cache.stats()["entries"], 3)
+            self.assertIsNone(cache.get("embedding", "0"))
+            self.assertEqual(cache.get("embedding", "3"), {"v": 3})
+            cache.close()
+
 
 if __name__ == "__main__":
     unittest.main()
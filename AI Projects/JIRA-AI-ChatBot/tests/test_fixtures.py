@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import importlib.util
 import json
+import tempfile
 import unittest
 from pathlib import Path
 
+from jira_chatbot.jira_client import FileJiraClient
+from jira_chatbot.preprocessing import process_tickets
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
+def load_generator():
+    spec = importlib.util.spec_from_file_location("generate_dummy_jira_tickets", ROOT / "scripts" / "generate_dummy_jira_tickets.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class FixtureTests(unittest.TestCase):
     def test_dummy_jira_data_is_valid(self) -> None:
         tickets = json.loads((ROOT / "data" / "dummy_jira_tickets.json").read_text(encoding="utf-8"))
@@ -17,6 +29,22 @@ class FixtureTests(unittest.TestCase):
         self.assertTrue(any(ticket["status"] == "Blocked" for ticket in tickets))
         self.assertTrue(any(ticket["assignee"] is None for ticket in tickets))
 
+    def test_synthetic_corpus_is_deterministic_and_loads_as_jsonl(self) -> None:
+        generator = load_generator()
+        first = list(generator.synthetic_tickets(200, seed=3))
+        self.assertEqual(first, list(generator.synthetic_tickets(200, seed=3)))
+        self.assertNotEqual(first, list(generator.synthetic_tickets(200, seed=4)))
+        self.assertEqual(len({ticket["key"] for ticket in first}), 200)
+        self.assertTrue(all("blocked_reason" in ticket["custom_fields"] for ticket in first if ticket["status"] == "Blocked"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tickets.jsonl"
+            self.assertEqual(generator.write_jsonl(iter(first), path), 200)
+            loaded = FileJiraClient(path).fetch_tickets()
+
+        self.assertEqual(loaded, first)
+        self.assertEqual(len(process_tickets(loaded)), 200)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from jira_chatbot.jira_client import HttpJiraClient
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+ISSUES = [
+    {"key": f"STUB-{number}", "fields": {"summary": f"Stub issue {number}", "status": {"name": "Open"}}}
+    for number in range(1, 24)
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list[dict[str, str]] = []
+    connections: set[tuple[str, int]] = set()
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        params = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query))
+        with self.lock:
+            self.requests.append(params)
+            self.connections.add(self.client_address)
+        start_at = int(params["startAt"])
+        size = min(int(params["maxResults"]), 5)
+        body = json.dumps({"total": len(ISSUES), "issues": ISSUES[start_at : start_at + size]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class HttpJiraClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        StubHandler.requests = []
+        StubHandler.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = HttpJiraClient(
+            f"http://127.0.0.1:{self.server.server_address[1]}",
+            "bot@example.com",
+            "token",
+            "STUB",
+            page_size=50,
+            max_workers=2,
+        )
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_fetches_remaining_pages_concurrently_in_order(self) -> None:
+        tickets = self.client.fetch_tickets()
+
+        self.assertEqual([ticket["key"] for ticket in tickets], [issue["key"] for issue in ISSUES])
+        self.assertEqual(sorted(int(request["startAt"]) for request in StubHandler.requests), [0, 5, 10, 15, 20])
+        self.assertLessEqual(len(StubHandler.connections), 3)
+
+    def test_iter_pages_filters_by_updated_since(self) -> None:
+        pages = list(self.client.iter_pages(updated_since="2026/06/01 00:00"))
+
+        self.assertEqual([len(page) for page in pages], [5, 5, 5, 5, 3])
+        self.assertIn('updated >= "2026/06/01 00:00"', StubHandler.requests[0]["jql"])
+
+    def test_session_matches_backend_copy(self) -> None:
+        def session_source(path: Path) -> str:
+            source = path.read_text(encoding="utf-8")
+            return source[source.index("class _JiraSession") :]
+
+        self.assertEqual(
+            session_source(ROOT / "src" / "jira_chatbot" / "jira_client.py"),
+            session_source(ROOT / "backend" / "app" / "services" / "jira_client.py"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
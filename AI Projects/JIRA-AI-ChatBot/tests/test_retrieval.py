@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import json
+import tempfile
 import unittest
+from collections import Counter
+from dataclasses import replace
 from pathlib import Path
+from unittest import mock
 
+from jira_chatbot import retrieval
 from jira_chatbot.cache import InMemoryCache
 from jira_chatbot.models import Ticket
+from jira_chatbot.preprocessing import process_tickets
 from jira_chatbot.retrieval import TicketIndex
+from jira_chatbot.utils import tokenize
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -35,6 +42,77 @@ class RetrievalTests(unittest.TestCase):
         keys = {result.chunk.ticket_key for result in results}
         self.assertTrue({"AICB-104", "AICB-113", "AICB-120"} & keys)
 
+    def test_bm25_prefers_rare_terms_and_uses_raw_term_counts(self) -> None:
+        postings = self.index._postings
+        vectors, counts = postings.unpack()
+        tokens = tokenize(self.index.chunks[0].text)
+        self.assertEqual(counts[0], Counter(tokens))
+        self.assertEqual(postings.lengths[0], len(tokens))
+
+        self.assertLess(postings.document_frequency("launch"), postings.document_frequency("blocked"))
+        overlap = TicketIndex(load_tickets(), keyword_scorer="overlap")
+        self.assertEqual(overlap._posting_scores({"blocked"}, {})[0].get(0, 0.0), float("blocked" in vectors[0]))
+        keyword, _ = self.index._posting_scores({"blocked", "launch"}, {})
+        self.assertLessEqual(max(keyword.values()), 1.0)
+
+
+class SnapshotTests(unittest.TestCase):
+    def test_snapshot_reloads_and_patches_changed_tickets(self) -> None:
+        tickets = load_tickets()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "aicb.jcix"
+            built = TicketIndex(tickets, snapshot_path=path)
+            with mock.patch.object(retrieval, "term_counts", side_effect=AssertionError("snapshot loads must not re-tokenize")):
+                loaded = TicketIndex(tickets, snapshot_path=path)
+            self.assertEqual(loaded.snapshot_stats, {"reused_tickets": 20, "indexed_tickets": 0})
+            self.assertEqual(loaded.chunks, built.chunks)
+            self.assertIsInstance(loaded._postings.weights, memoryview)
+            self.assertEqual(loaded._postings.unpack(), built._postings.unpack())
+            self.assertEqual(list(loaded._postings.lengths), list(built._postings.lengths))
+
+            tickets[3] = replace(tickets[3], summary="Checkout webhook retries exhausted")
+            patched = TicketIndex(tickets, snapshot_path=path)
+            self.assertEqual(patched.snapshot_stats, {"reused_tickets": 19, "indexed_tickets": 1})
+            self.assertNotEqual(patched.version, built.version)
+            results = patched.search("checkout webhook retries exhausted", top_k=1)
+            self.assertEqual(results[0].chunk.ticket_key, tickets[3].key)
+            self.assertEqual(TicketIndex(tickets, snapshot_path=path).snapshot_stats["indexed_tickets"], 0)
+
+    def test_matching_source_version_loads_tickets_and_postings_from_snapshot(self) -> None:
+        tickets = load_tickets()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "aicb.jcix"
+            built = TicketIndex(tickets, snapshot_path=path, source_version="raw-v1")
+            self.assertIsNone(TicketIndex.from_snapshot(path, "raw-v2"))
+
+            loaded = TicketIndex.from_snapshot(path, "raw-v1")
+            self.assertIsNotNone(loaded)
+            self.assertEqual(list(loaded.tickets.values()), tickets)
+            self.assertEqual((loaded.version, loaded.chunks), (built.version, built.chunks))
+            self.assertIsInstance(loaded._postings.rows, memoryview)
+            query = "which tickets are blocked for launch"
+            self.assertEqual(
+                [(item.chunk.chunk_id, round(item.score, 9)) for item in loaded.search(query)],
+                [(item.chunk.chunk_id, round(item.score, 9)) for item in built.search(query)],
+            )
+
+
+class ParallelSyncTests(unittest.TestCase):
+    def test_process_pool_sync_matches_serial_sync(self) -> None:
+        raw = json.loads((ROOT / "data" / "dummy_jira_tickets.json").read_text(encoding="utf-8"))
+        cache = InMemoryCache()
+
+        serial = process_tickets(raw)
+        self.assertEqual(process_tickets(raw, cache=cache), serial)
+        serial_index = TicketIndex(serial)
+        parallel_index = TicketIndex(serial, workers=2, batch_size=4)
+
+        self.assertEqual(parallel_index.version, serial_index.version)
+        self.assertEqual(parallel_index.chunks, serial_index.chunks)
+        self.assertEqual(parallel_index._postings.unpack(), serial_index._postings.unpack())
+        self.assertEqual(parallel_index.snapshot_stats["indexed_tickets"], len(serial))
+        self.assertEqual(process_tickets(raw, cache=cache), serial)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from jira_chatbot import service as service_module
 from jira_chatbot.config import Settings
+from jira_chatbot.jira_client import HttpJiraClient
 from jira_chatbot.service import JiraChatbotService
 
 
@@ -19,6 +23,19 @@ def settings(cache_dir: Path) -> Settings:
     )
 
 
+class RecordingJiraClient(HttpJiraClient):
+    def __init__(self, tickets: list[dict]) -> None:
+        super().__init__("http://jira.invalid", "bot@example.com", "token", "AICB")
+        self.tickets = tickets
+        self.calls: list[str | None] = []
+
+    def fetch_tickets(self, updated_since: str | None = None) -> list[dict]:
+        self.calls.append(updated_since)
+        if updated_since is None:
+            return self.tickets
+        return [ticket for ticket in self.tickets if ticket["updated_at"] >= "2026-06-16"]
+
+
 class ServiceTests(unittest.TestCase):
     def test_specific_ticket_answer_is_grounded_and_cited(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -53,6 +70,29 @@ class ServiceTests(unittest.TestCase):
             self.assertFalse(first.from_cache)
             self.assertTrue(second.from_cache)
 
+    def test_unchanged_source_skips_ticket_processing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            first = JiraChatbotService(settings=settings(Path(tmp)))
+            with mock.patch.object(service_module, "process_tickets", side_effect=AssertionError("tickets were reprocessed")):
+                second = JiraChatbotService(settings=settings(Path(tmp)))
+            self.assertEqual(second.tickets, first.tickets)
+            self.assertEqual(second.index.version, first.index.version)
+            self.assertEqual(second.index.snapshot_stats, {"reused_tickets": len(first.tickets), "indexed_tickets": 0})
+
+    def test_second_sync_fetches_only_updated_tickets_since_watermark(self) -> None:
+        tickets = json.loads((ROOT / "data" / "dummy_jira_tickets.json").read_text(encoding="utf-8"))
+        client = RecordingJiraClient(tickets)
+        with tempfile.TemporaryDirectory() as tmp:
+            service = JiraChatbotService(settings=settings(Path(tmp)), jira_client=client)
+            client.tickets = [dict(tickets[0], summary="Rewritten after the watermark", updated_at="2026-06-16T09:00:00Z")]
+            service.sync()
+
+            self.assertEqual(client.calls, [None, "2026/06/14 07:30"])
+            self.assertEqual(len(service.tickets), len(tickets))
+            self.assertEqual(service.get_ticket(tickets[0]["key"]).summary, "Rewritten after the watermark")
+            service.sync()
+            self.assertEqual(client.calls[-1], "2026/06/15 09:00")
+
 
 if __name__ == "__main__":
     unittest.main()
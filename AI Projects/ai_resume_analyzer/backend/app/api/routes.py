@@ -1,11 +1,21 @@
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.logging import logger
 from app.database.session import get_db
 from app.models import Analysis
-from app.schemas import AnalysisResponse, AnalysisSummary
+from app.schemas import (
+    AnalysisResponse,
+    AnalysisSummary,
+    BatchAnalysisRequest,
+    BatchAnalysisResponse,
+    BatchMatch,
+    SimilarAnalysis,
+)
+from app.services.batch_analyzer import BatchAnalyzer
 from app.services.pgvector_service import PgVectorService
 from app.services.resume_parser import ResumeParser
 from app.services.scoring_engine import ScoringEngine
@@ -25,6 +35,7 @@ semantic_matcher = SemanticMatcher()
 scoring_engine = ScoringEngine()
 suggestion_engine = SuggestionEngine()
 pgvector_service = PgVectorService()
+batch_analyzer = BatchAnalyzer(skill_extractor, semantic_matcher, scoring_engine, suggestion_engine)
 
 @router.post("/analyze", response_model=AnalysisResponse)
 async def analyze_resume(
@@ -50,7 +61,7 @@ async def analyze_resume(
         )
 
     skill_comparison = skill_extractor.compare(cleaned_resume_text, cleaned_job_description)
-    semantic_similarity, resume_embedding = semantic_matcher.compare(
+    semantic_similarity, resume_embedding = await semantic_matcher.acompare(
         cleaned_resume_text,
         cleaned_job_description,
     )
@@ -82,8 +93,10 @@ async def analyze_resume(
 
     try:
         db.add(analysis)
+        pgvector_service.record_change(db)
         db.commit()
         db.refresh(analysis)
+        pgvector_service.index_analyses(db, [analysis.id], [resume_embedding])
     except SQLAlchemyError as exc:
         db.rollback()
         logger.exception("Could not save analysis")
@@ -95,6 +108,89 @@ async def analyze_resume(
     return analysis
 
 
+@router.post("/analyze/batch", response_model=BatchAnalysisResponse)
+def analyze_batch(request: BatchAnalysisRequest, db: Session = Depends(get_db)) -> BatchAnalysisResponse:
+    resume_texts = [text_cleaner.clean(resume.text) for resume in request.resumes]
+    job_descriptions = [text_cleaner.clean(text) for text in request.job_descriptions]
+
+    if not resume_texts or not job_descriptions:
+        raise HTTPException(status_code=400, detail="Provide at least one resume and one job description.")
+    empty_jobs = [index for index, text in enumerate(job_descriptions) if not text]
+    if empty_jobs:
+        raise HTTPException(status_code=400, detail=f"Job description cannot be empty (job_descriptions {empty_jobs}).")
+    short_resumes = [index for index, text in enumerate(resume_texts) if len(text) < 40]
+    if short_resumes:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Resume text is too short to analyze (resumes {short_resumes}). Add more resume content.",
+        )
+    max_pairs = get_settings().batch_max_pairs
+    if len(resume_texts) * len(job_descriptions) > max_pairs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch is limited to {max_pairs} resume and job description pairs.",
+        )
+
+    batch = batch_analyzer.analyze(resume_texts, job_descriptions)
+    analysis_ids: list[int | None] = [None] * len(batch.pairs)
+
+    if request.persist:
+        rows = [
+            {
+                "resume_filename": request.resumes[pair.resume_index].filename or "resume",
+                "resume_text": resume_texts[pair.resume_index],
+                "job_description": job_descriptions[pair.job_index],
+                "match_score": pair.score.match_score,
+                "semantic_similarity": pair.semantic_similarity,
+                "matched_skills": pair.skills.matched_skills,
+                "missing_skills": pair.skills.missing_skills,
+                "weak_areas": pair.score.weak_areas,
+                "suggestions": pair.suggestions,
+                "score_breakdown": pair.score.score_breakdown,
+                "embedding": batch.resume_embeddings[pair.resume_index],
+            }
+            for pair in batch.pairs
+        ]
+        try:
+            # One multi-row INSERT ... RETURNING instead of an add/commit/refresh per pair.
+            analysis_ids = list(db.scalars(insert(Analysis).returning(Analysis.id, sort_by_parameter_order=True), rows))
+            pgvector_service.record_change(db)
+            db.commit()
+            pgvector_service.index_analyses(db, analysis_ids, [row["embedding"] for row in rows])
+        except SQLAlchemyError as exc:
+            db.rollback()
+            logger.exception("Could not save batch analyses")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database is not available. Please check PostgreSQL connection.",
+            ) from exc
+
+    results = [
+        BatchMatch(
+            analysis_id=analysis_id,
+            resume_index=pair.resume_index,
+            job_index=pair.job_index,
+            resume_filename=request.resumes[pair.resume_index].filename or "resume",
+            match_score=pair.score.match_score,
+            semantic_similarity=pair.semantic_similarity,
+            matched_skills=pair.skills.matched_skills,
+            missing_skills=pair.skills.missing_skills,
+            score_breakdown=pair.score.score_breakdown,
+        )
+        for pair, analysis_id in zip(batch.pairs, analysis_ids)
+    ]
+    return BatchAnalysisResponse(
+        resume_count=len(resume_texts),
+        job_description_count=len(job_descriptions),
+        results=results[: request.top_k] if request.top_k else results,
+    )
+
+
+@router.get("/embeddings/stats")
+def embedding_stats() -> dict:
+    return semantic_matcher.stats()
+
+
 @router.get("/analyses", response_model=list[AnalysisSummary])
 def list_analyses(
     skip: int = 0,
@@ -125,6 +221,23 @@ def get_analysis(analysis_id: int, db: Session = Depends(get_db)) -> Analysis:
     return analysis
 
 
+@router.get("/analyses/{analysis_id}/similar", response_model=list[SimilarAnalysis])
+def similar_analyses(analysis_id: int, limit: int = 5, db: Session = Depends(get_db)) -> list[dict[str, float | int]]:
+    analysis = db.get(Analysis, analysis_id)
+    if analysis is None:
+        raise HTTPException(status_code=404, detail="Analysis not found.")
+    if analysis.embedding is None:
+        return []
+    try:
+        return pgvector_service.find_similar(db, list(analysis.embedding), limit=min(max(limit, 1), 50), exclude_id=analysis_id)
+    except SQLAlchemyError as exc:
+        logger.exception("Could not search similar analyses")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database is not available. Please check PostgreSQL connection.",
+        ) from exc
+
+
 @router.delete("/analyses/{analysis_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_analysis(analysis_id: int, db: Session = Depends(get_db)) -> None:
     analysis = db.get(Analysis, analysis_id)
@@ -133,7 +246,9 @@ def delete_analysis(analysis_id: int, db: Session = Depends(get_db)) -> None:
 
     try:
         db.delete(analysis)
+        pgvector_service.record_change(db)
         db.commit()
+        pgvector_service.remove_analyses(db, [analysis_id])
     except SQLAlchemyError as exc:
         db.rollback()
         logger.exception("Could not delete analysis")
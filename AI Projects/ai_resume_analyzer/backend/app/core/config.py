@@ -34,6 +34,16 @@ class Settings:
     formatting_score_weight: float
     jwt_secret_key: str
     jwt_expire_minutes: int
+    batch_max_pairs: int
+    skill_taxonomy_path: str
+    embedding_cache_size: int
+    embedding_token_cache_size: int
+    embedding_batch_max_size: int
+    embedding_batch_max_wait_ms: float
+    vector_index_type: str
+    vector_index_nlist: int
+    vector_index_nprobe: int
+    vector_index_path: str
 
 
 @lru_cache
@@ -61,5 +71,15 @@ def get_settings() -> Settings:
         formatting_score_weight=_get_float("FORMATTING_SCORE_WEIGHT", 0.10),
         jwt_secret_key=os.getenv("JWT_SECRET_KEY", "change-this-secret-in-production"),
         jwt_expire_minutes=int(os.getenv("JWT_EXPIRE_MINUTES", "60")),
+        batch_max_pairs=int(os.getenv("BATCH_MAX_PAIRS", "20000")),
+        skill_taxonomy_path=os.getenv("SKILL_TAXONOMY_PATH", ""),
+        embedding_cache_size=int(os.getenv("EMBEDDING_CACHE_SIZE", "1024")),
+        embedding_token_cache_size=int(os.getenv("EMBEDDING_TOKEN_CACHE_SIZE", "100000")),
+        embedding_batch_max_size=int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32")),
+        embedding_batch_max_wait_ms=_get_float("EMBEDDING_BATCH_MAX_WAIT_MS", 5.0),
+        vector_index_type=os.getenv("VECTOR_INDEX_TYPE", "flat").lower(),
+        vector_index_nlist=int(os.getenv("VECTOR_INDEX_NLIST", "0")),
+        vector_index_nprobe=int(os.getenv("VECTOR_INDEX_NPROBE", "16")),
+        vector_index_path=os.getenv("VECTOR_INDEX_PATH", ""),
     )
 
@@ -4,7 +4,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.api.routes import router
+from app.api.routes import pgvector_service, router, semantic_matcher
 from app.core.config import get_settings
 from app.core.logging import configure_logging, logger
 from app.database.init_db import init_database
@@ -25,6 +25,8 @@ async def lifespan(app: FastAPI):
         if settings.environment == "test":
             raise
     yield
+    semantic_matcher.close()
+    pgvector_service.save_local_index()
 
 
 app = FastAPI(
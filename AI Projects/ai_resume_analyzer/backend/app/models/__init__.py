@@ -1,4 +1,4 @@
 from app.models.analysis import Analysis
+from app.models.vector_index_state import VectorIndexState
 
-__all__ = ["Analysis"]
-
+__all__ = ["Analysis", "VectorIndexState"]
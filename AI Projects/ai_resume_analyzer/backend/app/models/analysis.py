@@ -39,6 +39,8 @@ settings = get_settings()
 
 class Analysis(Base):
     __tablename__ = "analyses"
+    # SQLite would otherwise reuse a deleted highest id, and the local vector index keys rows by id.
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     resume_filename: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -0,0 +1,24 @@
+from sqlalchemy import Integer, event, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.session import Base
+
+
+class VectorIndexState(Base):
+    """One-row change counter for the analyses table.
+
+    Every insert or delete of analyses bumps ``version`` in the same
+    transaction. Worker processes that keep their own local vector index
+    compare it with the version they last synced, which is a primary-key
+    lookup instead of a scan of the analyses table.
+    """
+
+    __tablename__ = "vector_index_state"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(VectorIndexState.__table__, "after_create")
+def _seed_state(table, connection, **kwargs) -> None:
+    connection.execute(insert(table).values(id=1, version=0))
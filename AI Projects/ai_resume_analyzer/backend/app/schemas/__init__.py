@@ -1,4 +1,21 @@
-from app.schemas.analysis import AnalysisResponse, AnalysisSummary, ScoreBreakdown
-
-__all__ = ["AnalysisResponse", "AnalysisSummary", "ScoreBreakdown"]
+from app.schemas.analysis import (
+    AnalysisResponse,
+    AnalysisSummary,
+    BatchAnalysisRequest,
+    BatchAnalysisResponse,
+    BatchMatch,
+    BatchResumeInput,
+    ScoreBreakdown,
+    SimilarAnalysis,
+)
 
+__all__ = [
+    "AnalysisResponse",
+    "AnalysisSummary",
+    "BatchAnalysisRequest",
+    "BatchAnalysisResponse",
+    "BatchMatch",
+    "BatchResumeInput",
+    "ScoreBreakdown",
+    "SimilarAnalysis",
+]
@@ -38,3 +38,39 @@ class AnalysisSummary(BaseModel):
 
     model_config = {"from_attributes": True}
 
+
+
+class SimilarAnalysis(BaseModel):
+    id: int
+    match_score: int
+    similarity: float
+
+
+class BatchResumeInput(BaseModel):
+    filename: str = Field("resume", max_length=255)
+    text: str
+
+
+class BatchAnalysisRequest(BaseModel):
+    resumes: list[BatchResumeInput]
+    job_descriptions: list[str]
+    top_k: int | None = Field(None, ge=1)
+    persist: bool = True
+
+
+class BatchMatch(BaseModel):
+    analysis_id: int | None
+    resume_index: int
+    job_index: int
+    resume_filename: str
+    match_score: int
+    semantic_similarity: float
+    matched_skills: list[str]
+    missing_skills: list[str]
+    score_breakdown: ScoreBreakdown
+
+
+class BatchAnalysisResponse(BaseModel):
+    resume_count: int
+    job_description_count: int
+    results: list[BatchMatch]
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+
+from app.services.scoring_engine import ScoreResult, ScoringEngine
+from app.services.semantic_matcher import SemanticMatcher
+from app.services.skill_extractor import SkillComparison, SkillExtractor
+from app.services.suggestion_engine import SuggestionEngine
+
+
+@dataclass(frozen=True)
+class PairResult:
+    resume_index: int
+    job_index: int
+    skills: SkillComparison
+    semantic_similarity: float
+    score: ScoreResult
+    suggestions: list[str]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    pairs: list[PairResult]
+    resume_embeddings: list[list[float]]
+
+
+class BatchAnalyzer:
+    """Score many resumes against many job descriptions in one pass.
+
+    Screening one resume against hundreds of openings repeats the same work
+    for every pair when done through /analyze. Here every distinct text is
+    embedded and scanned for skills once, semantic similarity for all pairs is
+    one matrix multiplication, and pairs only combine precomputed results.
+    """
+
+    def __init__(
+        self,
+        skill_extractor: SkillExtractor,
+        semantic_matcher: SemanticMatcher,
+        scoring_engine: ScoringEngine,
+        suggestion_engine: SuggestionEngine,
+    ) -> None:
+        self.skill_extractor = skill_extractor
+        self.semantic_matcher = semantic_matcher
+        self.scoring_engine = scoring_engine
+        self.suggestion_engine = suggestion_engine
+
+    def analyze(self, resume_texts: list[str], job_descriptions: list[str]) -> BatchResult:
+        resumes, resume_slots = _distinct(resume_texts)
+        jobs, job_slots = _distinct(job_descriptions)
+
+        resume_vectors = self.semantic_matcher.embed_many(resumes)
+        job_vectors = self.semantic_matcher.embed_many(jobs)
+        similarities = self.semantic_matcher.similarity_matrix(resume_vectors, job_vectors).tolist()
+        skills = self.skill_extractor.compare_many(resumes, jobs)
+        scores = self.scoring_engine.calculate_many(resumes, jobs, skills, similarities)
+
+        pairs = []
+        for resume_index, resume_slot in enumerate(resume_slots):
+            for job_index, job_slot in enumerate(job_slots):
+                comparison = skills[resume_slot][job_slot]
+                similarity = similarities[resume_slot][job_slot]
+                score = scores[resume_slot][job_slot]
+                pairs.append(
+                    PairResult(
+                        resume_index=resume_index,
+                        job_index=job_index,
+                        skills=comparison,
+                        semantic_similarity=similarity,
+                        score=score,
+                        suggestions=self.suggestion_engine.generate(comparison, score.weak_areas, similarity),
+                    )
+                )
+
+        # Best matches first; ties keep a stable, input-ordered ranking.
+        pairs.sort(key=lambda pair: (-pair.score.match_score, -pair.semantic_similarity, pair.resume_index, pair.job_index))
+        embeddings = resume_vectors.tolist()
+        return BatchResult(pairs=pairs, resume_embeddings=[embeddings[slot] for slot in resume_slots])
+
+
+def _distinct(texts: list[str]) -> tuple[list[str], list[int]]:
+    unique = list(dict.fromkeys(texts))
+    positions = {text: index for index, text in enumerate(unique)}
+    return unique, [positions[text] for text in texts]
@@ -0,0 +1,123 @@
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+import numpy as np
+
+from app.core.logging import logger
+
+
+class EmbeddingBatcher:
+    """Collect embedding requests for a few milliseconds and encode them together.
+
+    A transformer encodes a batch of 32 texts in roughly the time it takes
+    for a handful of single texts, so concurrent /api/analyze calls submit
+    their texts here and wait on a Future while one background thread runs
+    the model on whatever arrived within ``max_wait_ms``.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[list[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        self.encode = encode
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.texts = 0
+        self.encode_seconds = 0.0
+        self.largest_batch = 0
+        self._queue: queue.Queue[tuple[str, Future] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        future: Future = Future()
+        if self._closed:
+            future.set_exception(RuntimeError("Embedding batcher is closed."))
+            return future
+        self._queue.put((text, future))
+        return future
+
+    def encode_many(self, texts: list[str]) -> np.ndarray:
+        futures = [self.submit(text) for text in texts]
+        return np.stack([future.result() for future in futures])
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict[str, float | int]:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "texts": self.texts,
+                "average_batch_size": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+                "encode_seconds": round(self.encode_seconds, 4),
+                "texts_per_second": round(self.texts / self.encode_seconds, 1) if self.encode_seconds else 0.0,
+                "pending": self._queue.qsize(),
+            }
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._encode_batch(batch)
+        self._drain()
+
+    def _drain(self) -> None:
+        # Requests that raced past the closed check still get an answer.
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                batch.append(item)
+        for start in range(0, len(batch), self.max_batch_size):
+            self._encode_batch(batch[start : start + self.max_batch_size])
+
+    def _encode_batch(self, batch: list[tuple[str, Future]]) -> None:
+        started = time.perf_counter()
+        try:
+            embeddings = self.encode([text for text, _ in batch])
+        except Exception as exc:
+            logger.exception("Embedding batch failed size=%s", len(batch))
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.batches += 1
+            self.texts += len(batch)
+            self.encode_seconds += elapsed
+            self.largest_batch = max(self.largest_batch, len(batch))
+        for (_, future), embedding in zip(batch, embeddings):
+            future.set_result(embedding)
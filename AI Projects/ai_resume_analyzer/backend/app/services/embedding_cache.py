@@ -0,0 +1,55 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """Bounded LRU cache of embeddings keyed by a hash of the text.
+
+    Recruiters paste the same job description for many resumes and
+    re-analyse the same resume after edits elsewhere, so identical texts are
+    embedded once. Keys include the embedding model so switching models never
+    returns vectors from the old one. Cached arrays are read-only because
+    every caller shares them.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model_name: str, text: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{text}".encode()).hexdigest()
+
+    def get(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def set(self, key: str, embedding: np.ndarray) -> np.ndarray:
+        # A row of a batch matrix would keep the whole batch alive; store it on its own.
+        if embedding.base is not None:
+            embedding = embedding.copy()
+        embedding.setflags(write=False)
+        if self.max_entries <= 0:
+            return embedding
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return embedding
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
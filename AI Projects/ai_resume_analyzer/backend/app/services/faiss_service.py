@@ -1,30 +1,222 @@
+import json
+import os
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
 import numpy as np
 
 
 class InMemoryFaissStyleService:
-    """Educational comparison service.
+    """Cosine-similarity search over analysis embeddings without PostgreSQL.
+
+    Production uses pgvector. SQLite deployments use this index instead, built
+    the way FAISS builds its simplest indexes: vectors are normalized once on
+    insert and kept in one contiguous float32 matrix, so an exact search is a
+    single matrix-vector product plus a partial sort.
 
-    The requested project uses PostgreSQL pgvector as the vector database.
-    This small in-memory class is included because many resume-analyzer
-    tutorials mention FAISS. It shows the same cosine-search idea without
-    becoming part of the production storage path.
+    With index_type="ivf" the vectors are also clustered with k-means into
+    ``nlist`` inverted lists. A query only scores the rows in its ``nprobe``
+    closest lists, trading a little recall for far less work on large
+    collections. Adding vectors never trains; callers check
+    ``needs_training`` and run ``train()`` where it does not block requests.
     """
 
-    def __init__(self) -> None:
-        self._vectors: list[tuple[int, list[float]]] = []
+    format_version = 1
+
+    def __init__(self, dimensions: int, index_type: str = "flat", nlist: int = 0, nprobe: int = 16) -> None:
+        if index_type not in {"flat", "ivf"}:
+            raise ValueError("index_type must be 'flat' or 'ivf'.")
+        self.dimensions = dimensions
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.min_train_size = 1000
+        self._matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._lists = np.zeros(0, dtype=np.int32)
+        self._rows: dict[int, int] = {}
+        self._size = 0
+        self._centroids: np.ndarray | None = None
+        self._trained_size = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._rows
+
+    def ids(self) -> set[int]:
+        with self._lock:
+            return set(self._rows)
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def needs_training(self) -> bool:
+        # Train at min_train_size vectors, then again after 4x growth so lists stay balanced.
+        if self.index_type != "ivf" or self._size < self.min_train_size:
+            return False
+        return self._centroids is None or self._size >= 4 * self._trained_size
+
+    def add(self, item_id: int, embedding: Sequence[float]) -> None:
+        self.add_many([item_id], [embedding])
+
+    def add_many(self, item_ids: Sequence[int], embeddings) -> None:
+        """Insert or replace vectors; one copy into the matrix for the whole batch."""
+        latest = {int(item_id): index for index, item_id in enumerate(item_ids)}
+        if not latest:
+            return
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(item_ids), self.dimensions))
+        vectors = vectors[list(latest.values())]
+        ids = np.fromiter(latest, dtype=np.int64, count=len(latest))
+        with self._lock:
+            self.remove_many([item_id for item_id in latest if item_id in self._rows])
+            start, end = self._size, self._size + len(ids)
+            self._reserve(end)
+            self._matrix[start:end] = vectors
+            self._ids[start:end] = ids
+            if self._centroids is not None:
+                self._lists[start:end] = self._nearest_lists(vectors, 1)[:, 0]
+            self._rows.update((int(item_id), row) for row, item_id in enumerate(ids, start))
+            self._size = end
+
+    def remove(self, item_id: int) -> bool:
+        return self.remove_many([item_id]) == 1
+
+    def remove_many(self, item_ids: Sequence[int]) -> int:
+        # Each removal moves the last row into the hole, so the matrix stays contiguous.
+        removed = 0
+        with self._lock:
+            for item_id in item_ids:
+                row = self._rows.pop(int(item_id), None)
+                if row is None:
+                    continue
+                last = self._size - 1
+                if row != last:
+                    self._matrix[row] = self._matrix[last]
+                    self._ids[row] = self._ids[last]
+                    self._lists[row] = self._lists[last]
+                    self._rows[int(self._ids[row])] = row
+                self._size = last
+                removed += 1
+        return removed
+
+    def search(self, query_embedding: Sequence[float], limit: int = 5, exact: bool = False) -> list[tuple[int, float]]:
+        query = _normalize(np.asarray(query_embedding, dtype=np.float32).reshape(1, self.dimensions))[0]
+        with self._lock:
+            if not self._size or limit <= 0:
+                return []
+            if self._centroids is None or exact:
+                rows = None
+                scores = self._matrix[: self._size] @ query
+            else:
+                probe = np.zeros(len(self._centroids), dtype=bool)
+                probe[self._nearest_lists(query[None, :], self.nprobe)[0]] = True
+                rows = np.flatnonzero(probe[self._lists[: self._size]])
+                scores = self._matrix[rows] @ query
+            if len(scores) > limit:
+                top = np.argpartition(scores, len(scores) - limit)[len(scores) - limit :]
+            else:
+                top = np.arange(len(scores))
+            found_rows = top if rows is None else rows[top]
+            results = [(int(self._ids[row]), float(scores[index])) for row, index in zip(found_rows, top)]
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return [(item_id, round(score, 4)) for item_id, score in results]
+
+    def train(self, iterations: int = 10, sample_size: int = 50_000, seed: int = 7) -> None:
+        """Cluster the current vectors into inverted lists with spherical k-means.
+
+        k-means runs on a copied sample outside the lock, so searches and adds
+        continue meanwhile; only the final list assignment holds the lock.
+        """
+        with self._lock:
+            if not self._size:
+                return
+            nlist = self.nlist or int(np.sqrt(self._size))
+            nlist = max(1, min(nlist, self._size))
+            rng = np.random.default_rng(seed)
+            sample = self._matrix[rng.choice(self._size, size=min(sample_size, self._size), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=nlist)
+            # Empty lists keep their old centroid instead of collapsing to zero.
+            filled = counts > 0
+            centroids[filled] = _normalize(sums[filled])
+        with self._lock:
+            self._centroids = centroids
+            self._lists[: self._size] = self._nearest_lists(self._matrix[: self._size], 1)[:, 0]
+            self._trained_size = self._size
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        config = {
+            "format_version": self.format_version,
+            "dimensions": self.dimensions,
+            "index_type": self.index_type,
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "trained_size": self._trained_size,
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        with self._lock, tmp_path.open("wb") as handle:
+            np.savez(
+                handle,
+                config=np.array(json.dumps(config)),
+                ids=self._ids[: self._size],
+                vectors=self._matrix[: self._size],
+                lists=self._lists[: self._size],
+                centroids=self._centroids if self._centroids is not None else np.zeros((0, self.dimensions), dtype=np.float32),
+            )
+        os.replace(tmp_path, path)
 
-    def add(self, item_id: int, embedding: list[float]) -> None:
-        self._vectors.append((item_id, embedding))
+    @classmethod
+    def load(cls, path: str | Path) -> "InMemoryFaissStyleService":
+        with np.load(path, allow_pickle=False) as data:
+            config = json.loads(str(data["config"]))
+            if config.get("format_version") != cls.format_version:
+                raise ValueError(f"Unsupported vector index format in {path}.")
+            index = cls(config["dimensions"], config["index_type"], config["nlist"], config["nprobe"])
+            size = len(data["ids"])
+            index._reserve(size)
+            index._matrix[:size] = data["vectors"]
+            index._ids[:size] = data["ids"]
+            index._lists[:size] = data["lists"]
+            index._size = size
+            index._rows = {int(item_id): row for row, item_id in enumerate(data["ids"].tolist())}
+            if len(data["centroids"]):
+                index._centroids = data["centroids"].astype(np.float32)
+            index._trained_size = config["trained_size"]
+        return index
 
-    def search(self, query_embedding: list[float], limit: int = 5) -> list[tuple[int, float]]:
-        query = np.array(query_embedding, dtype=float)
-        results: list[tuple[int, float]] = []
+    def _nearest_lists(self, vectors: np.ndarray, count: int) -> np.ndarray:
+        similarities = vectors @ self._centroids.T
+        count = min(count, similarities.shape[1])
+        if count == similarities.shape[1]:
+            return np.argsort(-similarities, axis=1)
+        return np.argpartition(-similarities, count - 1, axis=1)[:, :count]
 
-        for item_id, embedding in self._vectors:
-            vector = np.array(embedding, dtype=float)
-            denominator = float(np.linalg.norm(query) * np.linalg.norm(vector))
-            similarity = 0.0 if denominator == 0 else float(np.dot(query, vector) / denominator)
-            results.append((item_id, round(similarity, 4)))
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._ids)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 64)
+        matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        matrix[: self._size] = self._matrix[: self._size]
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[: self._size] = self._ids[: self._size]
+        lists = np.zeros(capacity, dtype=np.int32)
+        lists[: self._size] = self._lists[: self._size]
+        self._matrix, self._ids, self._lists = matrix, ids, lists
 
-        return sorted(results, key=lambda item: item[1], reverse=True)[:limit]
 
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0).astype(np.float32, copy=False)
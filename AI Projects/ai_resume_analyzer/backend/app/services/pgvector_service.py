@@ -1,16 +1,43 @@
-from sqlalchemy import text
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import select, text, update
 from sqlalchemy.orm import Session
 
-from app.models import Analysis
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.models import Analysis, VectorIndexState
+from app.services.faiss_service import InMemoryFaissStyleService
 
 
 class PgVectorService:
     """Store and search embeddings with PostgreSQL pgvector.
 
-    The column type is VECTOR in PostgreSQL. During tests, SQLite stores the
-    embedding as JSON and this service skips vector-distance queries.
+    The column type is VECTOR in PostgreSQL. Other databases (SQLite in tests
+    and small deployments) store the embedding as JSON, so similarity search
+    falls back to an in-memory InMemoryFaissStyleService index. It is filled
+    from the database on first use, kept current as analyses are added or
+    deleted, and optionally persisted to VECTOR_INDEX_PATH.
+
+    Each worker process keeps its own copy of that index. Writers call
+    record_change() in the transaction that inserts or deletes analyses,
+    which bumps the VectorIndexState counter. Before a local search the
+    service compares that counter with the version it last synced, so
+    analyses written by other workers are picked up on the next search.
+
+    IVF training runs on a background thread, never inside a request. If
+    updating the local index fails after an analysis is committed, the
+    error is logged and the next search resyncs from the database.
     """
 
+    def __init__(self) -> None:
+        self.settings = get_settings()
+        self.index_path = Path(self.settings.vector_index_path) if self.settings.vector_index_path else None
+        self.local_index = self._open_local_index()
+        self._synced_version: int | None = None
+        self._training: threading.Thread | None = None
+
     def attach_embedding(self, analysis: Analysis, embedding: list[float]) -> None:
         analysis.embedding = embedding
 
@@ -19,9 +46,10 @@ class PgVectorService:
         db: Session,
         embedding: list[float],
         limit: int = 5,
+        exclude_id: int | None = None,
     ) -> list[dict[str, float | int]]:
         if db.get_bind().dialect.name != "postgresql":
-            return []
+            return self._find_similar_locally(db, embedding, limit, exclude_id)
 
         embedding_literal = "[" + ",".join(f"{value:.6f}" for value in embedding) + "]"
         rows = db.execute(
@@ -30,12 +58,12 @@ class PgVectorService:
                 SELECT id, match_score,
                        1 - (embedding <=> CAST(:embedding AS vector)) AS similarity
                 FROM analyses
-                WHERE embedding IS NOT NULL
+                WHERE embedding IS NOT NULL AND id != :exclude_id
                 ORDER BY embedding <=> CAST(:embedding AS vector)
                 LIMIT :limit
                 """
             ),
-            {"embedding": embedding_literal, "limit": limit},
+            {"embedding": embedding_literal, "limit": limit, "exclude_id": exclude_id or 0},
         ).mappings()
 
         return [
@@ -47,3 +75,141 @@ class PgVectorService:
             for row in rows
         ]
 
+    def record_change(self, db: Session) -> None:
+        """Bump the change counter; call before committing inserted or deleted analyses."""
+        if db.get_bind().dialect.name == "postgresql":
+            return
+        db.execute(update(VectorIndexState).where(VectorIndexState.id == 1).values(version=VectorIndexState.version + 1))
+        db.info["vector_index_version"] = db.scalar(select(VectorIndexState.version).where(VectorIndexState.id == 1))
+
+    def index_analyses(self, db: Session, analysis_ids: list[int], embeddings: list[list[float]]) -> None:
+        if db.get_bind().dialect.name == "postgresql" or not analysis_ids:
+            return
+        try:
+            self.local_index.add_many(analysis_ids, embeddings)
+        except Exception:
+            # The analyses are already committed; a resync on the next search picks them up.
+            logger.exception("Could not add %s analyses to the local vector index", len(analysis_ids))
+            self._synced_version = None
+            return
+        self._advance_version(db)
+        self._schedule_training()
+
+    def remove_analyses(self, db: Session, analysis_ids: list[int]) -> None:
+        if db.get_bind().dialect.name == "postgresql":
+            return
+        try:
+            self.local_index.remove_many(analysis_ids)
+        except Exception:
+            logger.exception("Could not remove %s analyses from the local vector index", len(analysis_ids))
+            self._synced_version = None
+            return
+        self._advance_version(db)
+
+    def sync_local_index(self, db: Session, batch_size: int = 1000) -> None:
+        """Add analyses the index is missing and drop ones deleted from the database."""
+        self._synced_version = self._index_version(db)
+        stored = set(db.scalars(select(Analysis.id).where(Analysis.embedding.is_not(None))))
+        indexed = self.local_index.ids()
+        missing = sorted(stored - indexed)
+        stale = indexed - stored
+        skipped = 0
+        self.local_index.remove_many(list(stale))
+        for start in range(0, len(missing), batch_size):
+            rows = db.execute(
+                select(Analysis.id, Analysis.embedding).where(Analysis.id.in_(missing[start : start + batch_size]))
+            ).all()
+            # Rows embedded under a different EMBEDDING_DIMENSIONS cannot be searched with today's vectors.
+            rows = [row for row in rows if len(row.embedding) == self.local_index.dimensions]
+            skipped += len(missing[start : start + batch_size]) - len(rows)
+            self.local_index.add_many([row.id for row in rows], [row.embedding for row in rows])
+        logger.info(
+            "Vector index synced: %s vectors, %s added, %s removed, %s skipped",
+            len(self.local_index),
+            len(missing) - skipped,
+            len(stale),
+            skipped,
+        )
+        if missing or stale:
+            self.save_local_index()
+        self._schedule_training()
+
+    def wait_for_training(self, timeout: float | None = None) -> None:
+        training = self._training
+        if training is not None:
+            training.join(timeout)
+
+    def save_local_index(self) -> None:
+        if self.index_path is not None:
+            self.local_index.save(self.index_path)
+
+    def _find_similar_locally(
+        self,
+        db: Session,
+        embedding: list[float],
+        limit: int,
+        exclude_id: int | None,
+    ) -> list[dict[str, float | int]]:
+        if self._index_version(db) != self._synced_version:
+            self.sync_local_index(db)
+        matches = [
+            (item_id, similarity)
+            for item_id, similarity in self.local_index.search(embedding, limit + 1)
+            if item_id != exclude_id
+        ][:limit]
+        rows = db.execute(select(Analysis.id, Analysis.match_score).where(Analysis.id.in_([item_id for item_id, _ in matches])))
+        scores = {row.id: row.match_score for row in rows}
+        return [
+            {"id": item_id, "match_score": int(scores[item_id]), "similarity": similarity}
+            for item_id, similarity in matches
+            if item_id in scores
+        ]
+
+    def _schedule_training(self) -> None:
+        if not self.local_index.needs_training:
+            return
+        if self._training is not None and self._training.is_alive():
+            return
+        self._training = threading.Thread(target=self._train_local_index, name="vector-index-train", daemon=True)
+        self._training.start()
+
+    def _train_local_index(self) -> None:
+        try:
+            started = time.perf_counter()
+            self.local_index.train()
+            logger.info("Vector index trained: %s vectors in %.2fs", len(self.local_index), time.perf_counter() - started)
+        except Exception:
+            logger.exception("Vector index training failed")
+
+    def _advance_version(self, db: Session) -> None:
+        # Our own write needs no resync, unless another worker wrote since our last sync.
+        version = db.info.pop("vector_index_version", None)
+        if version is not None and self._synced_version == version - 1:
+            self._synced_version = version
+
+    @staticmethod
+    def _index_version(db: Session) -> int:
+        return db.scalar(select(VectorIndexState.version).where(VectorIndexState.id == 1)) or 0
+
+    def _open_local_index(self) -> InMemoryFaissStyleService:
+        settings = self.settings
+        if self.index_path is not None and self.index_path.exists():
+            try:
+                index = InMemoryFaissStyleService.load(self.index_path)
+                if index.dimensions == settings.embedding_dimensions and index.index_type == settings.vector_index_type:
+                    # Search settings come from the environment, not from the file.
+                    index.nprobe = settings.vector_index_nprobe
+                    if index.nlist != settings.vector_index_nlist:
+                        index.nlist = settings.vector_index_nlist
+                        if index.trained:
+                            index.train()
+                    return index
+                logger.info("Vector index at %s does not match current settings; rebuilding", self.index_path)
+            except (OSError, ValueError, KeyError):
+                logger.exception("Could not load vector index from %s; rebuilding", self.index_path)
+        return InMemoryFaissStyleService(
+            settings.embedding_dimensions,
+            index_type=settings.vector_index_type,
+            nlist=settings.vector_index_nlist,
+            nprobe=settings.vector_index_nprobe,
+        )
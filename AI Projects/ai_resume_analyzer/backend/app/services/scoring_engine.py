@@ -57,12 +57,51 @@ class ScoringEngine:
         job_description: str,
         skills: SkillComparison,
         semantic_similarity: float,
+    ) -> ScoreResult:
+        return self.calculate_many([resume_text], [job_description], [[skills]], [[semantic_similarity]])[0][0]
+
+    def calculate_many(
+        self,
+        resume_texts: list[str],
+        job_descriptions: list[str],
+        skills: list[list[SkillComparison]],
+        semantic_similarities: list[list[float]],
+    ) -> list[list[ScoreResult]]:
+        """Score every resume against every job description.
+
+        Term lookups and formatting checks depend on one text each, so they run
+        once per text and each pair only intersects the precomputed term sets.
+        """
+        resume_terms = [self._present_terms(text.lower()) for text in resume_texts]
+        jd_terms = [self._present_terms(text.lower()) for text in job_descriptions]
+        formatting_scores = [self._formatting_score(text) for text in resume_texts]
+
+        results = []
+        for resume_index, (found_experience, found_education) in enumerate(resume_terms):
+            row = []
+            for jd_index, (required_experience, required_education) in enumerate(jd_terms):
+                row.append(
+                    self._score(
+                        skills[resume_index][jd_index],
+                        semantic_similarities[resume_index][jd_index],
+                        experience_score=self._relevance(found_experience, required_experience or EXPERIENCE_TERMS),
+                        education_score=self._relevance(found_education, required_education or EDUCATION_TERMS),
+                        formatting_score=formatting_scores[resume_index],
+                    )
+                )
+            results.append(row)
+        return results
+
+    def _score(
+        self,
+        skills: SkillComparison,
+        semantic_similarity: float,
+        experience_score: float,
+        education_score: float,
+        formatting_score: float,
     ) -> ScoreResult:
         skill_score = self._skill_score(skills)
         semantic_score = round(max(0.0, semantic_similarity) * 100, 2)
-        experience_score = self._term_relevance_score(resume_text, job_description, EXPERIENCE_TERMS)
-        education_score = self._term_relevance_score(resume_text, job_description, EDUCATION_TERMS)
-        formatting_score = self._formatting_score(resume_text)
 
         final_score = (
             skill_score * self.settings.skill_score_weight
@@ -93,21 +132,15 @@ class ScoringEngine:
             return 0.0
         return round((len(skills.matched_skills) / len(skills.jd_skills)) * 100, 2)
 
-    def _term_relevance_score(
-        self,
-        resume_text: str,
-        job_description: str,
-        terms: set[str],
-    ) -> float:
-        resume_lower = resume_text.lower()
-        jd_lower = job_description.lower()
-        required_terms = {term for term in terms if term in jd_lower}
-
-        if not required_terms:
-            required_terms = terms
+    def _present_terms(self, text_lower: str) -> tuple[set[str], set[str]]:
+        return (
+            {term for term in EXPERIENCE_TERMS if term in text_lower},
+            {term for term in EDUCATION_TERMS if term in text_lower},
+        )
 
-        found_terms = {term for term in required_terms if term in resume_lower}
-        return round((len(found_terms) / len(required_terms)) * 100, 2)
+    def _relevance(self, found_terms: set[str], required_terms: set[str]) -> float:
+        # Job descriptions that mention none of the terms are scored against all of them.
+        return round((len(found_terms & required_terms) / len(required_terms)) * 100, 2)
 
     def _formatting_score(self, resume_text: str) -> float:
         checks_passed = 0
@@ -1,11 +1,15 @@
+import asyncio
 import hashlib
-import math
 import re
+from collections import Counter
+from functools import lru_cache
 
 import numpy as np
 
 from app.core.config import get_settings
 from app.core.logging import logger
+from app.services.embedding_batcher import EmbeddingBatcher
+from app.services.embedding_cache import EmbeddingCache
 
 
 class SemanticMatcher:
@@ -21,8 +25,25 @@ class SemanticMatcher:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.model = None
+        self.cache = EmbeddingCache(self.settings.embedding_cache_size)
+        # Resumes and job descriptions share most of their vocabulary, so each
+        # token is hashed once and reused until it falls out of this bounded cache.
+        self._token_slot = lru_cache(maxsize=self.settings.embedding_token_cache_size)(self._hash_token)
+        self.batcher: EmbeddingBatcher | None = None
         if self.settings.use_transformers:
             self._load_transformer_model()
+        if self.model is not None and self.settings.embedding_batch_max_size > 1:
+            self.batcher = EmbeddingBatcher(
+                self._encode_with_model,
+                max_batch_size=self.settings.embedding_batch_max_size,
+                max_wait_ms=self.settings.embedding_batch_max_wait_ms,
+            )
+
+    @property
+    def model_name(self) -> str:
+        if self.model is not None:
+            return self.settings.transformer_model_name
+        return f"hashing-{self.settings.embedding_dimensions}"
 
     def _load_transformer_model(self) -> None:
         try:
@@ -34,40 +55,116 @@ class SemanticMatcher:
             logger.exception("Could not load transformer model; using hashing embeddings")
             self.model = None
 
+    def embed(self, text: str) -> np.ndarray:
+        """Return a read-only float32 embedding, reusing the cached one for repeated text."""
+        key = self.cache.key(self.model_name, text)
+        embedding = self.cache.get(key)
+        if embedding is None:
+            embedding = self.cache.set(key, self._encode([text])[0])
+        return embedding
+
+    async def aembed(self, text: str) -> np.ndarray:
+        """Like embed(), but waits for the micro-batcher without blocking the event loop."""
+        if self.batcher is None:
+            return self.embed(text)
+        key = self.cache.key(self.model_name, text)
+        embedding = self.cache.get(key)
+        if embedding is None:
+            embedding = self.cache.set(key, await asyncio.wrap_future(self.batcher.submit(text)))
+        return embedding
+
     def embed_text(self, text: str) -> list[float]:
-        if self.model is not None:
-            embedding = self.model.encode(text, normalize_embeddings=True)
-            return [float(value) for value in embedding]
-        return self._hash_embedding(text)
+        return self.embed(text).tolist()
 
     def compare(self, resume_text: str, job_description: str) -> tuple[float, list[float]]:
-        resume_embedding = self.embed_text(resume_text)
-        jd_embedding = self.embed_text(job_description)
+        resume_embedding = self.embed(resume_text)
+        jd_embedding = self.embed(job_description)
         similarity = self.cosine_similarity(resume_embedding, jd_embedding)
-        return similarity, resume_embedding
+        return similarity, resume_embedding.tolist()
 
-    def cosine_similarity(self, left: list[float], right: list[float]) -> float:
-        left_vector = np.array(left, dtype=float)
-        right_vector = np.array(right, dtype=float)
+    async def acompare(self, resume_text: str, job_description: str) -> tuple[float, list[float]]:
+        # Both texts are submitted together so they can share one model batch.
+        resume_embedding, jd_embedding = await asyncio.gather(self.aembed(resume_text), self.aembed(job_description))
+        similarity = self.cosine_similarity(resume_embedding, jd_embedding)
+        return similarity, resume_embedding.tolist()
+
+    def stats(self) -> dict:
+        return {
+            "model": self.model_name,
+            "cache": self.cache.stats(),
+            "batcher": self.batcher.stats() if self.batcher is not None else None,
+        }
+
+    def close(self) -> None:
+        batcher, self.batcher = self.batcher, None
+        if batcher is not None:
+            batcher.close()
+
+    def embed_many(self, texts: list[str]) -> np.ndarray:
+        """Embed a list of texts into one float32 row per text, encoding only cache misses."""
+        if not texts:
+            return np.zeros((0, self.settings.embedding_dimensions), dtype=np.float32)
+        keys = [self.cache.key(self.model_name, text) for text in texts]
+        rows = [self.cache.get(key) for key in keys]
+        missing = [index for index, row in enumerate(rows) if row is None]
+        if missing:
+            for index, embedding in zip(missing, self._encode([texts[index] for index in missing])):
+                rows[index] = self.cache.set(keys[index], embedding)
+        return np.stack(rows)
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        if self.batcher is not None:
+            return self.batcher.encode_many(texts)
+        if self.model is not None:
+            return self._encode_with_model(texts)
+        return np.stack([self._hash_embedding(text) for text in texts])
+
+    def _encode_with_model(self, texts: list[str]) -> np.ndarray:
+        return np.asarray(self.model.encode(texts, normalize_embeddings=True), dtype=np.float32)
+
+    def similarity_matrix(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row in ``left`` with every row in ``right``.
+
+        One matrix multiplication replaces N x M calls to cosine_similarity and
+        gives the same rounded values.
+        """
+        denominator = np.linalg.norm(left, axis=1)[:, None] * np.linalg.norm(right, axis=1)[None, :]
+        products = left @ right.T
+        similarities = np.divide(products, denominator, out=np.zeros_like(products), where=denominator != 0)
+        return np.round(similarities.astype(np.float64), 4)
+
+    def cosine_similarity(self, left, right) -> float:
+        left_vector = np.asarray(left, dtype=np.float32)
+        right_vector = np.asarray(right, dtype=np.float32)
         denominator = float(np.linalg.norm(left_vector) * np.linalg.norm(right_vector))
         if denominator == 0:
             return 0.0
         return round(float(np.dot(left_vector, right_vector) / denominator), 4)
 
-    def _hash_embedding(self, text: str) -> list[float]:
-        vector = np.zeros(self.settings.embedding_dimensions, dtype=float)
-        tokens = [token.lower() for token in self.token_pattern.findall(text)]
+    def _hash_embedding(self, text: str) -> np.ndarray:
+        counts = Counter(token.lower() for token in self.token_pattern.findall(text))
+        if not counts:
+            return np.zeros(self.settings.embedding_dimensions, dtype=np.float32)
 
         # The hashing trick maps tokens into a fixed-length vector. It is not as
         # smart as transformers, but it teaches the shape of embedding systems.
-        for token in tokens:
-            digest = hashlib.sha256(token.encode()).hexdigest()
-            index = int(digest[:8], 16) % self.settings.embedding_dimensions
-            sign = 1 if int(digest[8:10], 16) % 2 == 0 else -1
-            vector[index] += sign
-
-        norm = math.sqrt(float(np.dot(vector, vector)))
+        # Each distinct token is looked up once and all of them are summed into
+        # their buckets with a single bincount.
+        slots = np.array([self._token_slot(token) for token in counts], dtype=np.int64)
+        weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        vector = np.bincount(
+            np.abs(slots) - 1,
+            weights=np.sign(slots) * weights,
+            minlength=self.settings.embedding_dimensions,
+        )
+        norm = float(np.linalg.norm(vector))
         if norm == 0:
-            return [0.0] * self.settings.embedding_dimensions
-        return [round(float(value / norm), 6) for value in vector]
-
+            return np.zeros(self.settings.embedding_dimensions, dtype=np.float32)
+        return (vector / norm).astype(np.float32)
+
+    def _hash_token(self, token: str) -> int:
+        # Bucket and sign packed into one int: +/-(bucket + 1).
+        digest = hashlib.sha256(token.encode()).hexdigest()
+        index = int(digest[:8], 16) % self.settings.embedding_dimensions
+        sign = 1 if int(digest[8:10], 16) % 2 == 0 else -1
+        return sign * (index + 1)
@@ -1,6 +1,8 @@
-import re
 from dataclasses import dataclass
 
+from app.core.config import get_settings
+from app.services.skill_matcher import SkillMatcher
+
 
 SKILL_ALIASES: dict[str, list[str]] = {
     "Python": ["python"],
@@ -44,26 +46,37 @@ class SkillComparison:
 class SkillExtractor:
     """Beginner-friendly skill extractor using aliases and regex.
 
-    A more advanced version can add spaCy named-entity recognition, custom
-    skill taxonomies, or a model trained on real job descriptions.
+    Aliases come from SKILL_ALIASES, or from the JSON file named by
+    SKILL_TAXONOMY_PATH, and are compiled once into a SkillMatcher. A more
+    advanced version can add spaCy named-entity recognition or a model trained
+    on real job descriptions.
     """
 
+    def __init__(self, taxonomy: dict[str, list[str]] | None = None) -> None:
+        if taxonomy is not None:
+            self.matcher = SkillMatcher(taxonomy)
+        elif get_settings().skill_taxonomy_path:
+            self.matcher = SkillMatcher.from_file(get_settings().skill_taxonomy_path)
+        else:
+            self.matcher = SkillMatcher(SKILL_ALIASES)
+
     def extract_skills(self, text: str) -> list[str]:
-        normalized_text = text.lower()
-        found_skills: set[str] = set()
+        return sorted(self.matcher.find(text))
+
+    def compare(self, resume_text: str, job_description: str) -> SkillComparison:
+        return self.compare_skills(self.extract_skills(resume_text), self.extract_skills(job_description))
 
-        for canonical_skill, aliases in SKILL_ALIASES.items():
-            for alias in aliases:
-                pattern = r"(?<![a-z0-9])" + re.escape(alias.lower()) + r"(?![a-z0-9])"
-                if re.search(pattern, normalized_text):
-                    found_skills.add(canonical_skill)
-                    break
+    def compare_many(self, resume_texts: list[str], job_descriptions: list[str]) -> list[list[SkillComparison]]:
+        """Compare every resume with every job description.
 
-        return sorted(found_skills)
+        Each text is scanned for skills once; the N x M comparisons are plain
+        set operations on the extracted skills.
+        """
+        resume_skills = [self.extract_skills(text) for text in resume_texts]
+        jd_skills = [self.extract_skills(text) for text in job_descriptions]
+        return [[self.compare_skills(resume, jd) for jd in jd_skills] for resume in resume_skills]
 
-    def compare(self, resume_text: str, job_description: str) -> SkillComparison:
-        resume_skills = self.extract_skills(resume_text)
-        jd_skills = self.extract_skills(job_description)
+    def compare_skills(self, resume_skills: list[str], jd_skills: list[str]) -> SkillComparison:
         resume_skill_set = set(resume_skills)
         jd_skill_set = set(jd_skills)
 
@@ -76,4 +89,3 @@ class SkillExtractor:
             matched_skills=matched_skills,
             missing_skills=missing_skills,
         )
-
@@ -0,0 +1,91 @@
+import json
+import re
+from pathlib import Path
+
+
+class SkillMatcher:
+    """Find every taxonomy skill in a text with one precompiled pattern.
+
+    Running one regex per alias costs aliases x text length and recompiles
+    once the taxonomy outgrows Python's regex cache. Here all aliases are
+    merged into a prefix tree and compiled into a single pattern, so one scan
+    of the text finds them all with the same word-boundary rules: an alias
+    must not touch a letter or digit on either side.
+    """
+
+    boundary = "[a-z0-9]"
+
+    def __init__(self, taxonomy: dict[str, list[str]]) -> None:
+        self.taxonomy = taxonomy
+        self._skills: dict[str, set[str]] = {}
+        for canonical_skill, aliases in taxonomy.items():
+            for alias in aliases:
+                alias = alias.lower().strip()
+                if alias:
+                    self._skills.setdefault(alias, set()).add(canonical_skill)
+
+        # The scan reports the longest alias starting at each position. Shorter
+        # aliases that are a prefix of it and end at a non-alphanumeric
+        # character match there too, so they are folded in ahead of time.
+        self._implied: dict[str, frozenset[str]] = {}
+        for alias in self._skills:
+            skills = set(self._skills[alias])
+            for end in range(1, len(alias)):
+                if not _is_word_char(alias[end]) and alias[:end] in self._skills:
+                    skills |= self._skills[alias[:end]]
+            self._implied[alias] = frozenset(skills)
+
+        # A zero-width lookahead lets overlapping aliases ("fast api development")
+        # each produce a match instead of the first one consuming the text.
+        trie = _build_trie(self._skills)
+        self.pattern = re.compile(
+            rf"(?<!{self.boundary})(?=({_trie_pattern(trie)})(?!{self.boundary}))" if trie else r"(?!)"
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "SkillMatcher":
+        return cls(load_taxonomy(path))
+
+    def find(self, text: str) -> set[str]:
+        found: set[str] = set()
+        seen: set[str] = set()
+        for match in self.pattern.finditer(text.lower()):
+            alias = match.group(1)
+            if alias not in seen:
+                seen.add(alias)
+                found |= self._implied[alias]
+        return found
+
+
+def load_taxonomy(path: str | Path) -> dict[str, list[str]]:
+    """Read a JSON object mapping each canonical skill to its aliases."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not all(
+        isinstance(aliases, list) and all(isinstance(alias, str) for alias in aliases) for aliases in data.values()
+    ):
+        raise ValueError(f"Skill taxonomy {path} must map each skill name to a list of alias strings.")
+    return {str(skill): aliases for skill, aliases in data.items()}
+
+
+def _is_word_char(char: str) -> bool:
+    return "a" <= char <= "z" or "0" <= char <= "9"
+
+
+def _build_trie(aliases) -> dict:
+    trie: dict = {}
+    for alias in aliases:
+        node = trie
+        for char in alias:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return trie
+
+
+def _trie_pattern(node: dict) -> str:
+    # Greedy optional groups try the longer alias first and backtrack to a
+    # shorter one when the trailing word boundary fails.
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
@@ -8,12 +8,15 @@ os.environ["USE_TRANSFORMERS"] = "false"
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api import routes
 from app.database.session import Base, engine
 from app.main import app
+from app.services.pgvector_service import PgVectorService
 
 
 @pytest.fixture(autouse=True)
-def reset_database():
+def reset_database(monkeypatch):
+    monkeypatch.setattr(routes, "pgvector_service", PgVectorService())
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     yield
@@ -74,3 +74,89 @@ def test_analyze_rejects_corrupted_pdf(client):
 
     assert response.status_code == 400
     assert "Could not read PDF" in response.json()["detail"]
+
+
+def test_batch_analysis_matches_single_analysis_and_ranks_results(client):
+    resume_text = (
+        "Alex Student Email: alex@example.com Phone: +1 555 123 4567 Education Bachelor Computer Science "
+        "Skills Python SQL PostgreSQL FastAPI Docker Git Projects built REST API with FastAPI."
+    )
+    job_descriptions = [
+        "Frontend role with React, TypeScript, HTML and CSS.",
+        "Python backend intern with FastAPI, PostgreSQL, SQL, Docker, AWS and CI/CD.",
+    ]
+
+    batch_response = client.post(
+        "/api/analyze/batch",
+        json={
+            "resumes": [
+                {"filename": "alex.txt", "text": resume_text},
+                {"filename": "alex-copy.txt", "text": resume_text},
+            ],
+            "job_descriptions": job_descriptions,
+        },
+    )
+
+    assert batch_response.status_code == 200
+    payload = batch_response.json()
+    results = payload["results"]
+    assert len(results) == 4
+    assert [item["match_score"] for item in results] == sorted((item["match_score"] for item in results), reverse=True)
+    assert results[0]["job_index"] == 1
+    assert len(client.get("/api/analyses").json()) == 4
+
+    single = client.post(
+        "/api/analyze",
+        files={"resume": ("alex.txt", resume_text.encode(), "text/plain")},
+        data={"job_description": job_descriptions[1]},
+    ).json()
+    best = results[0]
+    assert best["match_score"] == single["match_score"]
+    assert best["semantic_similarity"] == single["semantic_similarity"]
+    assert best["score_breakdown"] == single["score_breakdown"]
+    assert best["missing_skills"] == single["missing_skills"]
+    stored = client.get(f"/api/analyses/{best['analysis_id']}").json()
+    assert stored["suggestions"] == single["suggestions"]
+
+
+def test_batch_analysis_rejects_short_resumes_and_oversized_batches(client):
+    short = client.post(
+        "/api/analyze/batch",
+        json={"resumes": [{"text": "Python"}], "job_descriptions": ["Python FastAPI"]},
+    )
+    assert short.status_code == 400
+    assert "too short" in short.json()["detail"]
+
+    resume = {"text": "Python FastAPI PostgreSQL developer with several shipped backend projects."}
+    oversized = client.post(
+        "/api/analyze/batch",
+        json={"resumes": [resume] * 200, "job_descriptions": ["Python"] * 101, "persist": False},
+    )
+    assert oversized.status_code == 400
+    assert "limited" in oversized.json()["detail"]
+
+
+def test_similar_analyses_use_local_vector_index_outside_postgres(client):
+    job_description = "Python backend intern with FastAPI, PostgreSQL, Docker and REST API work."
+    resumes = [
+        b"Email: a@example.com Skills Python FastAPI PostgreSQL Docker. Projects built REST API services.",
+        b"Email: b@example.com Skills Python FastAPI PostgreSQL. Projects built REST API services with Docker.",
+        b"Email: c@example.com Skills watercolor painting, pottery, and gallery curation for local exhibitions.",
+    ]
+    ids = [
+        client.post(
+            "/api/analyze",
+            files={"resume": (f"resume-{index}.txt", body, "text/plain")},
+            data={"job_description": job_description},
+        ).json()["id"]
+        for index, body in enumerate(resumes)
+    ]
+
+    similar = client.get(f"/api/analyses/{ids[0]}/similar", params={"limit": 2}).json()
+
+    assert [item["id"] for item in similar] == [ids[1], ids[2]]
+    assert similar[0]["similarity"] > similar[1]["similarity"]
+
+    client.delete(f"/api/analyses/{ids[1]}")
+    assert [item["id"] for item in client.get(f"/api/analyses/{ids[0]}/similar").json()] == [ids[2]]
+    assert client.get("/api/analyses/999/similar").status_code == 404
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from app.services.embedding_batcher import EmbeddingBatcher
+from app.services.semantic_matcher import SemanticMatcher
+
+
+class FakeModel:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts, normalize_embeddings=True):
+        self.batches.append(list(texts))
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+def test_concurrent_requests_share_one_encode_call():
+    model = FakeModel()
+    batcher = EmbeddingBatcher(model.encode, max_batch_size=16, max_wait_ms=200)
+    start = threading.Barrier(8)
+    results: dict[int, np.ndarray] = {}
+
+    def request(index: int) -> None:
+        start.wait()
+        results[index] = batcher.submit("x" * index).result(timeout=5)
+
+    threads = [threading.Thread(target=request, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert {index: float(vector[0]) for index, vector in results.items()} == {index: float(index) for index in range(8)}
+    assert len(model.batches) < 8
+    stats = batcher.stats()
+    assert stats["texts"] == 8
+    assert stats["largest_batch"] <= 16
+
+
+def test_encode_errors_reach_every_waiting_caller():
+    def failing_encode(texts):
+        raise RuntimeError("model unavailable")
+
+    batcher = EmbeddingBatcher(failing_encode, max_batch_size=4, max_wait_ms=50)
+    futures = [batcher.submit(text) for text in ["a", "b"]]
+    batcher.close()
+
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+
+
+def test_async_compare_batches_resume_and_job_description():
+    model = FakeModel()
+    matcher = SemanticMatcher()
+    matcher.model = model
+    matcher.batcher = EmbeddingBatcher(matcher._encode_with_model, max_batch_size=8, max_wait_ms=50)
+
+    similarity, embedding = asyncio.run(matcher.acompare("resume text", "job description"))
+    matcher.close()
+
+    assert model.batches == [["resume text", "job description"]]
+    assert embedding == [11.0, 1.0]
+    assert 0 < similarity <= 1
+    assert matcher.batcher is None
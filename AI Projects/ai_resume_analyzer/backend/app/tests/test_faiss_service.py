@@ -0,0 +1,60 @@
+import numpy as np
+
+from app.services.faiss_service import InMemoryFaissStyleService
+
+
+def clustered_vectors(count: int, dimensions: int = 32, clusters: int = 20, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimensions))
+    return (centers[rng.integers(clusters, size=count)] + 0.3 * rng.normal(size=(count, dimensions))).astype(np.float32)
+
+
+def brute_force(vectors: np.ndarray, ids: list[int], query: np.ndarray, limit: int) -> list[int]:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return [ids[row] for row in np.argsort(-scores)[:limit]]
+
+
+def test_exact_search_matches_brute_force_after_batched_add_and_remove():
+    vectors = clustered_vectors(300)
+    index = InMemoryFaissStyleService(dimensions=32)
+    index.add_many(list(range(300)), vectors)
+    index.remove_many(list(range(0, 300, 3)))
+    index.add(1, vectors[2])
+
+    kept = [item_id for item_id in range(300) if item_id % 3]
+    expected_vectors = np.stack([vectors[2] if item_id == 1 else vectors[item_id] for item_id in kept])
+    query = vectors[10]
+
+    assert len(index) == len(kept)
+    assert [item_id for item_id, _ in index.search(query, 10)] == brute_force(expected_vectors, kept, query, 10)
+
+
+def test_ivf_index_keeps_recall_and_only_scores_probed_lists():
+    vectors = clustered_vectors(4000)
+    index = InMemoryFaissStyleService(dimensions=32, index_type="ivf", nlist=40, nprobe=8)
+    index.add_many(list(range(4000)), vectors)
+    assert index.needs_training and not index.trained
+    index.train()
+
+    assert index.trained and not index.needs_training
+    hits = 0
+    for query in vectors[:50]:
+        approximate = {item_id for item_id, _ in index.search(query, 10)}
+        hits += len(approximate & set(brute_force(vectors, list(range(4000)), query, 10)))
+    assert hits / 500 >= 0.9
+    assert [item_id for item_id, _ in index.search(vectors[0], 10, exact=True)] == brute_force(vectors, list(range(4000)), vectors[0], 10)
+
+
+def test_index_round_trips_through_disk(tmp_path):
+    vectors = clustered_vectors(1500)
+    index = InMemoryFaissStyleService(dimensions=32, index_type="ivf", nlist=16, nprobe=4)
+    index.add_many(list(range(1500)), vectors)
+    index.train()
+    index.save(tmp_path / "index.npz")
+
+    loaded = InMemoryFaissStyleService.load(tmp_path / "index.npz")
+
+    assert len(loaded) == 1500
+    assert loaded.trained
+    assert loaded.search(vectors[7], 5) == index.search(vectors[7], 5)
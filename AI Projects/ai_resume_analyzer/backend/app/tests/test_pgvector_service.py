@@ -0,0 +1,100 @@
+from dataclasses import replace
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.database.session import SessionLocal
+from app.models import Analysis
+from app.services import pgvector_service
+from app.services.faiss_service import InMemoryFaissStyleService
+from app.services.pgvector_service import PgVectorService
+
+
+def store_analysis(db, service: PgVectorService, embedding: np.ndarray) -> int:
+    analysis = Analysis(
+        resume_filename="resume.txt",
+        resume_text="Python FastAPI",
+        job_description="Python backend intern",
+        match_score=70,
+        semantic_similarity=0.5,
+        score_breakdown={},
+        embedding=embedding.tolist(),
+    )
+    db.add(analysis)
+    service.record_change(db)
+    db.commit()
+    service.index_analyses(db, [analysis.id], [embedding.tolist()])
+    return analysis.id
+
+
+def delete_analysis(db, service: PgVectorService, analysis_id: int) -> None:
+    db.delete(db.get(Analysis, analysis_id))
+    service.record_change(db)
+    db.commit()
+    service.remove_analyses(db, [analysis_id])
+
+
+def test_local_index_picks_up_analyses_from_other_workers(monkeypatch):
+    rng = np.random.default_rng(5)
+    dimensions = get_settings().embedding_dimensions
+    vectors = rng.normal(size=(4, dimensions))
+    worker, other_worker = PgVectorService(), PgVectorService()
+    syncs = []
+    original_sync = worker.sync_local_index
+    monkeypatch.setattr(worker, "sync_local_index", lambda db: syncs.append(1) or original_sync(db))
+    with SessionLocal() as db:
+        first = store_analysis(db, worker, vectors[0])
+        second = store_analysis(db, worker, vectors[1])
+        assert [item["id"] for item in worker.find_similar(db, vectors[1].tolist())] == [second, first]
+
+        # This worker's own writes keep its index current without another sync.
+        third = store_analysis(db, worker, vectors[2])
+        assert worker.find_similar(db, vectors[2].tolist(), limit=1)[0]["id"] == third
+        assert len(syncs) == 1
+
+        # Deleting the highest id and inserting again must not reuse the id.
+        delete_analysis(db, other_worker, third)
+        fourth = store_analysis(db, other_worker, vectors[3])
+        assert fourth != third
+        assert worker.find_similar(db, vectors[3].tolist(), limit=1)[0]["id"] == fourth
+        assert third not in worker.local_index
+        assert len(syncs) == 2
+
+
+def test_persisted_index_uses_current_search_settings(tmp_path, monkeypatch):
+    dimensions = get_settings().embedding_dimensions
+    saved = InMemoryFaissStyleService(dimensions, index_type="ivf", nlist=8, nprobe=2)
+    saved.add_many(list(range(1200)), np.random.default_rng(5).normal(size=(1200, dimensions)))
+    saved.train()
+    saved.save(tmp_path / "index.npz")
+    settings = replace(
+        get_settings(),
+        vector_index_type="ivf",
+        vector_index_nlist=4,
+        vector_index_nprobe=3,
+        vector_index_path=str(tmp_path / "index.npz"),
+    )
+    monkeypatch.setattr(pgvector_service, "get_settings", lambda: settings)
+
+    index = PgVectorService().local_index
+
+    assert len(index) == 1200
+    assert (index.nlist, index.nprobe) == (4, 3)
+    assert len(index._centroids) == 4
+
+
+def test_index_maintenance_trains_in_background_and_never_raises(monkeypatch):
+    settings = replace(get_settings(), vector_index_type="ivf", vector_index_nlist=4)
+    monkeypatch.setattr(pgvector_service, "get_settings", lambda: settings)
+    service = PgVectorService()
+    service.local_index.min_train_size = 40
+    vectors = np.random.default_rng(5).normal(size=(40, settings.embedding_dimensions))
+    with SessionLocal() as db:
+        service.index_analyses(db, list(range(1, 41)), vectors.tolist())
+        service.wait_for_training(timeout=10)
+        assert service.local_index.trained
+
+        service.find_similar(db, vectors[0].tolist())
+        service.index_analyses(db, [41], [[0.5, 0.5]])
+        assert 41 not in service.local_index
+        assert service._synced_version is None
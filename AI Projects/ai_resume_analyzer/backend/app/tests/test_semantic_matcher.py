@@ -0,0 +1,55 @@
+import numpy as np
+
+from app.services.embedding_cache import EmbeddingCache
+from app.services.semantic_matcher import SemanticMatcher
+
+
+def test_hash_embedding_is_normalized_float32():
+    matcher = SemanticMatcher()
+
+    embedding = matcher.embed("Python FastAPI python PostgreSQL")
+
+    assert embedding.dtype == np.float32
+    assert embedding.shape == (matcher.settings.embedding_dimensions,)
+    assert abs(float(np.linalg.norm(embedding)) - 1.0) < 1e-5
+    assert not embedding.flags.writeable
+
+
+def test_repeated_texts_skip_embedding(monkeypatch):
+    matcher = SemanticMatcher()
+    encoded: list[str] = []
+    original_encode = matcher._encode
+    monkeypatch.setattr(matcher, "_encode", lambda texts: encoded.extend(texts) or original_encode(texts))
+
+    job_description = "Python backend intern with FastAPI and Docker"
+    first, _ = matcher.compare("Resume one with Python and SQL projects", job_description)
+    matcher.compare("Resume two with FastAPI and Docker projects", job_description)
+    again, _ = matcher.compare("Resume one with Python and SQL projects", job_description)
+
+    assert first == again
+    assert encoded.count(job_description) == 1
+    assert len(encoded) == 3
+    assert matcher.cache.stats()["hits"] == 3
+
+
+def test_embedding_cache_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    for name in ["a", "b"]:
+        cache.set(name, np.zeros(2, dtype=np.float32))
+    cache.get("a")
+    cache.set("c", np.zeros(2, dtype=np.float32))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["entries"] == 2
+
+
+def test_embedding_cache_copies_rows_out_of_batch_matrices():
+    cache = EmbeddingCache(max_entries=2)
+    batch = np.ones((64, 4), dtype=np.float32)
+
+    stored = cache.set("a", batch[0])
+
+    assert stored.base is None
+    assert not stored.flags.writeable
+    assert batch.flags.writeable
@@ -1,3 +1,8 @@
+import json
+from dataclasses import replace
+
+from app.core.config import get_settings
+from app.services import skill_extractor
 from app.services.skill_extractor import SkillExtractor
 
 
@@ -24,3 +29,30 @@ def test_compare_skills_returns_matched_and_missing():
     assert "AWS" in comparison.missing_skills
     assert "Docker" in comparison.missing_skills
 
+
+
+def test_compiled_matcher_keeps_overlapping_and_prefix_aliases():
+    extractor = SkillExtractor(
+        {
+            "FastAPI": ["fast api"],
+            "REST API": ["api development"],
+            "SQL": ["sql"],
+            "SQL Server": ["sql server"],
+            "Go": ["go"],
+            "C++": ["c++"],
+        }
+    )
+
+    skills = extractor.extract_skills("Fast API development on SQL Server, C++ and Google tools.")
+
+    assert skills == ["C++", "FastAPI", "REST API", "SQL", "SQL Server"]
+
+
+def test_skill_taxonomy_loads_from_file(tmp_path, monkeypatch):
+    taxonomy_path = tmp_path / "skills.json"
+    taxonomy_path.write_text(json.dumps({"Terraform": ["terraform", "hcl"]}), encoding="utf-8")
+    monkeypatch.setattr(skill_extractor, "get_settings", lambda: replace(get_settings(), skill_taxonomy_path=str(taxonomy_path)))
+
+    extractor = SkillExtractor()
+
+    assert extractor.extract_skills("Wrote HCL modules; no Python here.") == ["Terraform"]
@@ -0,0 +1,115 @@
+"""Compare the compiled SkillMatcher with the original one-regex-per-alias scan.
+
+Run from ai_resume_analyzer/backend:
+
+    python scripts/benchmark_skill_matcher.py --skills 3000 --texts 200
+
+The synthetic taxonomy mixes multi-word, punctuated, and prefix-sharing
+aliases so both implementations are exercised on the cases where word
+boundaries matter. Every text is checked for identical results.
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.skill_extractor import SKILL_ALIASES  # noqa: E402
+from app.services.skill_matcher import SkillMatcher, load_taxonomy  # noqa: E402
+
+
+SAMPLE_DATA = Path(__file__).resolve().parents[1] / "sample_data"
+WORDS = [
+    "data", "cloud", "stream", "graph", "vector", "edge", "secure", "mobile", "query", "event",
+    "model", "search", "cache", "batch", "signal", "render", "deploy", "test", "trace", "schema",
+]
+
+
+def per_alias_regex(taxonomy: dict[str, list[str]], text: str) -> set[str]:
+    """The original SkillExtractor.extract_skills loop."""
+    normalized_text = text.lower()
+    found_skills: set[str] = set()
+    for canonical_skill, aliases in taxonomy.items():
+        for alias in aliases:
+            pattern = r"(?<![a-z0-9])" + re.escape(alias.lower()) + r"(?![a-z0-9])"
+            if re.search(pattern, normalized_text):
+                found_skills.add(canonical_skill)
+                break
+    return found_skills
+
+
+def synthetic_taxonomy(size: int, seed: int) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    taxonomy = dict(SKILL_ALIASES)
+    for index in range(size):
+        first, second = rng.sample(WORDS, 2)
+        aliases = [f"{first} {second} {index}", f"{first}-{second}{index}", f"{second}{index}"]
+        if index % 7 == 0:
+            aliases.append(f"{first} {second}")
+        taxonomy[f"Skill {index}"] = aliases
+    return taxonomy
+
+
+def synthetic_texts(taxonomy: dict[str, list[str]], count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    base = " ".join(path.read_text(encoding="utf-8") for path in sorted(SAMPLE_DATA.glob("*.txt")))
+    aliases = [alias for values in taxonomy.values() for alias in values]
+    texts = []
+    for _ in range(count):
+        extra = [rng.choice(aliases) if rng.random() < 0.3 else rng.choice(WORDS) for _ in range(200)]
+        texts.append(base + " " + " ".join(extra))
+    return texts
+
+
+def timed(function, texts: list[str]) -> tuple[float, list[set[str]]]:
+    start = time.perf_counter()
+    results = [function(text) for text in texts]
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=3000, help="Synthetic skills added to the built-in taxonomy.")
+    parser.add_argument("--texts", type=int, default=200, help="Resumes/job descriptions to scan.")
+    parser.add_argument("--taxonomy", type=Path, help="Benchmark a taxonomy JSON file instead of a synthetic one.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    taxonomy = load_taxonomy(args.taxonomy) if args.taxonomy else synthetic_taxonomy(args.skills, args.seed)
+    texts = synthetic_texts(taxonomy, args.texts, args.seed)
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(taxonomy)
+    build_seconds = time.perf_counter() - start
+
+    legacy_seconds, legacy = timed(lambda text: per_alias_regex(taxonomy, text), texts)
+    compiled_seconds, compiled = timed(matcher.find, texts)
+    mismatches = sum(left != right for left, right in zip(legacy, compiled))
+
+    print(
+        json.dumps(
+            {
+                "skills": len(taxonomy),
+                "aliases": sum(len(aliases) for aliases in taxonomy.values()),
+                "texts": len(texts),
+                "average_text_chars": round(sum(map(len, texts)) / len(texts)),
+                "matcher_build_ms": round(build_seconds * 1000, 1),
+                "per_alias_regex_ms_per_text": round(legacy_seconds / len(texts) * 1000, 3),
+                "compiled_ms_per_text": round(compiled_seconds / len(texts) * 1000, 3),
+                "speedup": round(legacy_seconds / compiled_seconds, 1) if compiled_seconds else None,
+                "mismatched_texts": mismatches,
+            },
+            indent=2,
+        )
+    )
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Measure latency and recall of the local similar-analysis index.
+
+Run from ai_resume_analyzer/backend:
+
+    python scripts/benchmark_vector_index.py --count 50000 --nprobe 4,8,16
+
+Vectors are drawn around random cluster centers so inverted lists have
+structure to exploit, like real resume embeddings. Recall@k is measured
+against the exact search over the same index. The original list-of-lists
+search is timed on a few queries for reference.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.faiss_service import InMemoryFaissStyleService  # noqa: E402
+
+
+def clustered_vectors(centers: np.ndarray, count: int, noise: float, rng: np.random.Generator) -> np.ndarray:
+    offsets = rng.normal(scale=noise, size=(count, centers.shape[1]))
+    return (centers[rng.integers(len(centers), size=count)] + offsets).astype(np.float32)
+
+
+def list_search(vectors: list[list[float]], query: list[float], limit: int) -> list[tuple[int, float]]:
+    """The original InMemoryFaissStyleService.search loop."""
+    query_vector = np.array(query, dtype=float)
+    results = []
+    for item_id, embedding in enumerate(vectors):
+        vector = np.array(embedding, dtype=float)
+        denominator = float(np.linalg.norm(query_vector) * np.linalg.norm(vector))
+        similarity = 0.0 if denominator == 0 else float(np.dot(query_vector, vector) / denominator)
+        results.append((item_id, round(similarity, 4)))
+    return sorted(results, key=lambda item: item[1], reverse=True)[:limit]
+
+
+def latency(search, queries: np.ndarray) -> tuple[dict[str, float], list[list[int]]]:
+    samples, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        found = search(query)
+        samples.append(time.perf_counter() - start)
+        results.append([item_id for item_id, _ in found])
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+    }, results
+
+
+def recall(approximate: list[list[int]], exact: list[list[int]]) -> float:
+    hits = sum(len(set(found) & set(truth)) for found, truth in zip(approximate, exact))
+    return round(hits / sum(len(truth) for truth in exact), 4)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000, help="Vectors in the index.")
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=20)
+    parser.add_argument("--noise", type=float, default=3.0, help="Spread around each center; higher is harder.")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10, help="k for top-k and recall@k.")
+    parser.add_argument("--nlist", type=int, default=0, help="IVF lists; 0 means sqrt(count).")
+    parser.add_argument("--nprobe", default="4,8,16,32", help="Comma-separated nprobe values to compare.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    centers = rng.normal(size=(args.clusters, args.dimensions))
+    vectors = clustered_vectors(centers, args.count, args.noise, rng)
+    queries = clustered_vectors(centers, args.queries, args.noise, rng)
+    ids = list(range(args.count))
+    report: dict = {"count": args.count, "dimensions": args.dimensions, "queries": args.queries, "k": args.limit}
+
+    index = InMemoryFaissStyleService(args.dimensions, index_type="ivf", nlist=args.nlist)
+    start = time.perf_counter()
+    index.add_many(ids, vectors)
+    report["add_many_seconds"] = round(time.perf_counter() - start, 3)
+
+    report["exact"], exact = latency(lambda query: index.search(query, args.limit, exact=True), queries)
+
+    start = time.perf_counter()
+    index.train()
+    report["train_seconds"] = round(time.perf_counter() - start, 3)
+    report["nlist"] = len(index._centroids)
+
+    report["ivf"] = {}
+    for nprobe in (int(value) for value in args.nprobe.split(",")):
+        index.nprobe = nprobe
+        timings, found = latency(lambda query: index.search(query, args.limit), queries)
+        report["ivf"][nprobe] = {**timings, "recall": recall(found, exact)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "index.npz"
+        start = time.perf_counter()
+        index.save(path)
+        report["save_seconds"] = round(time.perf_counter() - start, 3)
+        start = time.perf_counter()
+        InMemoryFaissStyleService.load(path)
+        report["load_seconds"] = round(time.perf_counter() - start, 3)
+        report["file_mb"] = round(path.stat().st_size / 1024 / 1024, 1)
+
+    as_lists = vectors.tolist()
+    report["list_search"], _ = latency(lambda query: list_search(as_lists, query.tolist(), args.limit), queries[:5])
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()